@@ -18,7 +18,10 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-config.set_main_option("sqlalchemy.url", DATABASE_URL)
+# Callers such as the query plan tests can point the migrations at another database
+config.set_main_option(
+    "sqlalchemy.url", config.attributes.get("sqlalchemy.url", DATABASE_URL)
+)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
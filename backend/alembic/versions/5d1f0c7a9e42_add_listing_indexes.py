@@ -0,0 +1,56 @@
+"""Add indexes for the posts and market events listing queries
+
+Revision ID: 5d1f0c7a9e42
+Revises: b9e455ba8931
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1f0c7a9e42"
+down_revision: Union[str, None] = "b9e455ba8931"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_posts_user_id_updated_at", "posts", ["user_id", sa.text("updated_at DESC")]),
+    ("ix_posts_status_updated_at", "posts", ["status", sa.text("updated_at DESC")]),
+    ("ix_posts_market_event_id_user_id", "posts", ["market_event_id", "user_id"]),
+    (
+        "ix_market_events_processing_status_updated_at",
+        "market_events",
+        ["processing_status", sa.text("updated_at DESC")],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so that existing tables stay writable while indexing
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
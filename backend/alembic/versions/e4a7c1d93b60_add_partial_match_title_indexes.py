@@ -0,0 +1,56 @@
+"""Add the trigram title indexes serving partial-match search
+
+Revision ID: e4a7c1d93b60
+Revises: 8c3e6b2f1a57
+Create Date: 2026-10-16 12:00:00.000000
+
+Only applied when SEARCH_PARTIAL_MATCH_ENABLED is set, as it needs the pg_trgm
+extension. To enable partial matching on a database that is already at this revision,
+set it and run `alembic downgrade 8c3e6b2f1a57 && alembic upgrade head`.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from config.settings import app_settings
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a7c1d93b60"
+down_revision: Union[str, None] = "8c3e6b2f1a57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["posts", "market_events"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not app_settings.SEARCH_PARTIAL_MATCH_ENABLED:
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table in TABLES:
+            op.create_index(
+                f"ix_{table}_title_trgm",
+                table,
+                ["title"],
+                postgresql_using="gin",
+                postgresql_ops={"title": "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropped even if partial matching has been disabled since; pg_trgm stays installed
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(
+                f"ix_{table}_title_trgm",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -1,15 +1,19 @@
 # Python & Third Party Imports
+from contextlib import asynccontextmanager, contextmanager
 from threading import Lock
+from typing import AsyncIterator, Iterator
 
 from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
 
 from config.settings import app_settings
 
 Base = declarative_base()
 
 DATABASE_URL = f"postgresql://{app_settings.DB_USERNAME}:{app_settings.DB_PASSWORD}@{app_settings.DB_HOST}:{app_settings.DB_PORT}/{app_settings.DB_NAME}"
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{app_settings.DB_USERNAME}:{app_settings.DB_PASSWORD}@{app_settings.DB_HOST}:{app_settings.DB_PORT}/{app_settings.DB_NAME}"
 
 
 class DatabaseService:
@@ -24,20 +28,41 @@ class DatabaseService:
                     cls._instance = super(DatabaseService, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, database_url):
+    def __init__(self, database_url, async_database_url):
         if not hasattr(self, "_initialized"):
             self._initialized = True
             self.database_url = database_url
+            self.async_database_url = async_database_url
+
+            pool_options = dict(
+                pool_pre_ping=True,
+                pool_size=app_settings.DB_POOL_SIZE,
+                max_overflow=app_settings.DB_MAX_OVERFLOW,
+                pool_timeout=app_settings.DB_POOL_TIMEOUT_SECONDS,
+                pool_recycle=app_settings.DB_POOL_RECYCLE_SECONDS,
+            )
 
             self.engine = create_engine(
                 self.database_url,
                 echo=False,
-                pool_pre_ping=True,
+                **pool_options,
             )
 
             self.session_factory = sessionmaker(bind=self.engine)
             self.Session = scoped_session(self.session_factory)
 
+            # The FastAPI routes use the asyncpg engine so queries never block the event
+            # loop; Celery tasks keep using the sync engine above.
+            self.async_engine = create_async_engine(
+                self.async_database_url,
+                echo=False,
+                **pool_options,
+            )
+            self.async_session_factory = async_sessionmaker(
+                bind=self.async_engine,
+                expire_on_commit=False,
+            )
+
     def get_session(self):
         """Get a new session."""
         try:
@@ -46,10 +71,67 @@ class DatabaseService:
             print(f"Error while getting session: {e}")
             return None
 
+    def get_async_session(self) -> AsyncSession:
+        """Get a new async session, to be used as an async context manager."""
+        return self.async_session_factory()
+
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Open a session for one unit of work, such as a Celery task.
+
+        The session is rolled back if the work fails and is always closed, returning its
+        connection to the pool and discarding its identity map.
+        """
+        session = self.session_factory()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @asynccontextmanager
+    async def async_session_scope(
+        self, session: AsyncSession | None = None
+    ) -> AsyncIterator[AsyncSession]:
+        """
+        Use the given request-scoped async session, or open one that is closed on exit.
+        """
+        if session is not None:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+            return
+
+        async with self.get_async_session() as new_session:
+            yield new_session
+
     def close_connection(self):
         """Close the database connection."""
         self.Session.remove()
         self.engine.dispose()
 
+    async def close_async_connection(self):
+        """Close the async database connections."""
+        await self.async_engine.dispose()
+
+
+db_service = DatabaseService(
+    database_url=DATABASE_URL,
+    async_database_url=ASYNC_DATABASE_URL,
+)
+
+
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency providing one async session per request.
 
-db_service = DatabaseService(database_url=DATABASE_URL)
+    The session is closed once the response has been produced, so its connection goes back
+    to the pool and its identity map does not outlive the request.
+    """
+    async with db_service.get_async_session() as session:
+        yield session
@@ -7,3 +7,10 @@ GENERATE_DEEP_RESEARCHED_CONTENT_SYSTEM_PROMPT = ""
 GENERATE_SUMMARIZED_CONTENT_FROM_DEEP_RESEARCH_SYSTEM_PROMPT = ""
 
 GET_SENTIMENTAL_ANALYSIS_SYSTEM_PROMPT = ""
+
+GET_MARKET_EVENT_ANALYTICS_SYSTEM_PROMPT = """You are a financial news analyst. For the given article, determine:
+1. "sentimental_analysis": the market sentiment of the article, one of "POSITIVE", "NEGATIVE" or "NEUTRAL".
+2. "priority_flag": how urgent the article is for market participants, one of "HIGH", "MEDIUM" or "LOW".
+3. "compliance_check": a short statement of any compliance concerns for publishing content based on the article.
+
+Return ONLY a JSON object with exactly these three keys."""
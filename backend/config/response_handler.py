@@ -58,6 +58,7 @@ class ResponseHandler:
                     "total_records": data.total_records,
                     "has_next": data.has_next,
                     "has_previous": data.has_previous,
+                    "next_cursor": data.next_cursor,
                     "data": data.data,
                 }
             ),
@@ -24,6 +24,11 @@ class AppSettings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_HOST: str = ""
     DB_PORT: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    SEARCH_PARTIAL_MATCH_ENABLED: bool = False
 
     # Auth Configurations
     JWT_SECRET_KEY: str = ""
@@ -33,14 +38,39 @@ class AppSettings(BaseSettings):
 
     # OpenAI Configurations
     OPENAI_API_KEY: str = ""
+    OPENAI_MAX_CONNECTIONS: int = 20
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    OPENAI_MAX_CONCURRENT_REQUESTS: int = 10
+    OPENAI_REQUEST_TIMEOUT_SECONDS: float = 60.0
+    OPENAI_REQUESTS_PER_MINUTE: int = 500
+    OPENAI_TOKENS_PER_MINUTE: int = 200_000
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_DEFAULT_TTL_SECONDS: int = 60 * 60 * 24
 
     # ThirdParty News API Configurations
-    API_CALL_INTERVAL_DURATION_IN_SECONDS: int = 5
+    ALPHAVANTAGE_FETCH_INTERVAL_SECONDS: int = 900
     ALPHAVANTAGE_API_KEY: str = ""
     ALPHAVANTAGE_API_BASE_URL: str = ""
     NEWS_API_KEY: str = ""
     NEWS_API_BASE_URL: str = ""
     FETCH_STATIC_DATA: bool = True
+    NEWS_FETCHER_TIMEOUT_SECONDS: float = 15.0
+    NEWS_FETCHER_MAX_CONNECTIONS: int = 10
+    NEWS_FETCHER_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    EVENT_REGISTRY_MAX_CONCURRENT_REQUESTS: int = 4
+    ALPHAVANTAGE_REQUESTS_PER_MINUTE: int = 5
+    EVENT_REGISTRY_REQUESTS_PER_MINUTE: int = 60
+    ARTICLE_DEDUP_RETENTION_SECONDS: int = 60 * 60 * 24 * 7
+    FETCH_WATERMARK_LOOKBACK_SECONDS: int = 60 * 15
+    FINANCIAL_CLASSIFICATION_BATCH_SIZE: int = 20
+    DEEP_RESEARCH_STREAMING_ENABLED: bool = True
+    DEEP_RESEARCH_STREAM_FLUSH_INTERVAL_SECONDS: float = 0.1
+    EVENT_REGISTRY_FETCH_INTERVAL_SECONDS: int = 60 * 60 * 24
+    FETCH_SCHEDULER_ENABLED: bool = True
+    FETCH_SCHEDULER_HOT_ARTICLES: int = 20
+    FETCH_SCHEDULER_QUEUE_SATURATION: int = 200
+    FETCH_SCHEDULER_RATE_LIMIT_MIN_REMAINING: int = 5
 
     # Sendgrid Configurations
     SENDGRID_API_KEY: str = ""
@@ -54,6 +84,22 @@ class AppSettings(BaseSettings):
     # Redis Configurations
     REDIS_BROKER_URL: str = ""
     REDIS_HOST: str = ""
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 0.5
+    REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS: float = 0.5
+    REDIS_PUBLISHER_MAX_CONNECTIONS: int = 10
+    REDIS_LISTENER_RECONNECT_MIN_SECONDS: float = 1.0
+    REDIS_LISTENER_RECONNECT_MAX_SECONDS: float = 30.0
+
+    # Rate Limit Configurations
+    RATE_LIMIT_MAX_RETRIES: int = 5
+    RATE_LIMIT_BACKOFF_BASE_SECONDS: float = 1.0
+    RATE_LIMIT_BACKOFF_MAX_SECONDS: float = 60.0
+
+    # Websocket Configurations
+    WEBSOCKET_SEND_TIMEOUT_SECONDS: float = 1.0
+    WEBSOCKET_MAX_CONSECUTIVE_SLOW_SENDS: int = 3
+    WEBSOCKET_SEND_QUEUE_SIZE: int = 100
+    WEBSOCKET_QUEUE_OVERFLOW_POLICY: str = "coalesce"  # drop_oldest | coalesce
 
     # Dynamically set the environment file
     model_config = SettingsConfigDict(
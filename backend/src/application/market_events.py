@@ -1,7 +1,9 @@
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.response_handler import ResponseHandler
+from src.application.utils import build_listing_page, resolve_listing_cursor
 from src.domain.market_events.models import MarketEvent
 from src.domain.market_events.services import MarketEventDomainServices
 from src.infrastructure.security import get_current_user_from_token
@@ -10,18 +12,23 @@ from src.schema.market_events import MarketEventDataModelSchema, MarketEventResp
 
 
 class MarketEventAppServices:
-    def __init__(self):
+    def __init__(self, db_session: AsyncSession | None = None):
         """
         Constructor for MarketEventAppServices class.
 
         Initializes a new instance of MarketEventAppServices, which contains
         the application logic for MarketEvents.
 
+        `Args:`
+        - db_session (AsyncSession | None): Session of the current request.
+
         `Attributes:`
         - market_event_domain_services (MarketEventDomainServices): The domain service
           to use for interacting with MarketEvents.
         """
-        self.market_event_domain_services = MarketEventDomainServices()
+        self.market_event_domain_services = MarketEventDomainServices(
+            async_db_session=db_session
+        )
 
     async def subscribe(self, websocket: WebSocket):
         """
@@ -64,16 +71,34 @@ class MarketEventAppServices:
         search_term: str = "",
         page: int = 1,
         limit: int = 10,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> MarketEventResponseSchema | JSONResponse:
         """
         Method to get a list of market_events with pagination.
+
+        Pages are selected by `page`, or by the `cursor` returned as `next_cursor`
+        with the previous page, which does not slow down on deep pages.
         """
         try:
-            offset = (page - 1) * limit
-            results, count = self.market_event_domain_services.get_market_events(
-                search_term=search_term,
-                offset=offset,
+            after = resolve_listing_cursor(cursor, search_term=search_term)
+            offset = 0 if after else (page - 1) * limit
+            results, count = (
+                await self.market_event_domain_services.get_market_events_async(
+                    search_term=search_term,
+                    offset=offset,
+                    limit=limit + 1,
+                    after=after,
+                    include_total=include_total,
+                )
+            )
+            results, pagination = build_listing_page(
+                results,
+                page=page,
                 limit=limit,
+                total=count,
+                after=after,
+                search_term=search_term,
             )
 
             # Unpack (market_event_obj, post_generated) and map to schema
@@ -85,19 +110,7 @@ class MarketEventAppServices:
                 for market_event, post_generated in results
             ]
 
-            has_next = offset + limit < count
-            has_previous = page > 1
-            pages = (count + limit - 1) // limit
-
-            return MarketEventResponseSchema(
-                page=page,
-                limit=limit,
-                total_pages=pages,
-                total_records=count,
-                has_next=has_next,
-                has_previous=has_previous,
-                data=market_event_data,
-            )
+            return MarketEventResponseSchema(**pagination, data=market_event_data)
         except Exception as e:
             return ResponseHandler.error(exception=e)
 
@@ -114,8 +127,10 @@ class MarketEventAppServices:
             MarketEvent | None: A MarketEvent object if found, else None.
         """
         try:
-            market_event = self.market_event_domain_services.get_market_event_by_id(
-                id=id
+            market_event = (
+                await self.market_event_domain_services.get_market_event_by_id_async(
+                    id=id
+                )
             )
             return market_event
         except Exception as e:
@@ -1,5 +1,8 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from config.response_handler import ResponseHandler
 from src.application.market_events import MarketEventAppServices
+from src.application.utils import build_listing_page, resolve_listing_cursor
 from src.domain.enums import PostStatus
 from src.domain.posts.services import PostDataClass, PostDomainServices, PostFactory
 from src.exceptions.market_events import MarketEventNotFoundException
@@ -29,12 +32,15 @@ class PostAppServices:
     PostAppServices class for handling post-related operations.
     """
 
-    def __init__(self):
+    def __init__(self, db_session: AsyncSession | None = None):
         """
         Constructor for PostAppServices class.
+
+        Args:
+            db_session (AsyncSession | None): Session of the current request.
         """
-        self.post_domain_services = PostDomainServices()
-        self.market_event_app_services = MarketEventAppServices()
+        self.post_domain_services = PostDomainServices(async_db_session=db_session)
+        self.market_event_app_services = MarketEventAppServices(db_session=db_session)
         self.openai_services = OpenAIServices()
 
     async def get_posts_listings(
@@ -43,17 +49,30 @@ class PostAppServices:
         query_params: GetPostsListingsQueryParams,
     ):
         try:
-            offset = (query_params.page - 1) * query_params.limit
+            after = resolve_listing_cursor(
+                query_params.cursor, search_term=query_params.search_term
+            )
+            offset = 0 if after else (query_params.page - 1) * query_params.limit
 
-            results, count = self.post_domain_services.get_posts_by_user_id(
+            results, count = await self.post_domain_services.get_posts_by_user_id_async(
                 offset=offset,
-                limit=query_params.limit,
+                limit=query_params.limit + 1,
                 search_term=query_params.search_term,
                 status=query_params.status,
                 source=query_params.source,
                 start_date=query_params.start_date,
                 end_date=query_params.end_date,
                 user_id=current_user["user_id"],
+                after=after,
+                include_total=query_params.include_total,
+            )
+            results, pagination = build_listing_page(
+                results,
+                page=query_params.page,
+                limit=query_params.limit,
+                total=count,
+                after=after,
+                search_term=query_params.search_term,
             )
 
             post_data = [
@@ -61,19 +80,7 @@ class PostAppServices:
                 for post, source in results
             ]
 
-            has_next = offset + query_params.limit < count
-            has_previous = query_params.page > 1
-            pages = (count + query_params.limit - 1) // query_params.limit
-
-            return PostDataResponseSchema(
-                page=query_params.page,
-                limit=query_params.limit,
-                total_pages=pages,
-                total_records=count,
-                has_next=has_next,
-                has_previous=has_previous,
-                data=post_data,
-            )
+            return PostDataResponseSchema(**pagination, data=post_data)
 
         except Exception as e:
             return ResponseHandler.error(exception=e)
@@ -83,7 +90,7 @@ class PostAppServices:
         Method to get a single post by ID, including MarketEvent source.
         """
         try:
-            result = self.post_domain_services.get_post_by_id_with_market_event_source(
+            result = await self.post_domain_services.get_post_by_id_with_market_event_source_async(
                 post_id=post_id
             )
 
@@ -105,7 +112,7 @@ class PostAppServices:
         Method to get a single post by ID, including MarketEvent source.
         """
         try:
-            result = self.post_domain_services.get_post_by_id_with_market_event_source(
+            result = await self.post_domain_services.get_post_by_id_with_market_event_source_async(
                 post_id=post_id
             )
 
@@ -133,8 +140,10 @@ class PostAppServices:
             dict: A dictionary containing the counts of total posts, draft posts, published posts, and customized posts.
         """
         try:
-            statistics_data = self.post_domain_services.get_post_counts_by_user_id(
-                user_id=current_user["user_id"]
+            statistics_data = (
+                await self.post_domain_services.get_post_counts_by_user_id_async(
+                    user_id=current_user["user_id"]
+                )
             )
             return statistics_data
         except Exception as e:
@@ -153,7 +162,9 @@ class PostAppServices:
         try:
             post_data = PostFactory.build_entity_with_id(data=post_data)
 
-            post_data = self.post_domain_services.create_post(post=post_data)
+            post_data = await self.post_domain_services.create_post_async(
+                post=post_data
+            )
             return post_data
         except Exception as e:
             return ResponseHandler.error(exception=e)
@@ -174,11 +185,9 @@ class PostAppServices:
             dict: Created post data.
         """
         try:
-            existing_post_from_market_event_id = (
-                self.post_domain_services.get_post_by_user_id_and_market_event_id(
-                    user_id=current_user["user_id"],
-                    market_event_id=market_event_id,
-                )
+            existing_post_from_market_event_id = await self.post_domain_services.get_post_by_user_id_and_market_event_id_async(
+                user_id=current_user["user_id"],
+                market_event_id=market_event_id,
             )
 
             if not existing_post_from_market_event_id:
@@ -234,7 +243,9 @@ class PostAppServices:
         current_user: dict,
     ):
         try:
-            return self.post_domain_services.approve_post_by_id(post_id=payload.post_id)
+            return await self.post_domain_services.approve_post_by_id_async(
+                post_id=payload.post_id
+            )
         except Exception as e:
             return ResponseHandler.error(exception=e)
 
@@ -244,8 +255,8 @@ class PostAppServices:
         current_user: dict,
     ):
         try:
-            return self.post_domain_services.publish_posts_by_ids(
-                post_ids=payload.post_ids
+            return await self.post_domain_services.publish_posts_by_ids_async(
+                post_ids=payload.post_ids, user_id=current_user["user_id"]
             )
         except Exception as e:
             return ResponseHandler.error(exception=e)
@@ -273,14 +284,16 @@ class PostAppServices:
         """
 
         try:
-            post = self.post_domain_services.get_post_by_id(post_id)
+            post = await self.post_domain_services.get_post_by_id_async(post_id)
             if not post:
                 raise PostNotFoundException()
 
             if str(post.user_id) != str(current_user["user_id"]):
                 raise PostNotAuthorizedException()
 
-            post = self.post_domain_services.update_post(post=post, post_data=post_data)
+            post = await self.post_domain_services.update_post_async(
+                post=post, post_data=post_data
+            )
             return post
         except Exception as e:
             return ResponseHandler.error(exception=e)
@@ -303,22 +316,24 @@ class PostAppServices:
             dict: Updated post data.
         """
         try:
-            post = self.post_domain_services.get_post_by_id(post_id=post_id)
+            post = await self.post_domain_services.get_post_by_id_async(post_id=post_id)
             if not post:
                 raise PostNotFoundException()
 
             if str(post.user_id) != str(current_user["user_id"]):
                 raise PostNotAuthorizedException()
 
-            updated_content = self.openai_services.get_chat_completion(
+            updated_content = await self.openai_services.get_chat_completion_async(
                 user_prompt=PromptEnum.REVISING_FINANCIAL_CONTENT_WITH_TONE_CONTROL_USER_PROMPT.value.format(
                     financial_content=post.description,
                     custom_instructions=payload.prompt,
                     tone_style=payload.content_tone.value,
-                )
+                ),
+                # Asking for a rewrite again is expected to produce a new answer
+                cache_ttl=0,
             )
             post_updated_data = UpdatePostSchema(description=updated_content)
-            updated_post = self.post_domain_services.update_post(
+            updated_post = await self.post_domain_services.update_post_async(
                 post=post, post_data=post_updated_data
             )
             return updated_post
@@ -337,6 +352,8 @@ class PostAppServices:
                 - search_term (str): The search term to filter posts by title or description.
                 - page (int): The page number for pagination.
                 - limit (int): The number of items per page for pagination.
+                - cursor (Optional[str]): The `next_cursor` of the previous page.
+                - include_total (bool): Whether to count the total records.
                 - source (Optional[MarketEventSource]): The market event source to filter by.
                 - start_date (Optional[date]): The start date to filter by.
                 - end_date (Optional[date]): The end date to filter by.
@@ -345,15 +362,28 @@ class PostAppServices:
             PostDataResponseSchema: The response schema containing the list of published posts.
         """
         try:
-            offset = (query_params.page - 1) * query_params.limit
+            after = resolve_listing_cursor(
+                query_params.cursor, search_term=query_params.search_term
+            )
+            offset = 0 if after else (query_params.page - 1) * query_params.limit
 
-            results, count = self.post_domain_services.get_published_posts(
+            results, count = await self.post_domain_services.get_published_posts_async(
                 offset=offset,
-                limit=query_params.limit,
+                limit=query_params.limit + 1,
                 search_term=query_params.search_term,
                 source=query_params.source,
                 start_date=query_params.start_date,
                 end_date=query_params.end_date,
+                after=after,
+                include_total=query_params.include_total,
+            )
+            results, pagination = build_listing_page(
+                results,
+                page=query_params.page,
+                limit=query_params.limit,
+                total=count,
+                after=after,
+                search_term=query_params.search_term,
             )
 
             post_data = [
@@ -361,19 +391,7 @@ class PostAppServices:
                 for post, source in results
             ]
 
-            has_next = offset + query_params.limit < count
-            has_previous = query_params.page > 1
-            pages = (count + query_params.limit - 1) // query_params.limit
-
-            return PostDataResponseSchema(
-                page=query_params.page,
-                limit=query_params.limit,
-                total_pages=pages,
-                total_records=count,
-                has_next=has_next,
-                has_previous=has_previous,
-                data=post_data,
-            )
+            return PostDataResponseSchema(**pagination, data=post_data)
 
         except Exception as e:
             return ResponseHandler.error(exception=e)
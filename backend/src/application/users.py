@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.response_handler import ResponseHandler
 from src.domain.users.services import UserDataClass, UserDomainServices
@@ -27,11 +28,14 @@ class UserAppServices:
     Class to handle user related operations.
     """
 
-    def __init__(self):
+    def __init__(self, db_session: AsyncSession | None = None):
         """
         Constructor for UserAppServices class.
+
+        Args:
+            db_session (AsyncSession | None): Session of the current request.
         """
-        self.user_domain_services = UserDomainServices()
+        self.user_domain_services = UserDomainServices(async_db_session=db_session)
         self.email_service = EmailService()
 
     async def create_new_user(self, data: SignupUserRequestSchema):
@@ -48,8 +52,10 @@ class UserAppServices:
             UserAlreadyExistsException: If the user with the given email already exists.
         """
         try:
-            existing_user_by_email = self.user_domain_services.get_user_by_email(
-                email=data.email
+            existing_user_by_email = (
+                await self.user_domain_services.get_user_by_email_async(
+                    email=data.email
+                )
             )
             if existing_user_by_email:
                 raise UserAlreadyExistsException(message="Email already exists")
@@ -66,7 +72,7 @@ class UserAppServices:
             user = self.user_domain_services.get_user_factory().build_entity_with_id(
                 data=user_dataclass
             )
-            user = self.user_domain_services.create_user(user=user)
+            user = await self.user_domain_services.create_user_async(user=user)
 
             # Generate verification token
             verification_token = token_services.generate_verification_token(
@@ -113,7 +119,7 @@ class UserAppServices:
                 raise AuthenticationException(message="Invalid verification token")
 
             user_id = token_payload["sub"]
-            user = self.user_domain_services.get_user_by_id(user_id=user_id)
+            user = await self.user_domain_services.get_user_by_id_async(user_id=user_id)
 
             if not user:
                 raise UserNotFoundException()
@@ -125,7 +131,7 @@ class UserAppServices:
                 )
 
             # Update user verification status
-            self.user_domain_services.update_user_by_id(
+            await self.user_domain_services.update_user_by_id_async(
                 user_id=user.id,
                 data=UpdateUserDomainSchema(is_verified=True),
             )
@@ -154,7 +160,9 @@ class UserAppServices:
                                     or unverified email.
         """
         try:
-            user = self.user_domain_services.get_user_by_email(email=data.email)
+            user = await self.user_domain_services.get_user_by_email_async(
+                email=data.email
+            )
 
             if not user or not verify_password(data.password, user.password):
                 raise AuthenticationException()
@@ -194,7 +202,7 @@ class UserAppServices:
             AuthenticationException: If password reset process fails.
         """
         try:
-            user = self.user_domain_services.get_user_by_email(email=email)
+            user = await self.user_domain_services.get_user_by_email_async(email=email)
 
             if not user:
                 # Return success to prevent user enumeration
@@ -237,14 +245,14 @@ class UserAppServices:
                 raise AuthenticationException(message="Invalid or expired reset token")
 
             # Verify user exists
-            user = self.user_domain_services.get_user_by_id(user_id)
+            user = await self.user_domain_services.get_user_by_id_async(user_id)
             if not user:
                 raise UserNotFoundException()
 
             # Hash new password and update
             hashed_password = hash_password(data.new_password)
 
-            self.user_domain_services.update_user_by_id(
+            await self.user_domain_services.update_user_by_id_async(
                 user_id=user_id,
                 data=UpdateUserDomainSchema(password=hashed_password),
             )
@@ -273,7 +281,7 @@ class UserAppServices:
             UserNotFoundException: If user with given ID does not exist.
         """
         try:
-            user = self.user_domain_services.get_user_by_id(user_id)
+            user = await self.user_domain_services.get_user_by_id_async(user_id)
 
             if not user:
                 raise UserNotFoundException()
@@ -286,7 +294,7 @@ class UserAppServices:
 
             # Hash new password and update
             hashed_password = hash_password(new_password)
-            self.user_domain_services.update_user_by_id(
+            await self.user_domain_services.update_user_by_id_async(
                 user_id=user_id,
                 data=UpdateUserDomainSchema(password=hashed_password),
             )
@@ -310,7 +318,7 @@ class UserAppServices:
         """
 
         try:
-            user = self.user_domain_services.get_user_by_id(user_id)
+            user = await self.user_domain_services.get_user_by_id_async(user_id)
             return UserResponseSchema(
                 id=user.id,
                 username=user.username,
@@ -341,11 +349,13 @@ class UserAppServices:
         """
         try:
             # check user exist
-            if not self.user_domain_services.get_user_by_id(user_id=user_id):
+            if not await self.user_domain_services.get_user_by_id_async(
+                user_id=user_id
+            ):
                 raise UserNotFoundException()
 
             # update user
-            user = self.user_domain_services.update_user_by_id(
+            user = await self.user_domain_services.update_user_by_id_async(
                 user_id=user_id,
                 data=UpdateUserDomainSchema(username=updated_user_data.username),
             )
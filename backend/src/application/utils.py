@@ -0,0 +1,79 @@
+from typing import Any, Sequence
+
+from src.exceptions.pagination import InvalidCursorException
+from src.schema.messages_enums import GeneralEnums
+from src.schema.utils import ListingCursorDTO
+
+
+def resolve_listing_cursor(
+    cursor: str | None, search_term: str = ""
+) -> ListingCursorDTO | None:
+    """
+    Decodes the cursor of a listing request.
+
+    Search results are ordered by rank rather than by (updated_at, id), so they can only
+    be paginated by page.
+
+    Args:
+        cursor (str | None): The `next_cursor` returned with the previous page.
+        search_term (str): The search term of the request.
+
+    Returns:
+        ListingCursorDTO | None: The decoded cursor, or None in page mode.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed or combined with a search.
+    """
+    if not cursor:
+        return None
+    if search_term:
+        raise InvalidCursorException(message=GeneralEnums.CURSOR_WITH_SEARCH.value)
+    try:
+        return ListingCursorDTO.decode(cursor)
+    except ValueError:
+        raise InvalidCursorException()
+
+
+def build_listing_page(
+    rows: Sequence[Any],
+    page: int,
+    limit: int,
+    total: int | None,
+    after: ListingCursorDTO | None = None,
+    search_term: str = "",
+) -> tuple[list, dict]:
+    """
+    Trims a listing fetched with one extra row and builds its pagination fields.
+
+    The extra row tells whether there is a next page without counting. Rows are
+    `(model, ...)` tuples whose model has `updated_at` and `id`.
+
+    Args:
+        rows (Sequence[Any]): Up to `limit + 1` rows.
+        page (int): The requested page, ignored in cursor mode.
+        limit (int): The page size.
+        total (int | None): The total count, if it was computed.
+        after (ListingCursorDTO | None): The cursor the rows were fetched after.
+        search_term (str): The search term of the request.
+
+    Returns:
+        tuple[list, dict]: The rows of the page and the pagination fields of the
+        listing response.
+    """
+    has_next = len(rows) > limit
+    rows = list(rows[:limit])
+
+    next_cursor = None
+    if has_next and not search_term:
+        last = rows[-1][0]
+        next_cursor = ListingCursorDTO(updated_at=last.updated_at, id=last.id).encode()
+
+    return rows, {
+        "page": page,
+        "limit": limit,
+        "total_pages": (total + limit - 1) // limit if total is not None else None,
+        "total_records": total,
+        "has_next": has_next,
+        "has_previous": after is not None or page > 1,
+        "next_cursor": next_cursor,
+    }
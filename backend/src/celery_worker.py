@@ -1,21 +1,48 @@
 from celery import Celery
 from celery.schedules import schedule
+from celery.signals import task_postrun
 
+from config.db_connection import db_service
 from config.settings import app_settings
+from src.domain.enums import MarketEventSource
+from src.infrastructure.news_fetcher.scheduler import (
+    FETCH_SCHEDULE_POLICIES,
+    AdaptiveFetchSchedule,
+)
 
 REDIS_BROKER = app_settings.REDIS_BROKER_URL
 
 celery_app = Celery("worker", broker=REDIS_BROKER, backend=REDIS_BROKER)
 celery_app.conf.timezone = "UTC"
 
+
+def get_fetch_schedule(source: MarketEventSource) -> schedule:
+    """
+    Returns the adaptive schedule of a news source, or its fixed base interval when the
+    adaptive scheduler is disabled.
+    """
+    if app_settings.FETCH_SCHEDULER_ENABLED:
+        return AdaptiveFetchSchedule(source)
+    return schedule(run_every=FETCH_SCHEDULE_POLICIES[source].base_interval)
+
+
 # Register with beat dynamically
 celery_app.conf.beat_schedule = {
     "alpha-vantage-events-data-every-N-seconds": {
         "task": "src.infrastructure.tasks.process_alpha_vantage_events_data",
-        "schedule": schedule(run_every=60 * 15),  # Run every 15 minutes
+        "schedule": get_fetch_schedule(MarketEventSource.ALPHA_VANTAGE_API),
     },
     "news-events-data-every-N-seconds": {
         "task": "src.infrastructure.tasks.process_news_events_data",
-        "schedule": schedule(run_every=60 * 60 * 24),  # Run once a day
+        "schedule": get_fetch_schedule(MarketEventSource.EVENT_REGISTRY_API),
     },
 }
+
+
+@task_postrun.connect
+def remove_task_db_session(**kwargs):
+    """
+    Discards the thread-local session after every task so that its identity map and
+    connection do not carry over to the next task run by the worker.
+    """
+    db_service.Session.remove()
@@ -13,6 +13,14 @@ class PostStatus(str, Enum):
     PUBLISHED = "Published"
 
 
+class PublishPostOutcome(str, Enum):
+    PUBLISHED = "Published"
+    ALREADY_PUBLISHED = "Already published"
+    NOT_APPROVED = "Not approved"
+    NOT_FOUND = "Not found"
+    NOT_AUTHORIZED = "Not authorized"
+
+
 class MarketEventSource(str, Enum):
     ALPHA_VANTAGE_API = "Alpha Vantage"
     EVENT_REGISTRY_API = "Event Registry"
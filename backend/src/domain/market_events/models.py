@@ -1,17 +1,19 @@
 from uuid import uuid4
 
-from sqlalchemy import UUID, Boolean, Column
+from sqlalchemy import UUID, Boolean, Column, Computed
 from sqlalchemy import Enum as SqlEnum
-from sqlalchemy import String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Index, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, deferred, mapped_column
 
+from config.settings import app_settings
 from src.domain.enums import (
     MarketEvenProcessingtStatus,
     MarketEventSource,
     PriorityFlag,
     SentimentalAnalysis,
 )
-from src.domain.utils import ActivityTrackingBaseModel
+from src.domain.utils import ActivityTrackingBaseModel, build_search_vector_expression
 
 
 class MarketEvent(ActivityTrackingBaseModel):
@@ -42,3 +44,36 @@ class MarketEvent(ActivityTrackingBaseModel):
         nullable=False,
     )
     is_customized = Column(Boolean, default=False)
+    # Kept in sync by Postgres; deferred so listings do not load it
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                build_search_vector_expression({"title": "A", "description": "B"}),
+                persisted=True,
+            ),
+        )
+    )
+
+
+# Shaped for the drafted market events listing, newest first.
+Index(
+    "ix_market_events_processing_status_updated_at",
+    MarketEvent.processing_status,
+    MarketEvent.updated_at.desc(),
+)
+
+# Full-text search, and, when enabled, partial-word matching on the title through
+# pg_trgm (see the add_partial_match_title_indexes revision).
+Index(
+    "ix_market_events_search_vector",
+    MarketEvent.search_vector,
+    postgresql_using="gin",
+)
+if app_settings.SEARCH_PARTIAL_MATCH_ENABLED:
+    Index(
+        "ix_market_events_title_trgm",
+        MarketEvent.title,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
@@ -1,8 +1,10 @@
 from dataclasses import asdict, dataclass
-from uuid import uuid4
+from typing import List
+from uuid import UUID, uuid4
 
-from sqlalchemy.orm import aliased
-from sqlalchemy.sql import literal
+from sqlalchemy import Select, exists, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 
 from fastapi.responses import JSONResponse
 
@@ -11,7 +13,13 @@ from config.response_handler import ResponseHandler
 from src.domain.enums import MarketEvenProcessingtStatus, MarketEventSource
 from src.domain.market_events.models import MarketEvent
 from src.domain.posts.models import Post
+from src.domain.utils import (
+    build_count_statement,
+    build_keyset_criterion,
+    build_search_criteria,
+)
 from src.schema.market_events import ListMarketEventDataModelSchema, MarketEventDataModelSchema, UpdateMarketEventSchema
+from src.schema.utils import ListingCursorDTO
 
 
 @dataclass(frozen=True)
@@ -49,11 +57,35 @@ class MarketEventFactory:
 
 
 class MarketEventDomainServices:
-    def __init__(self):
+    def __init__(
+        self,
+        db_session: Session | None = None,
+        async_db_session: AsyncSession | None = None,
+    ):
         """
         Constructor for MarketEventDomainServices class.
+
+        Args:
+            db_session (Session | None): Session of the current unit of work; defaults to
+                the thread-local session, opened on first use by a sync method.
+            async_db_session (AsyncSession | None): Session of the current request, used by
+                the async methods; each call opens its own session when omitted.
+        """
+        self._db_session = db_session
+        self.async_db_session = async_db_session
+
+    @property
+    def db_session(self) -> Session:
+        """
+        Session of the sync methods, so that async-only callers never open one.
         """
-        self.db_session = db_service.get_session()
+        if self._db_session is None:
+            self._db_session = db_service.get_session()
+        return self._db_session
+
+    @db_session.setter
+    def db_session(self, db_session: Session) -> None:
+        self._db_session = db_session
 
     @staticmethod
     def get_market_event_factory():
@@ -81,6 +113,42 @@ class MarketEventDomainServices:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    @staticmethod
+    def _build_market_events_listing_statement(search_term: str = "") -> Select:
+        """
+        Builds the statement selecting drafted MarketEvents with a flag telling whether a
+        post was generated from each of them.
+
+        Events are ordered newest first, or by search rank first when searching.
+
+        Args:
+            search_term (str): The search term to find in the title or description.
+
+        Returns:
+            Select: The listing statement, without pagination.
+        """
+        PostAlias = aliased(Post)
+        post_exists_subquery = exists().where(
+            PostAlias.market_event_id == MarketEvent.id
+        )
+
+        statement = select(
+            MarketEvent,
+            post_exists_subquery.label("post_generated"),
+        ).where(
+            MarketEvent.processing_status == MarketEvenProcessingtStatus.DRAFTED
+        )
+
+        if search_term:
+            criterion, rank = build_search_criteria(
+                MarketEvent.search_vector,
+                search_term,
+                partial_match_column=MarketEvent.title,
+            )
+            statement = statement.where(criterion).order_by(rank.desc())
+
+        return statement.order_by(MarketEvent.updated_at.desc(), MarketEvent.id.desc())
+
     def get_market_events(
         self,
         search_term: str = "",
@@ -91,32 +159,59 @@ class MarketEventDomainServices:
         Method to get MarketEvents with search and pagination.
         """
         try:
-            PostAlias = aliased(Post)
-            post_exists_subquery = self.db_session.query(literal(True)).filter(
-                PostAlias.market_event_id == MarketEvent.id
-            ).exists()
-
-            query = self.__get_market_event_repo().with_entities(
-                MarketEvent,
-                post_exists_subquery.label("post_generated")
-            ).filter(
-                MarketEvent.processing_status == MarketEvenProcessingtStatus.DRAFTED
-            ).order_by(MarketEvent.updated_at.desc())
-
-            if search_term:
-                query = query.filter(
-                    MarketEvent.title.ilike(f"%{search_term}%") |
-                    MarketEvent.description.ilike(f"%{search_term}%")
-                )
-
-            total_count = query.count()
-            results = query.offset(offset).limit(limit).all()
+            statement = self._build_market_events_listing_statement(
+                search_term=search_term
+            )
+            total_count = self.db_session.scalar(build_count_statement(statement))
+            results = self.db_session.execute(
+                statement.offset(offset).limit(limit)
+            ).all()
             return results, total_count
 
         except Exception as e:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    async def get_market_events_async(
+        self,
+        search_term: str = "",
+        offset: int = 0,
+        limit: int = 10,
+        after: ListingCursorDTO | None = None,
+        include_total: bool = True,
+    ):
+        """
+        Async variant of `get_market_events` for the FastAPI routes.
+
+        Args:
+            after (ListingCursorDTO | None): Returns the events following this cursor
+                instead of skipping `offset` rows.
+            include_total (bool): Whether to count the matching events.
+        """
+        try:
+            statement = self._build_market_events_listing_statement(
+                search_term=search_term
+            )
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                total_count = (
+                    await session.scalar(build_count_statement(statement))
+                    if include_total
+                    else None
+                )
+                if after is not None:
+                    statement = statement.where(
+                        build_keyset_criterion(
+                            MarketEvent.updated_at, MarketEvent.id, after
+                        )
+                    )
+                result = await session.execute(statement.offset(offset).limit(limit))
+                return result.all(), total_count
+
+        except Exception as e:
+            return ResponseHandler.error(exception=e)
+
     def get_market_event_by_id(self, id: str) -> MarketEvent | JSONResponse | None:
         """
         Method to get a market_event by id.
@@ -134,6 +229,20 @@ class MarketEventDomainServices:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    async def get_market_event_by_id_async(
+        self, id: str
+    ) -> MarketEvent | JSONResponse | None:
+        """
+        Async variant of `get_market_event_by_id` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                return await session.get(MarketEvent, id)
+        except Exception as e:
+            return ResponseHandler.error(exception=e)
+
     def create_market_event(self, market_event_data: MarketEvent):
         """
         Method to create a market_event.
@@ -153,13 +262,47 @@ class MarketEventDomainServices:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    def create_market_events(
+        self, market_events_data: List[MarketEventDataClass]
+    ) -> List[UUID]:
+        """
+        Method to insert many market_events in a single round-trip.
+
+        The rows are sent as one multi-row `INSERT ... RETURNING` and nothing is loaded
+        back into the session.
+
+        Args:
+            market_events_data (List[MarketEventDataClass]): The market events to create.
+
+        Returns:
+            List[UUID]: The IDs of the created market events, in input order.
+        """
+        if not market_events_data:
+            return []
+        try:
+            result = self.db_session.execute(
+                insert(MarketEvent).returning(
+                    MarketEvent.id, sort_by_parameter_order=True
+                ),
+                [
+                    {"id": uuid4(), **asdict(market_event_data)}
+                    for market_event_data in market_events_data
+                ],
+            )
+            ids = list(result.scalars())
+            self.db_session.commit()
+            return ids
+        except Exception as e:
+            self.db_session.rollback()
+            return ResponseHandler.error(exception=e)
+
     def update_market_event_by_id(
         self,
         id: str,
         market_event_data: UpdateMarketEventSchema,
     ):
         """
-        Update a MarketEvent by its ID.
+        Update a MarketEvent by its ID with a single `UPDATE ... RETURNING`.
 
         Args:
             id (str): ID of the MarketEvent.
@@ -169,14 +312,13 @@ class MarketEventDomainServices:
             MarketEvent: The updated MarketEvent object.
         """
         try:
-            market_event = self.get_market_event_by_id(id=id)
-            update_data = market_event_data.model_dump(exclude_unset=True)
-
-            for field, value in update_data.items():
-                setattr(market_event, field, value)
-
+            market_event = self.db_session.scalars(
+                update(MarketEvent)
+                .where(MarketEvent.id == id)
+                .values(**market_event_data.model_dump(exclude_unset=True))
+                .returning(MarketEvent)
+            ).one_or_none()
             self.db_session.commit()
-            self.db_session.refresh(market_event)
             return market_event
         except Exception as e:
             self.db_session.rollback()
@@ -1,13 +1,15 @@
 from uuid import uuid4
 
-from sqlalchemy import UUID, Boolean, Column
+from sqlalchemy import UUID, Boolean, Column, Computed
 from sqlalchemy import Enum as SqlEnum
-from sqlalchemy import ForeignKey, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, deferred, mapped_column
 
+from config.settings import app_settings
 from src.domain.enums import PostStatus
 from src.domain.users.models import User  # Import User model to ensure it's registered
-from src.domain.utils import ActivityTrackingBaseModel
+from src.domain.utils import ActivityTrackingBaseModel, build_search_vector_expression
 
 
 class Post(ActivityTrackingBaseModel):
@@ -20,3 +22,31 @@ class Post(ActivityTrackingBaseModel):
     market_event_id = Column(UUID, ForeignKey("market_events.id"))
     status: Mapped[PostStatus] = mapped_column(SqlEnum(PostStatus), nullable=False)
     is_customized = Column(Boolean, default=False)
+    # Kept in sync by Postgres; deferred so listings do not load it
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                build_search_vector_expression({"title": "A", "description": "B"}),
+                persisted=True,
+            ),
+        )
+    )
+
+
+# Shaped for the listing queries: a user's posts and published posts, newest first, and
+# the lookups of posts by market event (including the `post_generated` EXISTS probe).
+Index("ix_posts_user_id_updated_at", Post.user_id, Post.updated_at.desc())
+Index("ix_posts_status_updated_at", Post.status, Post.updated_at.desc())
+Index("ix_posts_market_event_id_user_id", Post.market_event_id, Post.user_id)
+
+# Full-text search, and, when enabled, partial-word matching on the title through
+# pg_trgm (see the add_partial_match_title_indexes revision).
+Index("ix_posts_search_vector", Post.search_vector, postgresql_using="gin")
+if app_settings.SEARCH_PARTIAL_MATCH_ENABLED:
+    Index(
+        "ix_posts_title_trgm",
+        Post.title,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
@@ -3,13 +3,35 @@ from typing import List
 from uuid import UUID, uuid4
 from datetime import date, datetime, time
 
+from sqlalchemy import UUID as UUID_TYPE
+from sqlalchemy import Select, any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
 from config.db_connection import db_service
 from config.response_handler import ResponseHandler
-from src.domain.enums import PostStatus, MarketEventSource, ContentTone
+from src.domain.enums import (
+    ContentTone,
+    MarketEventSource,
+    PostStatus,
+    PublishPostOutcome,
+)
 from src.domain.market_events.models import MarketEvent
 from src.domain.posts.models import Post
+from src.domain.utils import (
+    build_count_statement,
+    build_keyset_criterion,
+    build_search_criteria,
+)
 from src.exceptions.posts import PostNotDraftedException
-from src.schema.posts import PostCountsResponseSchema, UpdatePostSchema
+from src.schema.posts import (
+    PostCountsResponseSchema,
+    PostDataModelSchema,
+    PublishPostResultSchema,
+    UpdatePostSchema,
+)
+from src.schema.utils import ListingCursorDTO
 
 
 @dataclass(frozen=True)
@@ -49,11 +71,35 @@ class PostFactory:
 
 
 class PostDomainServices:
-    def __init__(self):
+    def __init__(
+        self,
+        db_session: Session | None = None,
+        async_db_session: AsyncSession | None = None,
+    ):
         """
         Constructor for PostDomainServices class.
+
+        Args:
+            db_session (Session | None): Session of the current unit of work; defaults to
+                the thread-local session, opened on first use by a sync method.
+            async_db_session (AsyncSession | None): Session of the current request, used by
+                the async methods; each call opens its own session when omitted.
+        """
+        self._db_session = db_session
+        self.async_db_session = async_db_session
+
+    @property
+    def db_session(self) -> Session:
         """
-        self.db_session = db_service.get_session()
+        Session of the sync methods, so that async-only callers never open one.
+        """
+        if self._db_session is None:
+            self._db_session = db_service.get_session()
+        return self._db_session
+
+    @db_session.setter
+    def db_session(self, db_session: Session) -> None:
+        self._db_session = db_session
 
     @staticmethod
     def get_post_factory():
@@ -82,6 +128,57 @@ class PostDomainServices:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    @staticmethod
+    def _build_posts_listing_statement(
+        user_id: str | None = None,
+        search_term: str = "",
+        status: PostStatus | None = None,
+        source: MarketEventSource | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> Select:
+        """
+        Builds the statement selecting posts with their market event source.
+
+        Posts are ordered newest first, or by search rank first when searching.
+
+        Args:
+            user_id (str | None): The ID of the user to filter by (optional).
+            search_term (str): The search term to find in the title or description.
+            status (PostStatus | None): The status to filter by (optional).
+            source (MarketEventSource | None): The market event source to filter by (optional).
+            start_date (date | None): The start date of the date range to filter by (optional).
+            end_date (date | None): The end date of the date range to filter by (optional).
+
+        Returns:
+            Select: The listing statement, without pagination.
+        """
+        statement = select(Post, MarketEvent.source).join(
+            MarketEvent, Post.market_event_id == MarketEvent.id
+        )
+
+        if user_id:
+            statement = statement.where(Post.user_id == user_id)
+
+        if search_term:
+            criterion, rank = build_search_criteria(
+                Post.search_vector, search_term, partial_match_column=Post.title
+            )
+            statement = statement.where(criterion).order_by(rank.desc())
+
+        if status:
+            statement = statement.where(Post.status == status)
+
+        if source:
+            statement = statement.where(MarketEvent.source == source)
+
+        if start_date and end_date:
+            start_dt = datetime.combine(start_date, time.min)
+            end_dt = datetime.combine(end_date, time.max)
+            statement = statement.where(Post.created_at.between(start_dt, end_dt))
+
+        return statement.order_by(Post.updated_at.desc(), Post.id.desc())
+
     def get_posts_by_user_id(
         self,
         user_id: str,
@@ -110,38 +207,69 @@ class PostDomainServices:
             tuple[list[Post], int]: A tuple containing the posts and the total count of posts.
         """
         try:
-            query = self.__get_post_repository().with_entities(
-                Post, MarketEvent.source
-            ).join(
-                MarketEvent, Post.market_event_id == MarketEvent.id
-            ).filter(
-                Post.user_id == user_id
-            ).order_by(
-                Post.updated_at.desc()
+            statement = self._build_posts_listing_statement(
+                user_id=user_id,
+                search_term=search_term,
+                status=status,
+                source=source,
+                start_date=start_date,
+                end_date=end_date,
             )
+            count = self.db_session.scalar(build_count_statement(statement))
+            posts = self.db_session.execute(statement.offset(offset).limit(limit)).all()
+            return posts, count
+        except Exception as e:
+            self.db_session.rollback()
+            raise ResponseHandler.error(exception=e)
 
-            if search_term:
-                query = query.filter(
-                    Post.title.ilike(f"%{search_term}%")
-                    | Post.description.ilike(f"%{search_term}%")
-                )
-
-            if status:
-                query = query.filter(Post.status == status)
-
-            if source:
-                query = query.filter(MarketEvent.source == source)
+    async def get_posts_by_user_id_async(
+        self,
+        user_id: str,
+        offset: int = 0,
+        limit: int = 10,
+        search_term: str = "",
+        status: PostStatus | None = None,
+        source: MarketEventSource | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: ListingCursorDTO | None = None,
+        include_total: bool = True,
+    ):
+        """
+        Async variant of `get_posts_by_user_id` for the FastAPI routes.
 
-            if start_date and end_date:
-                start_dt = datetime.combine(start_date, time.min)
-                end_dt = datetime.combine(end_date, time.max)
-                query = query.filter(Post.created_at.between(start_dt, end_dt))
+        Args:
+            after (ListingCursorDTO | None): Returns the posts following this cursor
+                instead of skipping `offset` rows.
+            include_total (bool): Whether to count the matching posts.
 
-            count = query.count()
-            posts = query.offset(offset).limit(limit).all()
-            return posts, count
+        Returns:
+            tuple[list[Post], int | None]: A tuple containing the posts and the total count of posts.
+        """
+        try:
+            statement = self._build_posts_listing_statement(
+                user_id=user_id,
+                search_term=search_term,
+                status=status,
+                source=source,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                count = (
+                    await session.scalar(build_count_statement(statement))
+                    if include_total
+                    else None
+                )
+                if after is not None:
+                    statement = statement.where(
+                        build_keyset_criterion(Post.updated_at, Post.id, after)
+                    )
+                result = await session.execute(statement.offset(offset).limit(limit))
+                return result.all(), count
         except Exception as e:
-            self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
     def get_post_by_id(self, post_id: str) -> Post | None:
@@ -160,7 +288,36 @@ class PostDomainServices:
         except Exception as e:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
-        
+
+    async def get_post_by_id_async(self, post_id: str) -> Post | None:
+        """
+        Async variant of `get_post_by_id` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                return await session.get(Post, post_id)
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
+    @staticmethod
+    def _build_post_with_market_event_source_statement(post_id: str) -> Select:
+        """
+        Builds the statement selecting a post by its ID with its market event source.
+
+        Args:
+            post_id (str): The ID of the post.
+
+        Returns:
+            Select: The statement, yielding at most one `(Post, MarketEventSource)` row.
+        """
+        return (
+            select(Post, MarketEvent.source)
+            .join(MarketEvent, Post.market_event_id == MarketEvent.id)
+            .where(Post.id == post_id)
+        )
+
     def get_post_by_id_with_market_event_source(self, post_id: str) -> tuple[Post, MarketEventSource] | None:
         """
         Method to get a post by its ID along with its market event source.
@@ -172,17 +329,30 @@ class PostDomainServices:
             tuple[Post, MarketEventSource] | None: The Post object and MarketEvent source if found.
         """
         try:
-            query = self.__get_post_repository().with_entities(
-                Post, MarketEvent.source
-            ).join(
-                MarketEvent, Post.market_event_id == MarketEvent.id
-            ).filter(Post.id == post_id)
-
-            return query.first()
+            return self.db_session.execute(
+                self._build_post_with_market_event_source_statement(post_id)
+            ).first()
         except Exception as e:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    async def get_post_by_id_with_market_event_source_async(
+        self, post_id: str
+    ) -> tuple[Post, MarketEventSource] | None:
+        """
+        Async variant of `get_post_by_id_with_market_event_source` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                result = await session.execute(
+                    self._build_post_with_market_event_source_statement(post_id)
+                )
+                return result.first()
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
     def get_post_by_market_event_id(self, market_event_id: str) -> Post | None:
         """
         Method to get a post by its ID.
@@ -204,6 +374,29 @@ class PostDomainServices:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    @staticmethod
+    def _build_post_by_user_id_and_market_event_id_statement(
+        user_id: str, market_event_id: str
+    ) -> Select:
+        """
+        Builds the statement selecting the post of a user for a market event.
+
+        Args:
+            user_id (str): The ID of the user.
+            market_event_id (str): The ID of the market event.
+
+        Returns:
+            Select: The statement, limited to one post.
+        """
+        return (
+            select(Post)
+            .where(
+                Post.user_id == user_id,
+                Post.market_event_id == market_event_id,
+            )
+            .limit(1)
+        )
+
     def get_post_by_user_id_and_market_event_id(
         self,
         user_id: str,
@@ -220,19 +413,59 @@ class PostDomainServices:
             Post | None: The Post object if found, else None.
         """
         try:
-            post = (
-                self.__get_post_repository()
-                .filter(
-                    Post.user_id == user_id,
-                    Post.market_event_id == market_event_id,
+            return self.db_session.scalar(
+                self._build_post_by_user_id_and_market_event_id_statement(
+                    user_id, market_event_id
                 )
-                .first()
             )
-            return post
         except Exception as e:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    async def get_post_by_user_id_and_market_event_id_async(
+        self,
+        user_id: str,
+        market_event_id: str,
+    ) -> Post | None:
+        """
+        Async variant of `get_post_by_user_id_and_market_event_id` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                return await session.scalar(
+                    self._build_post_by_user_id_and_market_event_id_statement(
+                        user_id, market_event_id
+                    )
+                )
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
+    @staticmethod
+    def _build_post_counts_statement(user_id: str) -> Select:
+        """
+        Builds the statement counting a user's posts by status in a single scan.
+
+        Args:
+            user_id (str): The ID of the user whose posts are counted.
+
+        Returns:
+            Select: One row labelled after the `PostCountsResponseSchema` fields.
+        """
+        return select(
+            func.count().label("total_posts"),
+            func.count()
+            .filter(Post.status == PostStatus.DRAFT)
+            .label("draft_posts"),
+            func.count()
+            .filter(Post.status == PostStatus.PUBLISHED)
+            .label("published_posts"),
+            func.count()
+            .filter(Post.is_customized.is_(True))
+            .label("customized_posts"),
+        ).where(Post.user_id == user_id)
+
     def get_post_counts_by_user_id(self, user_id: str):
         """
         Method to get the counts of posts for a specific user.
@@ -245,24 +478,29 @@ class PostDomainServices:
                 published posts, and customized posts for the specified user.
         """
         try:
-            query = self.__get_post_repository().filter(Post.user_id == user_id)
-
-            total_posts = query.count()
-            draft_posts = query.filter(Post.status == PostStatus.DRAFT).count()
-            published_posts = query.filter(Post.status == PostStatus.PUBLISHED).count()
-
-            customized_posts = query.filter(Post.is_customized.is_(True)).count()
-
-            return PostCountsResponseSchema(
-                total_posts=total_posts,
-                draft_posts=draft_posts,
-                published_posts=published_posts,
-                customized_posts=customized_posts,
-            )
+            counts = self.db_session.execute(
+                self._build_post_counts_statement(user_id)
+            ).one()
+            return PostCountsResponseSchema(**counts._mapping)
         except Exception as e:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    async def get_post_counts_by_user_id_async(self, user_id: str):
+        """
+        Async variant of `get_post_counts_by_user_id` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                result = await session.execute(
+                    self._build_post_counts_statement(user_id)
+                )
+                return PostCountsResponseSchema(**result.one()._mapping)
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
     def create_post(self, post: Post) -> Post:
         """
         Method to create a new post in the database.
@@ -282,6 +520,21 @@ class PostDomainServices:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    async def create_post_async(self, post: Post) -> Post:
+        """
+        Async variant of `create_post` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                session.add(post)
+                await session.commit()
+                await session.refresh(post)
+                return post
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
     def update_post(
         self,
         post: Post,
@@ -319,6 +572,37 @@ class PostDomainServices:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    async def update_post_async(
+        self,
+        post: Post,
+        post_data: UpdatePostSchema,
+    ) -> Post:
+        """
+        Async variant of `update_post` for the FastAPI routes.
+
+        The post may come from an earlier, already closed session; it is attached to a new one.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                session.add(post)
+                update_data = post_data.model_dump(exclude_unset=True)
+
+                for key, value in update_data.items():
+                    setattr(post, key, value)
+
+                if "description" in update_data:
+                    setattr(post, "is_customized", True)
+
+                post.status = PostStatus.DRAFT
+
+                await session.commit()
+                await session.refresh(post)
+                return post
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
     def approve_post_by_id(self, post_id: str):
         """
         Publishes multiple posts by their IDs.
@@ -348,6 +632,27 @@ class PostDomainServices:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    async def approve_post_by_id_async(self, post_id: str):
+        """
+        Async variant of `approve_post_by_id` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                post = await session.get(Post, post_id)
+
+                if post:
+                    if post.status == PostStatus.DRAFT:
+                        post.status = PostStatus.APPROVED
+                    else:
+                        raise PostNotDraftedException()
+
+                await session.commit()
+                return post
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
     def publish_posts_by_ids(self, post_ids: List[str]):
         """
         Publishes multiple posts by their IDs.
@@ -375,6 +680,109 @@ class PostDomainServices:
             self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
 
+    @staticmethod
+    def _build_publish_posts_statement(post_ids: List[str], user_id: str) -> Select:
+        """
+        Builds a single statement publishing the user's approved posts among `post_ids`.
+
+        The UPDATE runs in a CTE and the outer SELECT reads every requested post as it
+        was before the update, so each ID can be classified in the same round-trip.
+
+        Args:
+            post_ids (List[str]): IDs of the posts to publish.
+            user_id (str): ID of the user who must own the posts.
+
+        Returns:
+            Select: Rows with the previous `id`, `user_id` and `status` of each existing
+            post, plus its updated columns prefixed with `published_` if it was published.
+        """
+        ids = bindparam("post_ids", value=list(post_ids), type_=ARRAY(UUID_TYPE))
+        published = (
+            update(Post)
+            .where(
+                Post.id == any_(ids),
+                Post.user_id == user_id,
+                Post.status == PostStatus.APPROVED,
+            )
+            .values(status=PostStatus.PUBLISHED)
+            .returning(
+                *(Post.__table__.c[name] for name in PostDataModelSchema.model_fields)
+            )
+            .cte("published")
+        )
+        return (
+            select(
+                Post.id,
+                Post.user_id,
+                Post.status,
+                *(column.label(f"published_{column.name}") for column in published.c),
+            )
+            .outerjoin(published, published.c.id == Post.id)
+            .where(Post.id == any_(ids))
+        )
+
+    async def publish_posts_by_ids_async(
+        self, post_ids: List[str], user_id: str
+    ) -> List[PublishPostResultSchema]:
+        """
+        Publishes the approved posts owned by `user_id` among `post_ids` in one statement.
+
+        Args:
+            post_ids (List[str]): IDs of the posts to be published.
+            user_id (str): ID of the user publishing the posts.
+
+        Returns:
+            List[PublishPostResultSchema]: The outcome of every distinct ID, in request
+            order, with the published post when it was published.
+        """
+        try:
+            post_ids = list(dict.fromkeys(UUID(str(post_id)) for post_id in post_ids))
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                result = await session.execute(
+                    self._build_publish_posts_statement(post_ids, user_id)
+                )
+                rows_by_id = {row.id: row._mapping for row in result}
+                await session.commit()
+
+            return [
+                self._get_publish_post_result(
+                    post_id, rows_by_id.get(post_id), user_id
+                )
+                for post_id in post_ids
+            ]
+        except Exception as e:
+            raise ResponseHandler.error(exception=e)
+
+    @staticmethod
+    def _get_publish_post_result(
+        post_id: UUID, row: dict | None, user_id: str
+    ) -> PublishPostResultSchema:
+        """
+        Classifies one requested ID from its row of the publish statement.
+        """
+        if row is None:
+            outcome = PublishPostOutcome.NOT_FOUND
+        elif row["published_id"] is not None:
+            return PublishPostResultSchema(
+                id=post_id,
+                outcome=PublishPostOutcome.PUBLISHED,
+                post=PostDataModelSchema(
+                    **{
+                        name: row[f"published_{name}"]
+                        for name in PostDataModelSchema.model_fields
+                    }
+                ),
+            )
+        elif str(row["user_id"]) != str(user_id):
+            outcome = PublishPostOutcome.NOT_AUTHORIZED
+        elif row["status"] == PostStatus.PUBLISHED:
+            outcome = PublishPostOutcome.ALREADY_PUBLISHED
+        else:
+            outcome = PublishPostOutcome.NOT_APPROVED
+        return PublishPostResultSchema(id=post_id, outcome=outcome)
+
     def get_published_posts(
         self,
         offset: int = 0,
@@ -399,34 +807,63 @@ class PostDomainServices:
             tuple[list[Post], int]: A tuple containing the posts and the total count of posts.
         """
         try:
-            query = self.__get_post_repository().with_entities(
-                Post, MarketEvent.source
-            ).join(
-                MarketEvent, Post.market_event_id == MarketEvent.id
-            ).filter(
-                Post.status == PostStatus.PUBLISHED
-            ).order_by(
-                Post.updated_at.desc()
+            statement = self._build_posts_listing_statement(
+                search_term=search_term,
+                status=PostStatus.PUBLISHED,
+                source=source,
+                start_date=start_date,
+                end_date=end_date,
             )
+            count = self.db_session.scalar(build_count_statement(statement))
+            posts = self.db_session.execute(statement.offset(offset).limit(limit)).all()
+            return posts, count
+        except Exception as e:
+            self.db_session.rollback()
+            raise ResponseHandler.error(exception=e)
 
-            if search_term:
-                query = query.filter(
-                    Post.title.ilike(f"%{search_term}%")
-                    | Post.description.ilike(f"%{search_term}%")
-                )
-
-            if source:
-                query = query.filter(MarketEvent.source == source)
+    async def get_published_posts_async(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        search_term: str = "",
+        source: MarketEventSource | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: ListingCursorDTO | None = None,
+        include_total: bool = True,
+    ):
+        """
+        Async variant of `get_published_posts` for the FastAPI routes.
 
-            if start_date and end_date:
-                start_dt = datetime.combine(start_date, time.min)
-                end_dt = datetime.combine(end_date, time.max)
-                query = query.filter(Post.created_at.between(start_dt, end_dt))
+        Args:
+            after (ListingCursorDTO | None): Returns the posts following this cursor
+                instead of skipping `offset` rows.
+            include_total (bool): Whether to count the matching posts.
 
-            count = query.count()
-            posts = query.offset(offset).limit(limit).all()
-            return posts, count
+        Returns:
+            tuple[list[Post], int | None]: A tuple containing the posts and the total count of posts.
+        """
+        try:
+            statement = self._build_posts_listing_statement(
+                search_term=search_term,
+                status=PostStatus.PUBLISHED,
+                source=source,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                count = (
+                    await session.scalar(build_count_statement(statement))
+                    if include_total
+                    else None
+                )
+                if after is not None:
+                    statement = statement.where(
+                        build_keyset_criterion(Post.updated_at, Post.id, after)
+                    )
+                result = await session.execute(statement.offset(offset).limit(limit))
+                return result.all(), count
         except Exception as e:
-            self.db_session.rollback()
             raise ResponseHandler.error(exception=e)
-        
\ No newline at end of file
@@ -2,6 +2,9 @@ from dataclasses import asdict, dataclass
 from uuid import UUID, uuid4
 
 from fastapi.responses import JSONResponse
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from config.db_connection import db_service
 from config.response_handler import ResponseHandler
@@ -43,11 +46,35 @@ class UserFactory:
 
 
 class UserDomainServices:
-    def __init__(self):
+    def __init__(
+        self,
+        db_session: Session | None = None,
+        async_db_session: AsyncSession | None = None,
+    ):
         """
         Constructor for UserDomainServices class.
+
+        Args:
+            db_session (Session | None): Session of the current unit of work; defaults to
+                the thread-local session, opened on first use by a sync method.
+            async_db_session (AsyncSession | None): Session of the current request, used by
+                the async methods; each call opens its own session when omitted.
+        """
+        self._db_session = db_session
+        self.async_db_session = async_db_session
+
+    @property
+    def db_session(self) -> Session:
         """
-        self.db_session = db_service.get_session()
+        Session of the sync methods, so that async-only callers never open one.
+        """
+        if self._db_session is None:
+            self._db_session = db_service.get_session()
+        return self._db_session
+
+    @db_session.setter
+    def db_session(self, db_session: Session) -> None:
+        self._db_session = db_session
 
     @staticmethod
     def get_user_factory():
@@ -92,6 +119,18 @@ class UserDomainServices:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    async def get_user_by_id_async(self, user_id: UUID) -> User | JSONResponse:
+        """
+        Async variant of `get_user_by_id` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                return await session.get(User, user_id)
+        except Exception as e:
+            return ResponseHandler.error(exception=e)
+
     def create_user(self, user: User):
         """
         Method to create a user.
@@ -111,6 +150,21 @@ class UserDomainServices:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    async def create_user_async(self, user: User):
+        """
+        Async variant of `create_user` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                session.add(user)
+                await session.commit()
+                await session.refresh(user)
+                return user
+        except Exception as e:
+            return ResponseHandler.error(exception=e)
+
     def update_user_by_id(
         self, user_id: UUID, data: UpdateUserDomainSchema
     ) -> User | JSONResponse:
@@ -135,6 +189,26 @@ class UserDomainServices:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    async def update_user_by_id_async(
+        self, user_id: UUID, data: UpdateUserDomainSchema
+    ) -> User | JSONResponse:
+        """
+        Async variant of `update_user_by_id` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                await session.execute(
+                    update(User)
+                    .where(User.id == user_id)
+                    .values(**data.model_dump(exclude_unset=True))
+                )
+                await session.commit()
+                return await session.get(User, user_id)
+        except Exception as e:
+            return ResponseHandler.error(exception=e)
+
     def delete_user_by_id(self, user_id: UUID):
         """
         Method to delete a user by id.
@@ -170,6 +244,20 @@ class UserDomainServices:
             self.db_session.rollback()
             return ResponseHandler.error(exception=e)
 
+    async def get_user_by_email_async(self, email: str):
+        """
+        Async variant of `get_user_by_email` for the FastAPI routes.
+        """
+        try:
+            async with db_service.async_session_scope(
+                self.async_db_session
+            ) as session:
+                return await session.scalar(
+                    select(User).where(User.email == email).limit(1)
+                )
+        except Exception as e:
+            return ResponseHandler.error(exception=e)
+
     def is_user_exist_by_id(self, user_id: str):
         """
         Method to check if a user exists.
@@ -1,6 +1,23 @@
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    DateTime,
+    Select,
+    cast,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
 
 from config.db_connection import Base
+from config.settings import app_settings
+from src.schema.utils import ListingCursorDTO
+
+# Text search configuration of the `search_vector` columns and of the search queries.
+SEARCH_TEXT_CONFIG = "english"
+# Escapes the wildcards of the partial-match LIKE patterns.
+LIKE_ESCAPE_CHARACTER = "\\"
 
 
 class ActivityTrackingBaseModel(Base):
@@ -23,3 +40,99 @@ class ActivityTrackingBaseModel(Base):
     updated_at = Column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now(), nullable=False
     )
+
+
+def build_count_statement(statement: Select) -> Select:
+    """
+    Builds a statement counting the rows of the given select, ignoring its ordering.
+
+    Args:
+        statement (Select): The listing statement.
+
+    Returns:
+        Select: A `SELECT count(*)` over the listing statement.
+    """
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+
+def build_keyset_criterion(
+    updated_at_column: ColumnElement, id_column: ColumnElement, after: ListingCursorDTO
+) -> ColumnElement:
+    """
+    Builds the where clause selecting the rows that follow a cursor in a listing ordered
+    by (updated_at, id) descending.
+
+    Args:
+        updated_at_column (ColumnElement): The `updated_at` column of the listed model.
+        id_column (ColumnElement): The `id` column of the listed model.
+        after (ListingCursorDTO): The last row of the previous page.
+
+    Returns:
+        ColumnElement: A row comparison on (updated_at, id).
+    """
+    return tuple_(updated_at_column, id_column) < tuple_(after.updated_at, after.id)
+
+
+def build_search_vector_expression(weighted_columns: dict[str, str]) -> str:
+    """
+    Builds the SQL of a generated `tsvector` column over the given text columns.
+
+    Args:
+        weighted_columns (dict[str, str]): Column names mapped to their weight (A to D).
+
+    Returns:
+        str: The generation expression.
+    """
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_TEXT_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns.items()
+    )
+
+
+def escape_like(term: str) -> str:
+    """
+    Escapes the wildcards of a LIKE pattern, so a term is matched literally.
+
+    Args:
+        term (str): The raw term.
+
+    Returns:
+        str: The term, escaped with LIKE_ESCAPE_CHARACTER.
+    """
+    for character in (LIKE_ESCAPE_CHARACTER, "%", "_"):
+        term = term.replace(character, LIKE_ESCAPE_CHARACTER + character)
+    return term
+
+
+def build_search_criteria(
+    search_vector: ColumnElement,
+    search_term: str,
+    partial_match_column: ColumnElement | None = None,
+) -> tuple[ColumnElement, ColumnElement]:
+    """
+    Builds the full-text match and rank of a search term.
+
+    The term is parsed with `websearch_to_tsquery`, so quoted phrases, `or` and `-word`
+    work as users expect. When SEARCH_PARTIAL_MATCH_ENABLED is set, rows whose
+    `partial_match_column` contains the term literally are matched as well, served by
+    its trigram index.
+
+    Args:
+        search_vector (ColumnElement): The `tsvector` column to search.
+        search_term (str): The raw search term.
+        partial_match_column (ColumnElement | None): Column matched on partial words.
+
+    Returns:
+        tuple[ColumnElement, ColumnElement]: The where clause and the rank expression.
+    """
+    query = func.websearch_to_tsquery(
+        cast(SEARCH_TEXT_CONFIG, REGCONFIG), search_term
+    )
+    criterion = search_vector.op("@@")(query)
+
+    if partial_match_column is not None and app_settings.SEARCH_PARTIAL_MATCH_ENABLED:
+        criterion = criterion | partial_match_column.ilike(
+            f"%{escape_like(search_term)}%", escape=LIKE_ESCAPE_CHARACTER
+        )
+
+    return criterion, func.ts_rank_cd(search_vector, query)
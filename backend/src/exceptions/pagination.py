@@ -0,0 +1,25 @@
+from fastapi import status
+
+from config.exception_handler import BaseHTTPException
+from src.schema.messages_enums import GeneralEnums
+
+
+class InvalidCursorException(BaseHTTPException):
+    def __init__(
+        self,
+        message: str = GeneralEnums.INVALID_CURSOR.value,
+        status_code: int = status.HTTP_400_BAD_REQUEST,
+    ):
+        """
+        Constructor for InvalidCursorException class.
+
+        Initializes a new instance of InvalidCursorException, which represents
+        an exception that is thrown when a listing cursor cannot be used.
+
+        `Args:`
+        - message (str): The message to return with the exception. Defaults to
+          GeneralEnums.INVALID_CURSOR.value.
+        - status_code (int): The HTTP status code to return with the exception.
+          Defaults to status.HTTP_400_BAD_REQUEST.
+        """
+        super().__init__(message=message, status_code=status_code)
@@ -1,22 +1,48 @@
+import asyncio
 import json
 import logging
-from typing import List, Optional
+import time
+from threading import Lock
+from typing import Any, AsyncIterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
-from openai import OpenAI, OpenAIError
+import httpx
+from openai import (
+    NOT_GIVEN,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    OpenAI,
+    OpenAIError,
+    RateLimitError,
+)
 
 from config.settings import app_settings
-from src.schema.utils import PromptEnum
+from src.infrastructure.llm.response_cache import llm_response_cache
+from src.infrastructure.rate_limiter import get_backoff_delay, rate_limiter
+from src.infrastructure.utils import parse_rate_limit_headers
+from src.schema.utils import PromptEnum, RateLimitedProviderEnum
 
 logger = logging.getLogger(__name__)
 
+# Tokens reserved for the completion on top of the prompt estimate; the difference with
+# the actual usage is settled once the response arrives.
+ESTIMATED_COMPLETION_TOKENS = 500
+
 
 class OpenAIServices:
+    # One AsyncOpenAI client, and therefore one HTTP connection pool, per event loop shared by
+    # every OpenAIServices instance. Pools cannot be shared across loops, and Celery tasks run
+    # their own loop, so the loop is the natural scope of "process-wide" here.
+    _async_clients: WeakKeyDictionary = WeakKeyDictionary()
+    _async_clients_lock = Lock()
+
     def __init__(self):
         self.client = None
         try:
             api_key = app_settings.OPENAI_API_KEY
             if api_key:
-                self.client = OpenAI(api_key=api_key)
+                # Rate-limited requests are retried by `_create_chat_completion` only
+                self.client = OpenAI(api_key=api_key, max_retries=0)
                 logger.info("OpenAI client initialized successfully.")
             else:
                 logger.warning(
@@ -26,17 +52,61 @@ class OpenAIServices:
             logger.error("Failed to initialize OpenAI client: %s", e)
             self.client = None
 
+    @classmethod
+    def _get_async_client(cls) -> Tuple[AsyncOpenAI, asyncio.Semaphore]:
+        """
+        Returns the shared AsyncOpenAI client and concurrency limiter for the running event loop.
+
+        Returns:
+            Tuple[AsyncOpenAI, asyncio.Semaphore]: The pooled client and its request semaphore.
+        """
+
+        loop = asyncio.get_running_loop()
+        with cls._async_clients_lock:
+            entry = cls._async_clients.get(loop)
+            if entry is None:
+                http_client = DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=app_settings.OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=app_settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                    ),
+                    timeout=app_settings.OPENAI_REQUEST_TIMEOUT_SECONDS,
+                )
+                entry = (
+                    AsyncOpenAI(
+                        api_key=app_settings.OPENAI_API_KEY,
+                        http_client=http_client,
+                        max_retries=0,
+                    ),
+                    asyncio.Semaphore(app_settings.OPENAI_MAX_CONCURRENT_REQUESTS),
+                )
+                cls._async_clients[loop] = entry
+                logger.info("Async OpenAI client initialized for the running event loop.")
+        return entry
+
+    @classmethod
+    async def close_async_client(cls) -> None:
+        """
+        Closes the shared AsyncOpenAI client of the running event loop, if any.
+        """
+
+        loop = asyncio.get_running_loop()
+        with cls._async_clients_lock:
+            entry = cls._async_clients.pop(loop, None)
+        if entry:
+            await entry[0].close()
+
     def _build_messages(
         self,
         user_prompt: str,
-        system_prompt: Optional[PromptEnum],
+        system_prompt: Optional[PromptEnum | str],
     ) -> List[dict]:
         """
         Builds the message payload for the OpenAI API.
 
         Args:
             user_prompt (str): The user's input prompt.
-            system_prompt (Optional[str]): The system's context or instructions.
+            system_prompt (Optional[PromptEnum | str]): The system's context or instructions.
 
         Returns:
             List[dict]: A list of message dictionaries for the OpenAI API.
@@ -44,24 +114,189 @@ class OpenAIServices:
 
         messages = []
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt.value})
+            content = (
+                system_prompt.value
+                if isinstance(system_prompt, PromptEnum)
+                else system_prompt
+            )
+            messages.append({"role": "system", "content": content})
         if user_prompt:
             messages.append({"role": "user", "content": user_prompt})
         return messages
 
+    @staticmethod
+    def _build_stub_response(user_prompt: str, model: str) -> dict:
+        """
+        Builds the deterministic response returned when no API key is configured.
+        """
+
+        logger.info("Returning stubbed OpenAI response for prompt: %s", user_prompt)
+        return {
+            "summary": "Stubbed response (no API key configured).",
+            "input": user_prompt,
+            "model": model,
+        }
+
+    @staticmethod
+    def _get_cache_entry_params(
+        messages: List[dict],
+        system_prompt: Optional[PromptEnum | str],
+        model: str,
+        cache_ttl: Optional[int],
+    ) -> Tuple[str, int]:
+        """
+        Returns the response cache key and TTL of a completion request.
+        """
+
+        system_content = next(
+            (m["content"] for m in messages if m["role"] == "system"), None
+        )
+        user_content = next(
+            (m["content"] for m in messages if m["role"] == "user"), ""
+        )
+        cache_key = llm_response_cache.build_key(
+            model=model,
+            system_prompt=system_content,
+            user_prompt=user_content,
+        )
+        if cache_ttl is None:
+            cache_ttl = llm_response_cache.ttl_for(system_prompt)
+        return cache_key, cache_ttl
+
+    @staticmethod
+    def _estimate_tokens(messages: List[dict]) -> int:
+        """
+        Estimates the tokens of a request at roughly four characters per token.
+        """
+
+        characters = sum(len(message["content"]) for message in messages)
+        return characters // 4 + ESTIMATED_COMPLETION_TOKENS
+
+    @staticmethod
+    def _get_retry_delay(error: RateLimitError, attempt: int) -> float:
+        """
+        Returns the jittered delay before retrying a rate-limited request.
+        """
+
+        rate_limit = parse_rate_limit_headers(error.response.headers, 429)
+        return get_backoff_delay(attempt, rate_limit.reset_seconds)
+
+    def _create_chat_completion(
+        self, model: str, messages: List[dict], **kwargs
+    ) -> Any:
+        """
+        Creates a chat completion within the shared rate limit of the model.
+
+        Every attempt first takes one request and the estimated tokens from the rate
+        limiter; 429 responses are retried after a jittered backoff at most
+        `RATE_LIMIT_MAX_RETRIES` times.
+        """
+
+        estimated_tokens = self._estimate_tokens(messages)
+        attempt = 0
+        while True:
+            rate_limiter.acquire(
+                RateLimitedProviderEnum.OPENAI, model, tokens=estimated_tokens
+            )
+            try:
+                response = self.client.chat.completions.create(
+                    model=model, messages=messages, **kwargs
+                )
+                break
+            except RateLimitError as e:
+                if attempt >= app_settings.RATE_LIMIT_MAX_RETRIES:
+                    raise
+                delay = self._get_retry_delay(e, attempt)
+                logger.warning(
+                    "OpenAI rate limited the request, retrying in %.2fs", delay
+                )
+                time.sleep(delay)
+                attempt += 1
+
+        usage = getattr(response, "usage", None)
+        if usage:
+            rate_limiter.record_tokens(
+                RateLimitedProviderEnum.OPENAI,
+                model,
+                usage.total_tokens - estimated_tokens,
+            )
+        return response
+
+    async def _create_chat_completion_async(
+        self, async_client: AsyncOpenAI, model: str, messages: List[dict], **kwargs
+    ) -> Any:
+        """
+        Async variant of `_create_chat_completion` using the shared AsyncOpenAI client.
+        """
+
+        estimated_tokens = self._estimate_tokens(messages)
+        attempt = 0
+        while True:
+            await rate_limiter.acquire_async(
+                RateLimitedProviderEnum.OPENAI, model, tokens=estimated_tokens
+            )
+            try:
+                response = await async_client.chat.completions.create(
+                    model=model, messages=messages, **kwargs
+                )
+                break
+            except RateLimitError as e:
+                if attempt >= app_settings.RATE_LIMIT_MAX_RETRIES:
+                    raise
+                delay = self._get_retry_delay(e, attempt)
+                logger.warning(
+                    "OpenAI rate limited the request, retrying in %.2fs", delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        await self._settle_tokens_async(
+            model, getattr(response, "usage", None), estimated_tokens
+        )
+        return response
+
+    @staticmethod
+    async def _settle_tokens_async(
+        model: str, usage: Any, estimated_tokens: int
+    ) -> None:
+        """
+        Settles the tokens a completion used against the estimate taken for it, if the
+        response reported its usage.
+        """
+
+        if usage:
+            await rate_limiter.record_tokens_async(
+                RateLimitedProviderEnum.OPENAI,
+                model,
+                usage.total_tokens - estimated_tokens,
+            )
+
+    @staticmethod
+    def _parse_content(content: str) -> str | dict:
+        """
+        Parses the completion content, decoding it when it is a JSON object.
+        """
+
+        result = content.strip()
+        return json.loads(result) if result.startswith("{") else result
+
     def get_chat_completion(
         self,
         user_prompt: str,
-        system_prompt: Optional[PromptEnum] = None,
+        system_prompt: Optional[PromptEnum | str] = None,
         model: str = "gpt-4o-mini",
+        cache_ttl: Optional[int] = None,
+        response_format: Optional[dict] = None,
     ) -> str | dict:
         """
         Generates a chat completion response using OpenAI's API.
 
         Args:
             user_prompt (str): The user's input prompt.
-            system_prompt (Optional[str]): The system's context or instructions.
+            system_prompt (Optional[PromptEnum | str]): The system's context or instructions.
             model (str): The OpenAI model to use (default: "gpt-4o-mini").
+            cache_ttl (Optional[int]): Overrides the per-prompt cache TTL in seconds; 0 disables caching.
+            response_format (Optional[dict]): OpenAI response format, e.g. `{"type": "json_object"}`.
 
         Returns:
             str: The response content from the OpenAI API.
@@ -77,22 +312,31 @@ class OpenAIServices:
 
         # Return a deterministic stub if client is not configured
         if self.client is None:
-            logger.info("Returning stubbed OpenAI response for prompt: %s", user_prompt)
-            return {
-                "summary": "Stubbed response (no API key configured).",
-                "input": user_prompt,
-                "model": model,
-            }
+            return self._build_stub_response(user_prompt=user_prompt, model=model)
+
+        cache_key, cache_ttl = self._get_cache_entry_params(
+            messages=messages,
+            system_prompt=system_prompt,
+            model=model,
+            cache_ttl=cache_ttl,
+        )
+        if cache_ttl:
+            cached = llm_response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Serving OpenAI response from cache: %s", cache_key)
+                return cached
 
         try:
             logger.debug("Sending request to OpenAI with model: %s", model)
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=model,
                 messages=messages,
+                response_format=response_format or NOT_GIVEN,
             )
             logger.info("Received response from OpenAI.")
-            result = response.choices[0].message.content.strip()
-            return json.loads(result) if result.startswith("{") else result
+            result = self._parse_content(response.choices[0].message.content)
+            llm_response_cache.set(cache_key, result, ttl=cache_ttl)
+            return result
         except OpenAIError as e:
             logger.error("OpenAI API error: %s", e, e.__traceback__.tb_lineno)
             raise
@@ -103,3 +347,161 @@ class OpenAIServices:
                 e.__traceback__.tb_lineno,
             )
             raise
+
+    async def get_chat_completion_async(
+        self,
+        user_prompt: str,
+        system_prompt: Optional[PromptEnum | str] = None,
+        model: str = "gpt-4o-mini",
+        cache_ttl: Optional[int] = None,
+        response_format: Optional[dict] = None,
+    ) -> str | dict:
+        """
+        Generates a chat completion response without blocking the event loop.
+
+        Requests go through the shared AsyncOpenAI client of the running event loop and at most
+        `OPENAI_MAX_CONCURRENT_REQUESTS` of them are in flight at the same time, within the
+        request and token budgets shared by every worker.
+
+        Args:
+            user_prompt (str): The user's input prompt.
+            system_prompt (Optional[PromptEnum | str]): The system's context or instructions.
+            model (str): The OpenAI model to use (default: "gpt-4o-mini").
+            cache_ttl (Optional[int]): Overrides the per-prompt cache TTL in seconds; 0 disables caching.
+            response_format (Optional[dict]): OpenAI response format, e.g. `{"type": "json_object"}`.
+
+        Returns:
+            str: The response content from the OpenAI API.
+
+        Raises:
+            OpenAIError: If the API call fails.
+        """
+
+        messages = self._build_messages(
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+        )
+
+        # Return a deterministic stub if client is not configured
+        if self.client is None:
+            return self._build_stub_response(user_prompt=user_prompt, model=model)
+
+        cache_key, cache_ttl = self._get_cache_entry_params(
+            messages=messages,
+            system_prompt=system_prompt,
+            model=model,
+            cache_ttl=cache_ttl,
+        )
+        if cache_ttl:
+            cached = await llm_response_cache.get_async(cache_key)
+            if cached is not None:
+                logger.debug("Serving OpenAI response from cache: %s", cache_key)
+                return cached
+
+        async_client, semaphore = self._get_async_client()
+
+        try:
+            async with semaphore:
+                logger.debug("Sending async request to OpenAI with model: %s", model)
+                response = await self._create_chat_completion_async(
+                    async_client,
+                    model=model,
+                    messages=messages,
+                    response_format=response_format or NOT_GIVEN,
+                )
+            logger.info("Received response from OpenAI.")
+            result = self._parse_content(response.choices[0].message.content)
+            await llm_response_cache.set_async(cache_key, result, ttl=cache_ttl)
+            return result
+        except OpenAIError as e:
+            logger.exception("OpenAI API error: %s", e)
+            raise
+        except Exception as e:
+            logger.exception("Unexpected error during OpenAI API call: %s", e)
+            raise
+
+    async def stream_chat_completion_async(
+        self,
+        user_prompt: str,
+        system_prompt: Optional[PromptEnum | str] = None,
+        model: str = "gpt-4o-mini",
+        cache_ttl: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streams a chat completion, yielding content deltas as they arrive.
+
+        A cached completion is yielded as a single delta, and the full streamed text is cached
+        once the stream is complete. The usage reported by the final chunk is settled with
+        the rate limiter.
+
+        Args:
+            user_prompt (str): The user's input prompt.
+            system_prompt (Optional[PromptEnum | str]): The system's context or instructions.
+            model (str): The OpenAI model to use (default: "gpt-4o-mini").
+            cache_ttl (Optional[int]): Overrides the per-prompt cache TTL in seconds; 0 disables caching.
+
+        Yields:
+            str: The next piece of the response content.
+
+        Raises:
+            OpenAIError: If the API call fails.
+        """
+
+        messages = self._build_messages(
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+        )
+
+        # Yield a deterministic stub if client is not configured
+        if self.client is None:
+            yield self._build_stub_response(user_prompt=user_prompt, model=model)[
+                "summary"
+            ]
+            return
+
+        cache_key, cache_ttl = self._get_cache_entry_params(
+            messages=messages,
+            system_prompt=system_prompt,
+            model=model,
+            cache_ttl=cache_ttl,
+        )
+        if cache_ttl:
+            cached = await llm_response_cache.get_async(cache_key)
+            if cached is not None:
+                logger.debug("Serving OpenAI response from cache: %s", cache_key)
+                yield cached if isinstance(cached, str) else json.dumps(cached)
+                return
+
+        async_client, semaphore = self._get_async_client()
+        chunks: List[str] = []
+
+        try:
+            async with semaphore:
+                logger.debug("Streaming request to OpenAI with model: %s", model)
+                stream = await self._create_chat_completion_async(
+                    async_client,
+                    model=model,
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                async for chunk in stream:
+                    # Only the final chunk has a usage, and no choices
+                    if chunk.usage:
+                        await self._settle_tokens_async(
+                            model, chunk.usage, self._estimate_tokens(messages)
+                        )
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+            logger.info("Received streamed response from OpenAI.")
+        except OpenAIError as e:
+            logger.exception("OpenAI API error: %s", e)
+            raise
+
+        await llm_response_cache.set_async(
+            cache_key, self._parse_content("".join(chunks)), ttl=cache_ttl
+        )
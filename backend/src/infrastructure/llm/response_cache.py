@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from config.settings import app_settings
+from src.schema.utils import PromptEnum
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "llm_cache:"
+
+# Per-prompt TTLs in seconds; prompts not listed here use LLM_CACHE_DEFAULT_TTL_SECONDS.
+PROMPT_CACHE_TTLS: Dict[PromptEnum, int] = {
+    PromptEnum.FINANCIAL_DATA_SYSTEM_PROMPT: 60 * 60 * 24 * 7,
+    PromptEnum.GENERATE_EVENT_TITLE_SYSTEM_PROMPT: 60 * 60 * 24,
+    PromptEnum.GENERATE_DEEP_RESEARCHED_CONTENT_SYSTEM_PROMPT: 60 * 60 * 24,
+    PromptEnum.GENERATE_SUMMARIZED_CONTENT_FROM_DEEP_RESEARCH_SYSTEM_PROMPT: 60 * 60 * 24,
+    PromptEnum.GET_SENTIMENTAL_ANALYSIS_SYSTEM_PROMPT: 60 * 60 * 24,
+    PromptEnum.GET_PRIORITY_FLAG_SYSTEM_PROMPT: 60 * 60 * 24,
+    PromptEnum.GET_COMPLIANCE_CHECK_SYSTEM_PROMPT: 60 * 60 * 24,
+}
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache for chat completions.
+
+    Entries are keyed by a hash of (model, system prompt, user prompt) and stored in two tiers:
+    an in-process LRU that serves repeats inside the same worker, and Redis that is shared by
+    every API and Celery worker. Redis failures only degrade the cache to the in-process tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = app_settings.LLM_CACHE_MAX_ENTRIES,
+        default_ttl: int = app_settings.LLM_CACHE_DEFAULT_TTL_SECONDS,
+        enabled: bool = app_settings.LLM_CACHE_ENABLED,
+        redis_host: str = app_settings.REDIS_HOST,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = Lock()
+        # Short timeouts so that a hanging Redis degrades to the in-process tier
+        # instead of blocking every completion
+        self._redis = (
+            Redis(
+                host=redis_host,
+                decode_responses=True,
+                socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            )
+            if redis_host
+            else None
+        )
+        self.hits = {"memory": 0, "redis": 0}
+        self.misses = 0
+
+    @staticmethod
+    def build_key(model: str, system_prompt: Optional[str], user_prompt: str) -> str:
+        """
+        Builds the content-addressed cache key of a completion request.
+
+        Args:
+            model (str): The OpenAI model name.
+            system_prompt (Optional[str]): The system prompt text.
+            user_prompt (str): The user prompt text.
+
+        Returns:
+            str: The cache key.
+        """
+        payload = json.dumps([model, system_prompt or "", user_prompt or ""])
+        return CACHE_KEY_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, system_prompt: Optional[PromptEnum | str]) -> int:
+        """
+        Returns the TTL in seconds for completions generated with the given system prompt.
+        """
+        if isinstance(system_prompt, PromptEnum):
+            return PROMPT_CACHE_TTLS.get(system_prompt, self.default_ttl)
+        return self.default_ttl
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit/miss counters of this process.
+        """
+        hits = self.hits["memory"] + self.hits["redis"]
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.hits["memory"],
+            "redis_hits": self.hits["redis"],
+            "misses": self.misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def _get_from_memory(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set_in_memory(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str | dict]:
+        """
+        Looks a completion up in the in-process tier first and then in Redis.
+
+        Args:
+            key (str): The cache key built by `build_key`.
+
+        Returns:
+            Optional[str | dict]: The cached completion, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+
+        value = self._get_from_memory(key)
+        if value is not None:
+            self.hits["memory"] += 1
+            return json.loads(value)
+
+        if self._redis is not None:
+            try:
+                value = self._redis.get(key)
+                if value is not None:
+                    ttl = self._redis.ttl(key)
+                    self._set_in_memory(key, value, ttl if ttl > 0 else self.default_ttl)
+                    self.hits["redis"] += 1
+                    return json.loads(value)
+            except RedisError as e:
+                logger.warning("LLM cache read from Redis failed: %s", e)
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str | dict, ttl: int) -> None:
+        """
+        Stores a completion in both tiers.
+
+        Args:
+            key (str): The cache key built by `build_key`.
+            value (str | dict): The parsed completion.
+            ttl (int): Time to live in seconds; 0 skips caching.
+        """
+        if not self.enabled or ttl <= 0:
+            return
+
+        serialized = json.dumps(value)
+        self._set_in_memory(key, serialized, ttl)
+
+        if self._redis is not None:
+            try:
+                self._redis.set(key, serialized, ex=ttl)
+            except RedisError as e:
+                logger.warning("LLM cache write to Redis failed: %s", e)
+
+    async def get_async(self, key: str) -> Optional[str | dict]:
+        """
+        Async variant of `get` that keeps Redis round-trips off the event loop.
+        """
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def set_async(self, key: str, value: str | dict, ttl: int) -> None:
+        """
+        Async variant of `set` that keeps Redis round-trips off the event loop.
+        """
+        if not self.enabled or ttl <= 0:
+            return
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+
+llm_response_cache = LLMResponseCache()
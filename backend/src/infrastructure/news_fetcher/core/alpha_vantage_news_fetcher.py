@@ -1,43 +1,94 @@
 import random
-
-import httpx
+from datetime import UTC, datetime
+from typing import AsyncIterator, Optional
 
 from config.settings import app_settings
 from src.infrastructure.news_fetcher.core.base_class import NewsFetcherBase
-from src.infrastructure.utils import get_time_range
-from src.schema.utils import GetTimeRangeResponseDTO
+from src.infrastructure.rate_limiter import send_with_rate_limit
+from src.infrastructure.utils import get_time_range, iter_json_array_items
+from src.schema.utils import (
+    FetchWatermarkDTO,
+    GetTimeRangeResponseDTO,
+    RateLimitedProviderEnum,
+)
 from static import NEWS_STATIC_DATA
 
 
 class AlphaVantageNewsFetcher(NewsFetcherBase):
-    async def fetch_news(self):
+    @staticmethod
+    def get_article_watermark(article: dict) -> Optional[FetchWatermarkDTO]:
+        """
+        Returns the `time_published` and URL of an article.
+        """
+        try:
+            published_at = datetime.strptime(
+                article.get("time_published") or "", "%Y%m%dT%H%M%S"
+            ).replace(tzinfo=UTC)
+        except ValueError:
+            return None
+        return FetchWatermarkDTO(
+            published_at=published_at, article_id=article.get("url") or ""
+        )
+
+    async def stream_news(
+        self, since: Optional[datetime] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Streams news data from Alpha Vantage API.
+
+        The `feed` array is parsed while the response downloads, so every article is
+        yielded as soon as it has been received instead of after the whole body.
+
+        With a start time, articles are requested oldest first from its minute on, so that
+        when more than `limit` articles were published, the next fetch resumes where this
+        one stopped instead of skipping the oldest ones.
+
+        Args:
+            since (Optional[datetime]): Publish time from which to fetch.
+
+        Yields:
+            dict: A news article.
+        """
+        if app_settings.FETCH_STATIC_DATA:
+            for article in random.sample(NEWS_STATIC_DATA.get("feed", []), 30):
+                yield article
+            return
+
+        time_ranges: GetTimeRangeResponseDTO = get_time_range(since)
+
+        params = {
+            "function": "NEWS_SENTIMENT",
+            "apikey": app_settings.ALPHAVANTAGE_API_KEY,
+            "time_from": time_ranges.time_from,
+            "limit": 1000,
+        }
+        if since:
+            params["sort"] = "EARLIEST"
+
+        client = self.get_http_client()
+        request = client.build_request(
+            "GET", f"{app_settings.ALPHAVANTAGE_API_BASE_URL}/query", params=params
+        )
+        response = await send_with_rate_limit(
+            RateLimitedProviderEnum.ALPHA_VANTAGE,
+            lambda: client.send(request, stream=True),
+        )
+        try:
+            self.record_rate_limit(response)
+            response.raise_for_status()
+            async for article in iter_json_array_items(response.aiter_text(), "feed"):
+                yield article
+        finally:
+            await response.aclose()
+
+    async def fetch_news(self, since: Optional[datetime] = None):
         """
         Fetches news data from Alpha Vantage API.
 
+        Args:
+            since (Optional[datetime]): Publish time from which to fetch.
+
         Returns:
             list: A list of news articles.
         """
-
-        if app_settings.FETCH_STATIC_DATA:
-            data = NEWS_STATIC_DATA.get("feed", [])
-            response = random.sample(data, 30)
-        else:
-            time_ranges: GetTimeRangeResponseDTO = get_time_range()
-
-            params = {
-                "function": "NEWS_SENTIMENT",
-                "apikey": app_settings.ALPHAVANTAGE_API_KEY,
-                "time_from": time_ranges.time_from,
-                "limit": 1000,
-            }
-
-            with httpx.Client(timeout=15) as client:
-                response = client.get(
-                    f"{app_settings.ALPHAVANTAGE_API_BASE_URL}/query",
-                    params=params,
-                )
-                response.raise_for_status()
-
-            data: dict = response.json()
-            response = data.get("feed", [])
-        return response
+        return [article async for article in self.stream_news(since=since)]
@@ -1,12 +1,96 @@
+import asyncio
 from abc import ABC, abstractmethod
+from datetime import datetime
+from threading import Lock
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from config.settings import app_settings
+from src.infrastructure.utils import parse_rate_limit_headers
+from src.schema.utils import FetchWatermarkDTO, RateLimitDTO
 
 
 class NewsFetcherBase(ABC):
+    # One pooled HTTP client per event loop, shared by every fetcher so that connections
+    # to the news APIs are kept alive between calls. Clients cannot be shared across
+    # loops, and each Celery task runs its own loop.
+    _http_clients: WeakKeyDictionary = WeakKeyDictionary()
+    _http_clients_lock = Lock()
+
+    def __init__(self):
+        # Most restrictive rate-limit state reported by the API during this fetch
+        self.rate_limit: Optional[RateLimitDTO] = None
+
+    def record_rate_limit(self, response: httpx.Response) -> None:
+        """
+        Keeps the rate-limit state of a response if it leaves fewer requests than the
+        state recorded so far.
+        """
+        rate_limit = parse_rate_limit_headers(response.headers, response.status_code)
+        if rate_limit is None:
+            return
+        if (
+            self.rate_limit is None
+            or self.rate_limit.remaining is None
+            or (
+                rate_limit.remaining is not None
+                and rate_limit.remaining <= self.rate_limit.remaining
+            )
+        ):
+            self.rate_limit = rate_limit
+
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        """
+        Returns the shared HTTP client of the running event loop.
+
+        Returns:
+            httpx.AsyncClient: The pooled client.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._http_clients_lock:
+            client = cls._http_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    timeout=app_settings.NEWS_FETCHER_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=app_settings.NEWS_FETCHER_MAX_CONNECTIONS,
+                        max_keepalive_connections=app_settings.NEWS_FETCHER_MAX_KEEPALIVE_CONNECTIONS,
+                    ),
+                )
+                cls._http_clients[loop] = client
+        return client
+
+    @classmethod
+    async def close_http_client(cls) -> None:
+        """
+        Closes the shared HTTP client of the running event loop, if any.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._http_clients_lock:
+            client = cls._http_clients.pop(loop, None)
+        if client:
+            await client.aclose()
+
+    @staticmethod
+    @abstractmethod
+    def get_article_watermark(article: dict) -> Optional[FetchWatermarkDTO]:
+        """
+        Returns the publish time and ID of an article, if it has a publish time.
+        """
+        pass
+
     @abstractmethod
-    async def fetch_news(self):
+    async def fetch_news(self, since: Optional[datetime] = None):
         """
         Fetch news articles from the third-party API.
 
+        Args:
+            since (Optional[datetime]): Only articles published from then on are
+                requested.
+
         Returns:
             List[Dict]: A list of news articles.
         """
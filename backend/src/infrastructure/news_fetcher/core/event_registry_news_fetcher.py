@@ -1,55 +1,126 @@
+import asyncio
 import random
 from datetime import UTC, datetime
+from threading import Lock
 from typing import Optional
+from weakref import WeakKeyDictionary
 
 import httpx
 
 from config.settings import app_settings
 from src.infrastructure.news_fetcher.core.base_class import NewsFetcherBase
+from src.infrastructure.rate_limiter import send_with_rate_limit
+from src.schema.utils import FetchWatermarkDTO, RateLimitedProviderEnum
 from static import NEWS_STATIC_DATA
 
 
 class EventRegistryNewsFetcher(NewsFetcherBase):
-    async def fetch_news(self, keyword: Optional[str] = None):
+    # Caps the requests in flight to Event Registry per event loop, across pages and
+    # concurrent keyword searches.
+    _request_semaphores: WeakKeyDictionary = WeakKeyDictionary()
+    _request_semaphores_lock = Lock()
+
+    @classmethod
+    def _get_request_semaphore(cls) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with cls._request_semaphores_lock:
+            semaphore = cls._request_semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(
+                    app_settings.EVENT_REGISTRY_MAX_CONCURRENT_REQUESTS
+                )
+                cls._request_semaphores[loop] = semaphore
+        return semaphore
+
+    @staticmethod
+    def get_article_watermark(article: dict) -> Optional[FetchWatermarkDTO]:
+        """
+        Returns the `dateTimePub` (or `dateTime`) and URI of an article.
+        """
+        published = article.get("dateTimePub") or article.get("dateTime")
+        if not published:
+            return None
+        try:
+            published_at = datetime.fromisoformat(published.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=UTC)
+        return FetchWatermarkDTO(
+            published_at=published_at,
+            article_id=article.get("uri") or article.get("url") or "",
+        )
+
+    async def _fetch_page(
+        self, client: httpx.AsyncClient, payload: dict, page: int
+    ) -> dict:
+        """
+        Fetches one page of articles.
+
+        Args:
+            client (httpx.AsyncClient): The shared HTTP client.
+            payload (dict): The request body without the page number.
+            page (int): The page to fetch, starting at 1.
+
+        Returns:
+            dict: The `articles` object of the response.
+        """
+        async with self._get_request_semaphore():
+            response = await send_with_rate_limit(
+                RateLimitedProviderEnum.EVENT_REGISTRY,
+                lambda: client.post(
+                    app_settings.NEWS_API_BASE_URL,
+                    json={**payload, "articlesPage": page},
+                ),
+            )
+        self.record_rate_limit(response)
+        response.raise_for_status()
+        return response.json().get("articles", {})
+
+    async def fetch_news(
+        self,
+        keyword: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ):
         """
         Fetches all news data from Event Registry API, paginating through all results.
 
+        The first page tells how many pages there are; the remaining ones are then fetched
+        concurrently, at most `EVENT_REGISTRY_MAX_CONCURRENT_REQUESTS` at a time.
+
         Args:
             keyword (str, optional): Specific keyword to search for. Defaults to None.
+            since (Optional[datetime]): Publish time from which to fetch; pages start
+                from its date instead of today.
 
         Returns:
-            list: A list of news articles.
+            list: A list of news articles, in page order.
         """
         if app_settings.FETCH_STATIC_DATA:
             return random.sample(NEWS_STATIC_DATA.get("feed", []), 30)
 
-        base_url = app_settings.NEWS_API_BASE_URL
-        current_date = datetime.now(UTC).strftime("%Y-%m-%d")
+        date_start = since.astimezone(UTC) if since else datetime.now(UTC)
 
         payload = {
             "apiKey": app_settings.NEWS_API_KEY,
-            "dateStart": current_date,
-            "articlesPage": 1,
+            "dateStart": date_start.strftime("%Y-%m-%d"),
         }
 
         if keyword:
             payload["keyword"] = [keyword]
 
-        all_articles = []
-
-        async with httpx.AsyncClient(timeout=15) as client:
-            while True:
-                response = await client.post(base_url, json=payload)
-                response.raise_for_status()
-                data: dict = response.json()
-                articles = data.get("articles", {}).get("results", [])
-                all_articles.extend(articles)
-
-                # Check if we've reached the last page
-                total_pages = data.get("articles", {}).get("pages", 1)
-                if payload["articlesPage"] >= total_pages:
-                    break
+        client = self.get_http_client()
+        first_page = await self._fetch_page(client, payload, page=1)
+        all_articles = list(first_page.get("results", []))
 
-                payload["articlesPage"] += 1
+        total_pages = first_page.get("pages", 1)
+        pages = await asyncio.gather(
+            *(
+                self._fetch_page(client, payload, page=page)
+                for page in range(2, total_pages + 1)
+            )
+        )
+        for page in pages:
+            all_articles.extend(page.get("results", []))
 
         return all_articles
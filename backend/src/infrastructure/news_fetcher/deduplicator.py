@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import List, Optional, Set
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from config.settings import app_settings
+from src.schema.utils import DeduplicatedArticlesDTO
+
+logger = logging.getLogger(__name__)
+
+DEDUP_KEY_PREFIX = "article_seen:"
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalizes a title so that cosmetic differences do not defeat deduplication.
+
+    Accents, punctuation, casing and repeated whitespace are removed.
+    """
+    title = unicodedata.normalize("NFKD", title or "")
+    title = "".join(char for char in title if not unicodedata.combining(char))
+    title = re.sub(r"[^\w\s]", " ", title.lower())
+    return " ".join(title.split())
+
+
+def _fingerprint(kind: str, value: str) -> str:
+    digest = hashlib.sha1(value.encode("utf-8")).hexdigest()
+    return f"{DEDUP_KEY_PREFIX}{kind}:{digest}"
+
+
+class ArticleDeduplicator:
+    """
+    Drops articles that were already ingested within the retention window.
+
+    An article is a duplicate when either its URL or its normalized title has been seen
+    before. `deduplicate` only reads the fingerprints; `mark_seen` stores them with
+    `SET EX` once the articles have been ingested, so an article whose processing fails
+    is fetched again instead of being lost for the retention window. Without Redis only
+    duplicates inside the same fetch are dropped.
+    """
+
+    def __init__(
+        self,
+        retention_seconds: int = app_settings.ARTICLE_DEDUP_RETENTION_SECONDS,
+        redis_host: str = app_settings.REDIS_HOST,
+    ):
+        self.retention_seconds = retention_seconds
+        self._redis: Optional[Redis] = (
+            Redis(
+                host=redis_host,
+                decode_responses=True,
+                socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            )
+            if redis_host
+            else None
+        )
+
+    @staticmethod
+    def get_fingerprints(article: dict) -> List[str]:
+        """
+        Returns the URL and normalized-title fingerprints of an article.
+        """
+        fingerprints = []
+        url = (article.get("url") or "").strip()
+        if url:
+            fingerprints.append(_fingerprint("url", url))
+        title = normalize_title(article.get("title", ""))
+        if title:
+            fingerprints.append(_fingerprint("title", title))
+        return fingerprints
+
+    def _get_seen(self, fingerprints_per_article: List[List[str]]) -> List[bool]:
+        """
+        Looks every fingerprint up in one pipeline round-trip.
+
+        Returns:
+            List[bool]: Whether any fingerprint of each article has been seen.
+        """
+        pipe = self._redis.pipeline(transaction=False)
+        for fingerprints in fingerprints_per_article:
+            for fingerprint in fingerprints:
+                pipe.exists(fingerprint)
+        results = iter(pipe.execute())
+        return [
+            any([bool(next(results)) for _ in fingerprints])
+            for fingerprints in fingerprints_per_article
+        ]
+
+    def deduplicate(
+        self, articles: List[dict], seen_in_fetch: Optional[Set[str]] = None
+    ) -> DeduplicatedArticlesDTO:
+        """
+        Filters out articles that were already seen, without marking any as seen.
+
+        Args:
+            articles (List[dict]): Articles returned by a news fetcher.
+            seen_in_fetch (Optional[Set[str]]): Fingerprints of the earlier batches of
+                the same fetch, updated with the new articles.
+
+        Returns:
+            DeduplicatedArticlesDTO: The new articles and the number of dropped duplicates.
+        """
+        unique_articles = []
+        fingerprints_per_article = []
+        if seen_in_fetch is None:
+            seen_in_fetch = set()
+
+        for article in articles:
+            fingerprints = self.get_fingerprints(article)
+            if not fingerprints or seen_in_fetch.intersection(fingerprints):
+                continue
+            seen_in_fetch.update(fingerprints)
+            unique_articles.append(article)
+            fingerprints_per_article.append(fingerprints)
+
+        if self._redis is not None and unique_articles:
+            try:
+                seen = self._get_seen(fingerprints_per_article)
+                unique_articles = [
+                    article
+                    for article, is_seen in zip(unique_articles, seen)
+                    if not is_seen
+                ]
+            except RedisError as e:
+                logger.warning("Article dedup against Redis failed: %s", e)
+
+        return DeduplicatedArticlesDTO(
+            articles=unique_articles,
+            dropped=len(articles) - len(unique_articles),
+        )
+
+    def mark_seen(self, articles: List[dict]) -> None:
+        """
+        Stores the fingerprints of ingested articles for the retention window.
+
+        Args:
+            articles (List[dict]): Articles that have been ingested.
+        """
+        if self._redis is None or not articles:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for article in articles:
+                for fingerprint in self.get_fingerprints(article):
+                    pipe.set(fingerprint, 1, ex=self.retention_seconds)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning("Marking articles as seen in Redis failed: %s", e)
@@ -1,5 +1,6 @@
 import json
 import logging
+from typing import AsyncIterator, List, Optional
 
 from src.infrastructure.llm.openai_service import OpenAIServices
 from src.schema.utils import PromptEnum
@@ -23,55 +24,170 @@ class NewsFetcherLLMService:
                 system_prompt=PromptEnum.FINANCIAL_DATA_SYSTEM_PROMPT,
                 user_prompt=f"{json.dumps(article)}.\nNOTE [IMPORTANT]: Make sure to provide the JSON response only.",
             )
-        else:
-            return response
+        return response if isinstance(response, dict) else {}
 
-    def generate_event_title(self, article: dict):
-        result = self.openai_services.get_chat_completion(
+    def classify_financial_data_batch(self, articles: List[dict]) -> List[dict]:
+        """
+        Classifies many articles with a single chat completion.
+
+        The articles are sent as one indexed JSON array and the model answers with one verdict
+        per index. If the answer cannot be parsed or does not cover every index, each article
+        of the batch falls back to `classify_financial_data`; an article that still fails
+        is treated as non-financial.
+
+        Args:
+            articles (List[dict]): The articles to classify.
+
+        Returns:
+            List[dict]: One classification per article, in the same order as `articles`.
+        """
+        if not articles:
+            return []
+
+        indexed_articles = [
+            {"index": index, "article": article} for index, article in enumerate(articles)
+        ]
+        user_prompt = (
+            f"Classify each of the following {len(articles)} articles independently.\n"
+            f"{json.dumps(indexed_articles)}\n"
+            'NOTE [IMPORTANT]: Respond with a JSON object only, shaped as {"results": '
+            '[{"index": <article index>, "is_financial": <true|false>}, ...]} with exactly '
+            "one entry per article index."
+        )
+
+        try:
+            response = self.openai_services.get_chat_completion(
+                system_prompt=PromptEnum.FINANCIAL_DATA_SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+            )
+            classifications = self._parse_batch_classification(
+                response=response, size=len(articles)
+            )
+        except Exception as e:
+            logger.warning("Batch classification failed: %s", e)
+            classifications = None
+
+        if classifications is None:
+            logger.info(
+                "Batch classification could not be parsed, classifying %s articles one by one",
+                len(articles),
+            )
+            classifications = [
+                self._classify_financial_data_or_skip(article) for article in articles
+            ]
+        return classifications
+
+    def _classify_financial_data_or_skip(self, article: dict) -> dict:
+        """
+        Classifies one article, treating it as non-financial if classification fails so
+        that one article cannot abort the whole fetch.
+        """
+        try:
+            return self.classify_financial_data(article)
+        except Exception as e:
+            logger.warning(
+                "Classification failed for article %s: %s", article.get("url"), e
+            )
+            return {}
+
+    @staticmethod
+    def _parse_batch_classification(
+        response: str | dict, size: int
+    ) -> Optional[List[dict]]:
+        """
+        Aligns a batch classification response with the article indexes.
+
+        Returns:
+            Optional[List[dict]]: The verdicts ordered by index, or None if the response is invalid.
+        """
+        if isinstance(response, str):
+            try:
+                response = json.loads(response)
+            except json.JSONDecodeError:
+                return None
+
+        results = response.get("results") if isinstance(response, dict) else response
+        if not isinstance(results, list):
+            return None
+
+        classifications: List[Optional[dict]] = [None] * size
+        for result in results:
+            if not isinstance(result, dict):
+                return None
+            index = result.get("index")
+            if (
+                not isinstance(index, int)
+                or not 0 <= index < size
+                or classifications[index] is not None
+                or not isinstance(result.get("is_financial"), bool)
+            ):
+                return None
+            classifications[index] = result
+
+        if any(classification is None for classification in classifications):
+            return None
+        return classifications
+
+    async def generate_event_title(self, article: dict):
+        result = await self.openai_services.get_chat_completion_async(
             system_prompt=PromptEnum.GENERATE_EVENT_TITLE_SYSTEM_PROMPT,
             user_prompt=f"{json.dumps(article)}",
         )
         return result
 
-    def get_deep_researched_content(self, article: dict):
-        result = self.openai_services.get_chat_completion(
+    async def get_deep_researched_content(self, article: dict):
+        result = await self.openai_services.get_chat_completion_async(
             system_prompt=PromptEnum.GENERATE_DEEP_RESEARCHED_CONTENT_SYSTEM_PROMPT,
             user_prompt=f"{json.dumps(article)}",
         )
         return result
 
-    def fetch_summarized_content_from_deep_research(
+    def stream_deep_researched_content(self, article: dict) -> AsyncIterator[str]:
+        return self.openai_services.stream_chat_completion_async(
+            system_prompt=PromptEnum.GENERATE_DEEP_RESEARCHED_CONTENT_SYSTEM_PROMPT,
+            user_prompt=f"{json.dumps(article)}",
+        )
+
+    async def fetch_summarized_content_from_deep_research(
         self,
         deep_research_content: str,
     ):
-        result = self.openai_services.get_chat_completion(
+        result = await self.openai_services.get_chat_completion_async(
             system_prompt=PromptEnum.GENERATE_SUMMARIZED_CONTENT_FROM_DEEP_RESEARCH_SYSTEM_PROMPT,
             user_prompt=deep_research_content,
         )
         return result
 
-    def fetch_sentimental_analysis(self, article: dict):
-        result = self.openai_services.get_chat_completion(
+    async def fetch_sentimental_analysis(self, article: dict):
+        result = await self.openai_services.get_chat_completion_async(
             system_prompt=PromptEnum.GET_SENTIMENTAL_ANALYSIS_SYSTEM_PROMPT,
             user_prompt=f"{json.dumps(article)}",
         )
         return result
 
-    def fetch_priority_flag(self, article: dict):
-        result = self.openai_services.get_chat_completion(
+    async def fetch_priority_flag(self, article: dict):
+        result = await self.openai_services.get_chat_completion_async(
             system_prompt=PromptEnum.GET_PRIORITY_FLAG_SYSTEM_PROMPT,
             user_prompt=f"{json.dumps(article)}",
         )
         return result
 
-    def fetch_compliance_check(self, article: dict):
-        result = self.openai_services.get_chat_completion(
+    async def fetch_compliance_check(self, article: dict):
+        result = await self.openai_services.get_chat_completion_async(
             system_prompt=PromptEnum.GET_COMPLIANCE_CHECK_SYSTEM_PROMPT,
             user_prompt=f"{json.dumps(article)}",
         )
         return result
 
-    def generate_keyword_combinations(self, title: str) -> list[str]:
+    async def fetch_market_event_analytics(self, article: dict):
+        result = await self.openai_services.get_chat_completion_async(
+            system_prompt=PromptEnum.GET_MARKET_EVENT_ANALYTICS_SYSTEM_PROMPT,
+            user_prompt=f"{json.dumps(article)}",
+            response_format={"type": "json_object"},
+        )
+        return result
+
+    async def generate_keyword_combinations(self, title: str) -> list[str]:
         """
         Generate intelligent keyword combinations using OpenAI.
 
@@ -94,7 +210,7 @@ class NewsFetcherLLMService:
         user_prompt = f"Generate search keywords for the title: {title}"
 
         try:
-            response = self.openai_services.get_chat_completion(
+            response = await self.openai_services.get_chat_completion_async(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
             )
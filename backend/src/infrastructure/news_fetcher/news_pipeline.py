@@ -1,4 +1,8 @@
+import asyncio
 import logging
+from typing import AsyncIterator
+
+from pydantic import ValidationError
 
 from src.domain.enums import PriorityFlag, SentimentalAnalysis
 from src.infrastructure.news_fetcher.core.event_registry_news_fetcher import (
@@ -7,6 +11,7 @@ from src.infrastructure.news_fetcher.core.event_registry_news_fetcher import (
 from src.infrastructure.news_fetcher.news_fetcher_llm_services import (
     NewsFetcherLLMService,
 )
+from src.schema.market_events import MarketEventAnalyticsSchema
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +23,8 @@ class NewsPipeline:
     Step 3: Assign for deep researching and analysis to perplexity (status: researching)
     Step 4: Fetch the content source of the classified financial data and broadcast it (status: researching)
     Step 5: Fetch the deep_research and summarize it as per the best content (status: writing)
-    Step 6: Fetch the sentimental analysis of the classified financial data and broadcast it (status: analyzing sentiment)
-    Step 7: Fetch the priority flag of the classified financial data and broadcast it (status: assigning priority)
-    Step 8: Fetch the compliance check status of the classified financial data and broadcast it (status: checking compliance)
+    Step 6: Fetch the sentimental analysis, priority flag and compliance check of the classified financial data
+            in a single completion and broadcast each of them (status: fetching analytics)
     """
 
     def __init__(self):
@@ -31,30 +35,64 @@ class NewsPipeline:
         logger.info(f"\nClassifying financial article: {article.get('title')}")
         return self.news_fetcher_llm_services.classify_financial_data(article)
 
-    def generate_ai_processing_title(self, article: dict):
+    def filter_financial_articles(self, articles: list, batch_size: int) -> list:
+        """
+        Keeps only the financial articles, classifying them `batch_size` at a time.
+
+        Args:
+            articles (list): The articles to classify.
+            batch_size (int): Number of articles sent in one classification request.
+
+        Returns:
+            list: The articles classified as financial, in their original order.
+        """
+        financial_articles = []
+        for start in range(0, len(articles), batch_size):
+            end = start + batch_size
+            batch = articles[start:end]
+            logger.info(f"\nClassifying batch of {len(batch)} financial articles")
+            classifications = (
+                self.news_fetcher_llm_services.classify_financial_data_batch(batch)
+            )
+            financial_articles.extend(
+                article
+                for article, classification in zip(batch, classifications)
+                if classification.get("is_financial")
+            )
+        return financial_articles
+
+    async def generate_ai_processing_title(self, article: dict):
         logger.info(
             f"\nGenerating AI processing title for article: {article.get('title')}"
         )
-        return self.news_fetcher_llm_services.generate_event_title(article)
+        return await self.news_fetcher_llm_services.generate_event_title(article)
 
-    def deep_research_financial_article(self, article: dict):
+    async def deep_research_financial_article(self, article: dict):
         logger.info(f"\nDeep researching financial article: {article.get('title')}")
-        return self.news_fetcher_llm_services.get_deep_researched_content(article)
+        return await self.news_fetcher_llm_services.get_deep_researched_content(
+            article
+        )
+
+    def stream_deep_research_financial_article(
+        self, article: dict
+    ) -> AsyncIterator[str]:
+        logger.info(f"\nStreaming deep research for article: {article.get('title')}")
+        return self.news_fetcher_llm_services.stream_deep_researched_content(article)
 
-    def fetch_summarized_content_from_deep_research(self, deep_research_content: str):
+    async def fetch_summarized_content_from_deep_research(
+        self, deep_research_content: str
+    ):
         logger.info("\nFetching summarized content from deep research for article")
-        return (
-            self.news_fetcher_llm_services.fetch_summarized_content_from_deep_research(
-                deep_research_content=deep_research_content
-            )
+        return await self.news_fetcher_llm_services.fetch_summarized_content_from_deep_research(
+            deep_research_content=deep_research_content
         )
 
-    def fetch_sentimental_analysis(self, article: dict) -> SentimentalAnalysis | None:
+    async def fetch_sentimental_analysis(self, article: dict) -> SentimentalAnalysis | None:
         logger.info(
             f"\nFetching sentimental analysis for article: {article.get('title')}"
         )
         sentimental_analysis = (
-            self.news_fetcher_llm_services.fetch_sentimental_analysis(article)
+            await self.news_fetcher_llm_services.fetch_sentimental_analysis(article)
         )
         match sentimental_analysis:
             case SentimentalAnalysis.POSITIVE.value:
@@ -67,9 +105,11 @@ class NewsPipeline:
                 sentimental_analysis = None
         return sentimental_analysis
 
-    def fetch_priority_flag(self, article: dict) -> PriorityFlag | None:
+    async def fetch_priority_flag(self, article: dict) -> PriorityFlag | None:
         logger.info(f"\nFetching priority flag for article: {article.get('title')}")
-        priority_flag = self.news_fetcher_llm_services.fetch_priority_flag(article)
+        priority_flag = await self.news_fetcher_llm_services.fetch_priority_flag(
+            article
+        )
         match priority_flag:
             case PriorityFlag.HIGH.value:
                 priority_flag = PriorityFlag.HIGH
@@ -81,12 +121,52 @@ class NewsPipeline:
                 priority_flag = None
         return priority_flag
 
-    def fetch_compliance_check(self, article: dict):
+    async def fetch_compliance_check(self, article: dict):
         logger.info(f"\nFetching compliance check for article: {article.get('title')}")
-        return self.news_fetcher_llm_services.fetch_compliance_check(article)
+        return await self.news_fetcher_llm_services.fetch_compliance_check(article)
+
+    async def fetch_market_event_analytics(self, article: dict) -> dict:
+        """
+        Fetches sentiment, priority and compliance of an article in a single completion.
 
-    def generate_keyword_combinations(self, title: str):
-        return self.news_fetcher_llm_services.generate_keyword_combinations(title)
+        Falls back to the three individual analytics calls when the combined answer is not
+        valid JSON or does not validate against MarketEventAnalyticsSchema.
+
+        Args:
+            article (dict): The article to analyse.
+
+        Returns:
+            dict: The sentimental_analysis, priority_flag and compliance_check of the article.
+        """
+        logger.info(f"\nFetching analytics for article: {article.get('title')}")
+        try:
+            analytics = (
+                await self.news_fetcher_llm_services.fetch_market_event_analytics(article)
+            )
+            return MarketEventAnalyticsSchema.model_validate(analytics).model_dump()
+        except ValidationError as e:
+            logger.warning(
+                f"Combined analytics invalid, fetching individually: {e.error_count()} errors"
+            )
+        except ValueError as e:
+            # Malformed or truncated JSON fails to decode before it can be validated
+            logger.warning(f"Combined analytics not JSON, fetching individually: {e}")
+
+        sentimental_analysis, priority_flag, compliance_check = await asyncio.gather(
+            self.fetch_sentimental_analysis(article),
+            self.fetch_priority_flag(article),
+            self.fetch_compliance_check(article),
+        )
+        return {
+            "sentimental_analysis": sentimental_analysis,
+            "priority_flag": priority_flag,
+            "compliance_check": compliance_check,
+        }
+
+    async def generate_keyword_combinations(self, title: str):
+        return await self.news_fetcher_llm_services.generate_keyword_combinations(
+            title
+        )
 
     def research_customized_content(self, articles: list):
         logger.info("\nDeep researching customized content for articles")
@@ -106,19 +186,25 @@ class NewsPipeline:
         seen_urls = set()
 
         # Generate keyword combinations using OpenAI
-        keyword_combinations = self.generate_keyword_combinations(title=title)
+        keyword_combinations = await self.generate_keyword_combinations(title=title)
 
-        # Try each combination
-        for keyword in keyword_combinations:
-            articles = await self.event_registry_news_fetcher.fetch_news(
-                keyword=keyword
+        # Search every combination concurrently, keeping articles in arrival order
+        searches = [
+            asyncio.create_task(
+                self.event_registry_news_fetcher.fetch_news(keyword=keyword)
             )
-
-            # Add only unique articles based on URL
-            for article in articles:
-                url = article.get("url")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_articles.append(article)
+            for keyword in keyword_combinations
+        ]
+        try:
+            for search in asyncio.as_completed(searches):
+                # Add only unique articles based on URL
+                for article in await search:
+                    url = article.get("url")
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
+                        all_articles.append(article)
+        finally:
+            for search in searches:
+                search.cancel()
 
         return all_articles
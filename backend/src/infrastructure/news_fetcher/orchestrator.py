@@ -1,71 +1,242 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from celery import group
+
+from config.db_connection import db_service
+from config.settings import app_settings
 from src.celery_worker import celery_app
 from src.domain.enums import MarketEvenProcessingtStatus, MarketEventSource, PostStatus
 from src.domain.market_events.services import (
     MarketEventDataClass,
     MarketEventDomainServices,
-    MarketEventFactory,
 )
 from src.domain.posts.services import PostDataClass, PostDomainServices, PostFactory
+from src.infrastructure.llm.openai_service import OpenAIServices
 from src.infrastructure.news_fetcher.news_pipeline import NewsPipeline
-from src.infrastructure.utils import get_current_timestamp_with_timezone
-from src.infrastructure.websockets.redis_listener import publish_updates
-from src.schema.market_events import RunTimeMarketEventSchema, UpdateMarketEventSchema
-from src.schema.utils import WebsocketMessageTypesEnum
+from src.infrastructure.news_fetcher.step_graph import PipelineStep, run_step_graph
+from src.infrastructure.utils import (
+    batch_text_stream,
+    get_current_timestamp_with_timezone,
+)
+from src.infrastructure.websockets.redis_listener import (
+    publish_many_updates,
+    publish_updates,
+)
+from src.schema.market_events import (
+    MarketEventContentCompleteSchema,
+    MarketEventContentDeltaSchema,
+    MarketEventDeltaSchema,
+    RunTimeMarketEventSchema,
+    UpdateMarketEventSchema,
+)
+from src.schema.utils import RedisPublishMessageDTO, WebsocketMessageTypesEnum
 
 logger = logging.getLogger(__name__)
 
 pipeline = NewsPipeline()
-market_event_domain_services = MarketEventDomainServices()
-post_domain_services = PostDomainServices()
 
 
-@celery_app.task
-def process_article_task(
-    article: Dict[str, Any],
+class MarketEventStagePublisher:
+    """
+    Publishes the stages of one market event as versioned updates, in version order.
+
+    Clients get the full event once, then only the fields each stage changed, as a delta
+    from the previous version. Steps finish concurrently, so building and publishing an
+    update happen under one lock: version N is in Redis before N + 1 is built.
+    """
+
+    def __init__(
+        self, runtime_market_event_dto: RunTimeMarketEventSchema, user_id: Optional[str]
+    ):
+        self.runtime_market_event_dto = runtime_market_event_dto
+        self.user_id = user_id
+        self.data_type = (
+            WebsocketMessageTypesEnum.USER_CUSTOM_EVENT
+            if user_id
+            else WebsocketMessageTypesEnum.LIVE_EVENTS
+        )
+        self._published_snapshot: Dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+
+    def _build_message(self, **fields) -> RedisPublishMessageDTO:
+        dto = self.runtime_market_event_dto
+        for field, value in fields.items():
+            setattr(dto, field, value)
+        dto.updated_at = get_current_timestamp_with_timezone()
+        dto.version += 1
+        snapshot = dto.model_dump(exclude={"updated_at", "version"})
+
+        if not self._published_snapshot:
+            self._published_snapshot.update(snapshot)
+            return RedisPublishMessageDTO(
+                data_type=self.data_type,
+                data=dto.model_dump(),
+                user_id=self.user_id,
+            )
+
+        changes = {
+            field: value
+            for field, value in snapshot.items()
+            if self._published_snapshot.get(field) != value
+        }
+        self._published_snapshot.update(changes)
+        return RedisPublishMessageDTO(
+            data_type=WebsocketMessageTypesEnum.MARKET_EVENT_DELTA,
+            data=MarketEventDeltaSchema(
+                id=dto.id,
+                base_version=dto.version - 1,
+                version=dto.version,
+                changes=changes,
+                updated_at=dto.updated_at,
+            ).model_dump(),
+            user_id=self.user_id,
+        )
+
+    async def publish(self, *stages: Dict[str, Any]) -> None:
+        """
+        Publishes one update per stage in a single round-trip, each on top of the last.
+
+        Args:
+            *stages (Dict[str, Any]): The fields set by each stage.
+        """
+        async with self._lock:
+            await publish_many_updates(
+                messages=[self._build_message(**fields) for fields in stages]
+            )
+
+    async def publish_streamed_content(
+        self, field: str, content: str, sequence: int
+    ) -> None:
+        """
+        Publishes the completion of a field whose content was streamed as deltas.
+
+        Clients assembled the content from the deltas, so it is left out of the next
+        stage update; it is only sent again to clients whose stream was cut.
+
+        Args:
+            field (str): The streamed field.
+            content (str): The concatenated deltas.
+            sequence (int): The sequence number of the last delta.
+        """
+        async with self._lock:
+            setattr(self.runtime_market_event_dto, field, content)
+            if self._published_snapshot:
+                self._published_snapshot[field] = content
+            await publish_updates(
+                user_id=self.user_id,
+                data_type=WebsocketMessageTypesEnum.MARKET_EVENT_CONTENT_COMPLETE,
+                data=MarketEventContentCompleteSchema(
+                    id=self.runtime_market_event_dto.id,
+                    field=field,
+                    sequence=sequence,
+                    length=len(content),
+                    content=content,
+                    updated_at=get_current_timestamp_with_timezone(),
+                ).model_dump(),
+            )
+
+
+def create_market_events_from_articles(
+    articles: List[Dict[str, Any]],
     source: MarketEventSource,
     user_id: Optional[str] = None,
-) -> None:
-    try:
-        if not user_id:
-            classification = pipeline.classify_financial_article(article)
+) -> List[RunTimeMarketEventSchema]:
+    """
+    Inserts one market event per article in a single round-trip.
 
-            if not classification.get("is_financial"):
-                logger.info(f"Article skipped: {article.get('title')}")
-                return
+    Args:
+        articles (List[Dict[str, Any]]): The accepted articles.
+        source (MarketEventSource): The source the articles were fetched from.
+        user_id (Optional[str]): The user who requested a custom event, if any.
 
-        market_event_dataclass = MarketEventDataClass(
+    Returns:
+        List[RunTimeMarketEventSchema]: The runtime DTO of every created event, in
+        article order.
+    """
+    market_events_data = [
+        MarketEventDataClass(
             title=article["title"],
             description=article["summary"],
             processing_status=MarketEvenProcessingtStatus.RESEARCHING,
             source=source,
             is_customized=True if user_id else False,
         )
-        market_event_data = MarketEventFactory.build_entity_with_id(
-            data=market_event_dataclass
-        )
-        market_event_domain_services.create_market_event(
-            market_event_data=market_event_data
+        for article in articles
+    ]
+    with db_service.session_scope() as db_session:
+        ids = MarketEventDomainServices(db_session=db_session).create_market_events(
+            market_events_data=market_events_data
         )
 
-        runtime_market_event_dto = RunTimeMarketEventSchema(
-            id=str(market_event_data.id),
-            title=market_event_dataclass.title,
+    return [
+        RunTimeMarketEventSchema(
+            id=str(id),
+            title=market_event_data.title,
             banner=None,
             sentimental_analysis=None,
             priority_flag=None,
             compliance_check=None,
-            description=market_event_dataclass.description,
+            description=market_event_data.description,
             deep_research_content=None,
             ai_generated_summarized_content=None,
-            processing_status=market_event_dataclass.processing_status,
-            source=market_event_dataclass.source,
+            processing_status=market_event_data.processing_status,
+            source=market_event_data.source,
             editable=False,
             updated_at=get_current_timestamp_with_timezone(),
         )
+        for id, market_event_data in zip(ids, market_events_data)
+    ]
+
+
+def ingest_articles(articles: List[Dict[str, Any]], source: MarketEventSource) -> None:
+    """
+    Creates the market events of a classified fetch in bulk and fans their enrichment
+    out to Celery.
+
+    Args:
+        articles (List[Dict[str, Any]]): The deduplicated, financial articles.
+        source (MarketEventSource): The source the articles were fetched from.
+    """
+    if not articles:
+        return
+
+    runtime_market_event_dtos = create_market_events_from_articles(
+        articles=articles, source=source
+    )
+    logger.info("Created %s market events from %s", len(articles), source.value)
+
+    group(
+        broadcast_market_event_update_task.s(
+            runtime_market_event_dto.model_dump(), article
+        )
+        for runtime_market_event_dto, article in zip(
+            runtime_market_event_dtos, articles
+        )
+    ).apply_async()
+
+
+@celery_app.task
+def process_article_task(
+    article: Dict[str, Any],
+    source: MarketEventSource,
+    user_id: str,
+) -> None:
+    """
+    Creates the market event of a user's custom event and starts its enrichment.
+
+    Fetched articles are classified and ingested in bulk by `ingest_articles` instead.
+
+    Args:
+        article (Dict[str, Any]): The article built from the custom event title.
+        source (MarketEventSource): The source of the custom event.
+        user_id (str): The user who requested the custom event.
+    """
+    try:
+        [runtime_market_event_dto] = create_market_events_from_articles(
+            articles=[article], source=source, user_id=user_id
+        )
 
         broadcast_market_event_update_task.delay(
             runtime_market_event_dto.model_dump(),
@@ -96,137 +267,146 @@ def broadcast_market_event_update_task(
 
         async def process_updates():
             try:
-                # Generate AI processing title
-                runtime_market_event_dto.banner = pipeline.generate_ai_processing_title(
-                    article
-                )
-                runtime_market_event_dto.updated_at = (
-                    get_current_timestamp_with_timezone()
-                )
-                await publish_updates(
-                    user_id=user_id,
-                    data_type=WebsocketMessageTypesEnum.USER_CUSTOM_EVENT
-                    if user_id
-                    else WebsocketMessageTypesEnum.LIVE_EVENTS,
-                    data=runtime_market_event_dto.model_dump(),
+                stage_publisher = MarketEventStagePublisher(
+                    runtime_market_event_dto, user_id
                 )
 
-                # Deep research financial articles
-                runtime_market_event_dto.deep_research_content = (
-                    pipeline.deep_research_financial_article(article)
-                )
-                runtime_market_event_dto.processing_status = (
-                    MarketEvenProcessingtStatus.WRITING
-                )
-                runtime_market_event_dto.updated_at = (
-                    get_current_timestamp_with_timezone()
-                )
-                await publish_updates(
-                    user_id=user_id,
-                    data_type=WebsocketMessageTypesEnum.USER_CUSTOM_EVENT
-                    if user_id
-                    else WebsocketMessageTypesEnum.LIVE_EVENTS,
-                    data=runtime_market_event_dto.model_dump(),
-                )
+                async def publish_stage(**fields):
+                    await stage_publisher.publish(fields)
 
-                # Fetch summarized content
-                runtime_market_event_dto.ai_generated_summarized_content = pipeline.fetch_summarized_content_from_deep_research(
-                    deep_research_content=runtime_market_event_dto.deep_research_content
-                    or "N/A",
-                )
-                runtime_market_event_dto.processing_status = (
-                    MarketEvenProcessingtStatus.FETCHING_ANALYTICS
-                )
-                runtime_market_event_dto.updated_at = (
-                    get_current_timestamp_with_timezone()
-                )
-                await publish_updates(
-                    user_id=user_id,
-                    data_type=WebsocketMessageTypesEnum.USER_CUSTOM_EVENT
-                    if user_id
-                    else WebsocketMessageTypesEnum.LIVE_EVENTS,
-                    data=runtime_market_event_dto.model_dump(),
-                )
+                async def generate_banner(_):
+                    return await pipeline.generate_ai_processing_title(article)
 
-                # Fetch sentimental analysis
-                runtime_market_event_dto.sentimental_analysis = (
-                    pipeline.fetch_sentimental_analysis(article)
-                )
-                runtime_market_event_dto.updated_at = (
-                    get_current_timestamp_with_timezone()
-                )
-                await publish_updates(
-                    user_id=user_id,
-                    data_type=WebsocketMessageTypesEnum.USER_CUSTOM_EVENT
-                    if user_id
-                    else WebsocketMessageTypesEnum.LIVE_EVENTS,
-                    data=runtime_market_event_dto.model_dump(),
-                )
+                async def deep_research(_):
+                    if not app_settings.DEEP_RESEARCH_STREAMING_ENABLED:
+                        return await pipeline.deep_research_financial_article(article)
 
-                # Fetch priority flag
-                runtime_market_event_dto.priority_flag = pipeline.fetch_priority_flag(
-                    article
-                )
-                runtime_market_event_dto.updated_at = (
-                    get_current_timestamp_with_timezone()
-                )
-                await publish_updates(
-                    user_id=user_id,
-                    data_type=WebsocketMessageTypesEnum.USER_CUSTOM_EVENT
-                    if user_id
-                    else WebsocketMessageTypesEnum.LIVE_EVENTS,
-                    data=runtime_market_event_dto.model_dump(),
-                )
+                    # Publish the research as it is written, merged into small time windows
+                    chunks = []
+                    async for delta in batch_text_stream(
+                        pipeline.stream_deep_research_financial_article(article),
+                        interval=app_settings.DEEP_RESEARCH_STREAM_FLUSH_INTERVAL_SECONDS,
+                    ):
+                        chunks.append(delta)
+                        await publish_updates(
+                            user_id=user_id,
+                            data_type=WebsocketMessageTypesEnum.MARKET_EVENT_CONTENT_DELTA,
+                            data=MarketEventContentDeltaSchema(
+                                id=runtime_market_event_dto.id,
+                                delta=delta,
+                                sequence=len(chunks),
+                                updated_at=get_current_timestamp_with_timezone(),
+                            ).model_dump(),
+                        )
+                    # Kept as streamed, so it matches what clients assembled
+                    content = "".join(chunks)
+                    await stage_publisher.publish_streamed_content(
+                        field="deep_research_content",
+                        content=content,
+                        sequence=len(chunks),
+                    )
+                    return content
 
-                # Fetch compliance check
-                runtime_market_event_dto.compliance_check = (
-                    pipeline.fetch_compliance_check(article)
-                )
-                runtime_market_event_dto.processing_status = (
-                    MarketEvenProcessingtStatus.DRAFTED
-                )
-                runtime_market_event_dto.editable = True
-                runtime_market_event_dto.updated_at = (
-                    get_current_timestamp_with_timezone()
-                )
-                runtime_market_event_dto.banner = (
-                    runtime_market_event_dto.banner.replace(
-                        "AI processing:", ""
-                    ).strip()
-                )
-                await publish_updates(
-                    user_id=user_id,
-                    data_type=WebsocketMessageTypesEnum.USER_CUSTOM_EVENT
-                    if user_id
-                    else WebsocketMessageTypesEnum.LIVE_EVENTS,
-                    data=runtime_market_event_dto.model_dump(),
+                async def summarize(dependencies):
+                    return await pipeline.fetch_summarized_content_from_deep_research(
+                        deep_research_content=dependencies["deep_research_content"]
+                        or "N/A",
+                    )
+
+                async def analytics(_):
+                    return await pipeline.fetch_market_event_analytics(article)
+
+                async def publish_analytics(result):
+                    # One completion and one round-trip, but clients still receive one update
+                    # per field
+                    await stage_publisher.publish(
+                        *(
+                            {field: result[field]}
+                            for field in (
+                                "sentimental_analysis",
+                                "priority_flag",
+                                "compliance_check",
+                            )
+                        )
+                    )
+
+                # Only the summary depends on another step, every other step runs concurrently
+                # and publishes its own update as soon as it finishes.
+                await run_step_graph(
+                    [
+                        PipelineStep(
+                            name="banner",
+                            run=generate_banner,
+                            on_complete=lambda banner: publish_stage(banner=banner),
+                        ),
+                        PipelineStep(
+                            name="deep_research_content",
+                            run=deep_research,
+                            on_complete=lambda content: publish_stage(
+                                deep_research_content=content,
+                                processing_status=MarketEvenProcessingtStatus.WRITING,
+                            ),
+                        ),
+                        PipelineStep(
+                            name="ai_generated_summarized_content",
+                            run=summarize,
+                            depends_on=("deep_research_content",),
+                            on_complete=lambda summary: publish_stage(
+                                ai_generated_summarized_content=summary,
+                                processing_status=MarketEvenProcessingtStatus.FETCHING_ANALYTICS,
+                            ),
+                        ),
+                        PipelineStep(
+                            name="analytics",
+                            run=analytics,
+                            on_complete=publish_analytics,
+                        ),
+                    ]
                 )
 
-                market_event_domain_services.update_market_event_by_id(
-                    id=runtime_market_event_dto.id,
-                    market_event_data=UpdateMarketEventSchema(
-                        **runtime_market_event_dto.model_dump()
-                    ),
+                await publish_stage(
+                    processing_status=MarketEvenProcessingtStatus.DRAFTED,
+                    editable=True,
+                    banner=runtime_market_event_dto.banner.replace(
+                        "AI processing:", ""
+                    ).strip(),
                 )
 
-                if user_id:
-                    post_dataclass = PostDataClass(
-                        title=runtime_market_event_dto.title,
-                        description=runtime_market_event_dto.deep_research_content,
-                        user_id=user_id,
-                        market_event_id=runtime_market_event_dto.id,
-                        status=PostStatus.DRAFT,
-                        is_customized=True if user_id else False,
+                with db_service.session_scope() as db_session:
+                    MarketEventDomainServices(
+                        db_session=db_session
+                    ).update_market_event_by_id(
+                        id=runtime_market_event_dto.id,
+                        market_event_data=UpdateMarketEventSchema(
+                            **runtime_market_event_dto.model_dump()
+                        ),
                     )
 
-                    post_data = PostFactory.build_entity_with_id(data=post_dataclass)
-                    post_domain_services.create_post(post=post_data)
+                    if user_id:
+                        post_dataclass = PostDataClass(
+                            title=runtime_market_event_dto.title,
+                            description=runtime_market_event_dto.deep_research_content,
+                            user_id=user_id,
+                            market_event_id=runtime_market_event_dto.id,
+                            status=PostStatus.DRAFT,
+                            is_customized=True if user_id else False,
+                        )
+
+                        post_data = PostFactory.build_entity_with_id(
+                            data=post_dataclass
+                        )
+                        PostDomainServices(db_session=db_session).create_post(
+                            post=post_data
+                        )
             except Exception as e:
                 logger.error(
                     f"Error in async processing: {e}:{e.__traceback__.tb_lineno}",
                     exc_info=True,
                 )
                 raise
+            finally:
+                # The client and its connection pool belong to this task's loop
+                await OpenAIServices.close_async_client()
 
         try:
             # Run the async function in the event loop
@@ -0,0 +1,314 @@
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from celery.schedules import schedule
+from redis import Redis
+from redis.exceptions import RedisError
+
+from config.settings import app_settings
+from src.domain.enums import MarketEventSource
+from src.schema.utils import (
+    FetchIntervalDTO,
+    FetchIntervalReasonEnum,
+    FetchSchedulePolicyDTO,
+    RateLimitDTO,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_KEY_PREFIX = "fetch_schedule:"
+
+MIN_FETCH_INTERVAL_SECONDS = 60
+
+
+def build_fetch_schedule_policy(
+    base_interval: int, min_interval: int, max_interval: int
+) -> FetchSchedulePolicyDTO:
+    """
+    Builds the interval bounds of a source, failing loudly on a misconfigured interval.
+
+    Raises:
+        ValueError: Unless `MIN_FETCH_INTERVAL_SECONDS <= min_interval <= base_interval
+            <= max_interval`.
+    """
+    if not MIN_FETCH_INTERVAL_SECONDS <= min_interval <= base_interval <= max_interval:
+        raise ValueError(
+            "Invalid fetch schedule: expected "
+            f"{MIN_FETCH_INTERVAL_SECONDS} <= min_interval ({min_interval}) <= "
+            f"base_interval ({base_interval}) <= max_interval ({max_interval}); "
+            "fetch intervals are set in seconds"
+        )
+    return FetchSchedulePolicyDTO(
+        base_interval=base_interval,
+        min_interval=min_interval,
+        max_interval=max_interval,
+    )
+
+
+FETCH_SCHEDULE_POLICIES: Dict[MarketEventSource, FetchSchedulePolicyDTO] = {
+    MarketEventSource.ALPHA_VANTAGE_API: build_fetch_schedule_policy(
+        base_interval=app_settings.ALPHAVANTAGE_FETCH_INTERVAL_SECONDS,
+        min_interval=max(
+            MIN_FETCH_INTERVAL_SECONDS,
+            app_settings.ALPHAVANTAGE_FETCH_INTERVAL_SECONDS // 4,
+        ),
+        max_interval=app_settings.ALPHAVANTAGE_FETCH_INTERVAL_SECONDS * 4,
+    ),
+    MarketEventSource.EVENT_REGISTRY_API: build_fetch_schedule_policy(
+        base_interval=app_settings.EVENT_REGISTRY_FETCH_INTERVAL_SECONDS,
+        min_interval=max(
+            MIN_FETCH_INTERVAL_SECONDS,
+            app_settings.EVENT_REGISTRY_FETCH_INTERVAL_SECONDS // 24,
+        ),
+        max_interval=app_settings.EVENT_REGISTRY_FETCH_INTERVAL_SECONDS,
+    ),
+}
+
+
+def choose_fetch_interval(
+    policy: FetchSchedulePolicyDTO,
+    previous_interval: int,
+    articles: Optional[int],
+    queue_depth: Optional[int],
+    rate_limit: Optional[RateLimitDTO],
+) -> FetchIntervalDTO:
+    """
+    Chooses the interval until the next fetch of a source from how the last one went.
+
+    In order of precedence: a nearly exhausted rate limit waits at least until it resets
+    and never speeds up, and one the API refused a request for doubles the interval; a
+    failed run keeps it; a saturated enrichment queue doubles it; a run that yielded
+    many new articles halves it; a run that yielded none doubles it; anything in between
+    moves the interval one step back towards the base interval. The result is kept
+    within the bounds of the policy.
+
+    Args:
+        policy (FetchSchedulePolicyDTO): The interval bounds of the source.
+        previous_interval (int): The interval chosen after the previous fetch.
+        articles (Optional[int]): New articles yielded by the last fetch, or None if it
+            failed.
+        queue_depth (Optional[int]): Tasks waiting in the Celery queue, if known.
+        rate_limit (Optional[RateLimitDTO]): Rate-limit state reported by the API.
+
+    Returns:
+        FetchIntervalDTO: The interval in seconds and the reason it was chosen.
+    """
+    if (
+        rate_limit is not None
+        and rate_limit.remaining is not None
+        and rate_limit.remaining
+        <= app_settings.FETCH_SCHEDULER_RATE_LIMIT_MIN_REMAINING
+    ):
+        backoff = previous_interval * 2 if rate_limit.remaining == 0 else 0
+        interval = max(previous_interval, backoff, rate_limit.reset_seconds or 0)
+        reason = FetchIntervalReasonEnum.RATE_LIMITED
+    elif articles is None:
+        interval = previous_interval
+        reason = FetchIntervalReasonEnum.FAILED
+    elif (
+        queue_depth is not None
+        and queue_depth >= app_settings.FETCH_SCHEDULER_QUEUE_SATURATION
+    ):
+        interval = previous_interval * 2
+        reason = FetchIntervalReasonEnum.QUEUE_SATURATED
+    elif articles >= app_settings.FETCH_SCHEDULER_HOT_ARTICLES:
+        interval = previous_interval / 2
+        reason = FetchIntervalReasonEnum.HOT_NEWS
+    elif articles == 0:
+        interval = previous_interval * 2
+        reason = FetchIntervalReasonEnum.QUIET
+    else:
+        if previous_interval < policy.base_interval:
+            interval = min(previous_interval * 2, policy.base_interval)
+        else:
+            interval = max(previous_interval / 2, policy.base_interval)
+        reason = FetchIntervalReasonEnum.BASELINE
+
+    interval = min(max(interval, policy.min_interval), policy.max_interval)
+    return FetchIntervalDTO(interval_seconds=int(interval), reason=reason)
+
+
+class FetchScheduler:
+    """
+    Shares the interval between two fetches of every news source between Celery beat and
+    the workers.
+
+    After every fetch a worker records what it yielded, the Celery queue depth and the
+    rate-limit state reported by the API, and stores the next interval with the reason
+    it was chosen. Beat reads that interval through `AdaptiveFetchSchedule`. Without
+    Redis, or if Redis fails, every source keeps its base interval.
+    """
+
+    def __init__(
+        self,
+        redis_host: str = app_settings.REDIS_HOST,
+        broker_url: str = app_settings.REDIS_BROKER_URL,
+        queue_name: str = "celery",
+    ):
+        self.queue_name = queue_name
+        self._redis: Optional[Redis] = (
+            Redis(
+                host=redis_host,
+                decode_responses=True,
+                socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            )
+            if redis_host
+            else None
+        )
+        self._broker: Optional[Redis] = (
+            Redis.from_url(
+                broker_url,
+                socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            )
+            if broker_url
+            else None
+        )
+
+    @staticmethod
+    def _key(source: MarketEventSource) -> str:
+        return f"{SCHEDULE_KEY_PREFIX}{source.name}"
+
+    def get_queue_depth(self) -> Optional[int]:
+        """
+        Returns the number of tasks waiting in the Celery queue, if known.
+        """
+        if self._broker is None:
+            return None
+        try:
+            return self._broker.llen(self.queue_name)
+        except RedisError as e:
+            logger.warning("Reading the Celery queue depth failed: %s", e)
+            return None
+
+    def get_interval(self, source: MarketEventSource) -> int:
+        """
+        Returns the interval in seconds until the next fetch of a source.
+        """
+        base_interval = FETCH_SCHEDULE_POLICIES[source].base_interval
+        if self._redis is None:
+            return base_interval
+        try:
+            interval = self._redis.hget(self._key(source), "interval_seconds")
+        except RedisError as e:
+            logger.warning("Reading the %s fetch interval failed: %s", source.value, e)
+            return base_interval
+        return int(interval) if interval else base_interval
+
+    def record_fetch(
+        self,
+        source: MarketEventSource,
+        articles: Optional[int],
+        rate_limit: Optional[RateLimitDTO] = None,
+    ) -> FetchIntervalDTO:
+        """
+        Chooses and stores the interval until the next fetch of a source.
+
+        Args:
+            source (MarketEventSource): The fetched source.
+            articles (Optional[int]): New articles yielded by the fetch, or None if it
+                failed.
+            rate_limit (Optional[RateLimitDTO]): Rate-limit state reported by the API.
+
+        Returns:
+            FetchIntervalDTO: The chosen interval and its reason.
+        """
+        queue_depth = self.get_queue_depth()
+        decision = choose_fetch_interval(
+            policy=FETCH_SCHEDULE_POLICIES[source],
+            previous_interval=self.get_interval(source),
+            articles=articles,
+            queue_depth=queue_depth,
+            rate_limit=rate_limit,
+        )
+        logger.info(
+            "Next %s fetch in %ss (%s): %s new articles, queue depth %s",
+            source.value,
+            decision.interval_seconds,
+            decision.reason.value,
+            articles,
+            queue_depth,
+        )
+
+        if self._redis is not None:
+            remaining = rate_limit.remaining if rate_limit else None
+            try:
+                self._redis.hset(
+                    self._key(source),
+                    mapping={
+                        "interval_seconds": decision.interval_seconds,
+                        "reason": decision.reason.value,
+                        "articles": "" if articles is None else articles,
+                        "queue_depth": "" if queue_depth is None else queue_depth,
+                        "rate_limit_remaining": "" if remaining is None else remaining,
+                        "decided_at": datetime.now(UTC).isoformat(),
+                    },
+                )
+            except RedisError as e:
+                logger.warning(
+                    "Storing the %s fetch interval failed: %s", source.value, e
+                )
+        return decision
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the last interval, reason and inputs of every source, keyed by source.
+        """
+        sources = {}
+        for source, policy in FETCH_SCHEDULE_POLICIES.items():
+            stored = {}
+            if self._redis is not None:
+                try:
+                    stored = self._redis.hgetall(self._key(source))
+                except RedisError as e:
+                    logger.warning(
+                        "Reading the %s fetch schedule failed: %s", source.value, e
+                    )
+            sources[source.value] = {
+                "interval_seconds": int(
+                    stored.get("interval_seconds") or policy.base_interval
+                ),
+                "reason": stored.get("reason")
+                or FetchIntervalReasonEnum.BASELINE.value,
+                "articles": int(stored["articles"]) if stored.get("articles") else None,
+                "queue_depth": (
+                    int(stored["queue_depth"]) if stored.get("queue_depth") else None
+                ),
+                "rate_limit_remaining": (
+                    int(stored["rate_limit_remaining"])
+                    if stored.get("rate_limit_remaining")
+                    else None
+                ),
+                "decided_at": stored.get("decided_at"),
+            }
+        return sources
+
+
+fetch_scheduler = FetchScheduler()
+
+
+class AdaptiveFetchSchedule(schedule):
+    """
+    Beat schedule whose interval is re-read from the fetch scheduler on every check.
+
+    Beat sleeps at most `beat_max_loop_interval` between checks, so a shorter interval
+    takes effect within that delay.
+    """
+
+    def __init__(self, source: MarketEventSource, **kwargs):
+        self.source = source
+        super().__init__(
+            run_every=FETCH_SCHEDULE_POLICIES[source].base_interval, **kwargs
+        )
+
+    def is_due(self, last_run_at: datetime):
+        self.run_every = timedelta(seconds=fetch_scheduler.get_interval(self.source))
+        return super().is_due(last_run_at)
+
+    def __reduce__(self):
+        return self.__class__, (self.source,)
+
+    def __repr__(self) -> str:
+        return f"<adaptive fetch schedule: {self.source.value}>"
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PipelineStep:
+    """
+    A single node of the enrichment step graph.
+
+    `Attributes`:
+    - `name (str)`: Unique name of the step, used by other steps to declare dependencies.
+    - `run (Callable)`: Coroutine function receiving the results of its dependencies keyed by step name.
+    - `depends_on (Tuple[str, ...])`: Names of the steps that must finish before this one starts.
+    - `on_complete (Callable | None)`: Optional coroutine function called with the step result as soon as it is available.
+    """
+
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    on_complete: Optional[Callable[[Any], Awaitable[None]]] = None
+
+
+def _validate_steps(steps: Dict[str, PipelineStep]) -> None:
+    """
+    Validates that every dependency exists and that the graph has no cycles.
+
+    Args:
+        steps (Dict[str, PipelineStep]): Steps keyed by their name.
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph contains a cycle.
+    """
+    for step in steps.values():
+        for dependency in step.depends_on:
+            if dependency not in steps:
+                raise ValueError(
+                    f"Step '{step.name}' depends on unknown step '{dependency}'"
+                )
+
+    visited: set[str] = set()
+    visiting: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Cycle detected in step graph at '{name}'")
+        visiting.add(name)
+        for dependency in steps[name].depends_on:
+            visit(dependency)
+        visiting.remove(name)
+        visited.add(name)
+
+    for name in steps:
+        visit(name)
+
+
+async def run_step_graph(steps: Iterable[PipelineStep]) -> Dict[str, Any]:
+    """
+    Runs the given steps concurrently while respecting their dependencies.
+
+    Every step starts as soon as all of its dependencies have finished, so the total
+    duration is bounded by the longest dependency chain instead of the sum of all steps.
+    If any step fails, the remaining steps are cancelled and the error is re-raised.
+
+    Args:
+        steps (Iterable[PipelineStep]): The steps to run.
+
+    Returns:
+        Dict[str, Any]: The result of every step keyed by its name.
+    """
+    steps_by_name: Dict[str, PipelineStep] = {}
+    for step in steps:
+        if step.name in steps_by_name:
+            raise ValueError(f"Duplicate step name '{step.name}'")
+        steps_by_name[step.name] = step
+
+    _validate_steps(steps_by_name)
+
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def execute(step: PipelineStep) -> Any:
+        dependencies = {name: await tasks[name] for name in step.depends_on}
+        result = await step.run(dependencies)
+        if step.on_complete:
+            await step.on_complete(result)
+        return result
+
+    # Tasks are only scheduled here; none of them runs before all have been created.
+    for name, step in steps_by_name.items():
+        tasks[name] = asyncio.create_task(execute(step), name=name)
+
+    try:
+        results = await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return dict(zip(tasks.keys(), results))
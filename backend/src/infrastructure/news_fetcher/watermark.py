@@ -0,0 +1,132 @@
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Callable, Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from config.settings import app_settings
+from src.domain.enums import MarketEventSource
+from src.schema.utils import FetchWatermarkDTO
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_KEY_PREFIX = "fetch_watermark:"
+
+# Moves the watermark only forward, so a slow task finishing late never rewinds it.
+ADVANCE_WATERMARK_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'published_at')
+if current and tonumber(current) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'published_at', ARGV[1], 'article_id', ARGV[2])
+return 1
+"""
+
+
+class FetchWatermarkStore:
+    """
+    Persists, per news source, the newest article a scheduled fetch has fanned out.
+
+    The next fetch requests and keeps what was published from a lookback before it on.
+    Without Redis, or if Redis fails, no watermark is known and fetches fall back to the
+    fixed time window.
+    """
+
+    def __init__(self, redis_host: str = app_settings.REDIS_HOST):
+        self._redis: Optional[Redis] = (
+            Redis(
+                host=redis_host,
+                decode_responses=True,
+                socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            )
+            if redis_host
+            else None
+        )
+        self._advance = (
+            self._redis.register_script(ADVANCE_WATERMARK_SCRIPT)
+            if self._redis is not None
+            else None
+        )
+
+    @staticmethod
+    def _key(source: MarketEventSource) -> str:
+        return f"{WATERMARK_KEY_PREFIX}{source.name}"
+
+    def get(self, source: MarketEventSource) -> Optional[FetchWatermarkDTO]:
+        """
+        Returns the watermark of a source, if any.
+        """
+        if self._redis is None:
+            return None
+        try:
+            stored = self._redis.hgetall(self._key(source))
+        except RedisError as e:
+            logger.warning("Reading the %s fetch watermark failed: %s", source.value, e)
+            return None
+        if not stored:
+            return None
+        return FetchWatermarkDTO(
+            published_at=datetime.fromtimestamp(float(stored["published_at"]), UTC),
+            article_id=stored["article_id"],
+        )
+
+    def advance(self, source: MarketEventSource, watermark: FetchWatermarkDTO) -> bool:
+        """
+        Atomically moves the watermark of a source forward to `watermark`, if it was
+        published later.
+
+        Returns:
+            bool: Whether the stored watermark moved.
+        """
+        if self._advance is None:
+            return False
+        try:
+            return bool(
+                self._advance(
+                    keys=[self._key(source)],
+                    args=[watermark.published_at.timestamp(), watermark.article_id],
+                )
+            )
+        except RedisError as e:
+            logger.warning(
+                "Advancing the %s fetch watermark failed: %s", source.value, e
+            )
+            return False
+
+
+class WatermarkTracker:
+    """
+    Keeps the articles published from a lookback before a watermark on, and tracks the
+    newest article seen.
+
+    The overlap re-reads articles of the watermark's own second that a capped page cut
+    off, and articles the provider indexed after their publish time; deduplication drops
+    the ones already ingested. Articles without a publish time are always kept and left
+    to deduplication too.
+    """
+
+    def __init__(
+        self,
+        since: Optional[FetchWatermarkDTO],
+        get_watermark: Callable[[dict], Optional[FetchWatermarkDTO]],
+        lookback_seconds: int = app_settings.FETCH_WATERMARK_LOOKBACK_SECONDS,
+    ):
+        self.since = since
+        self.newest = since
+        self.fetch_from: Optional[datetime] = (
+            since.published_at - timedelta(seconds=lookback_seconds) if since else None
+        )
+        self._get_watermark = get_watermark
+
+    def is_new(self, article: dict) -> bool:
+        """
+        Returns whether the article was published within the range of the fetch.
+        """
+        watermark = self._get_watermark(article)
+        if watermark is None:
+            return True
+        if self.newest is None or watermark.published_at > self.newest.published_at:
+            self.newest = watermark
+        return self.fetch_from is None or watermark.published_at >= self.fetch_from
@@ -0,0 +1,281 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+from redis import Redis
+from redis.exceptions import RedisError
+
+from config.settings import app_settings
+from src.infrastructure.utils import parse_rate_limit_headers
+from src.schema.utils import RateLimitBudgetDTO, RateLimitedProviderEnum
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "rate_limit:"
+
+# Budgets per minute; 0 leaves that dimension unlimited. Every model of a provider gets a
+# bucket of its own with the provider's budget, as OpenAI limits each model separately.
+PROVIDER_BUDGETS: Dict[RateLimitedProviderEnum, RateLimitBudgetDTO] = {
+    RateLimitedProviderEnum.OPENAI: RateLimitBudgetDTO(
+        requests_per_minute=app_settings.OPENAI_REQUESTS_PER_MINUTE,
+        tokens_per_minute=app_settings.OPENAI_TOKENS_PER_MINUTE,
+    ),
+    RateLimitedProviderEnum.ALPHA_VANTAGE: RateLimitBudgetDTO(
+        requests_per_minute=app_settings.ALPHAVANTAGE_REQUESTS_PER_MINUTE,
+        tokens_per_minute=0,
+    ),
+    RateLimitedProviderEnum.EVENT_REGISTRY: RateLimitBudgetDTO(
+        requests_per_minute=app_settings.EVENT_REGISTRY_REQUESTS_PER_MINUTE,
+        tokens_per_minute=0,
+    ),
+}
+
+# Refills both buckets of a key for the time elapsed since its last update, using the
+# Redis clock so that every worker agrees on it, then takes the requested amounts.
+# Returns 0 once taken, or else the milliseconds to wait until enough has refilled.
+# A forced take never waits and may leave a bucket negative, to charge usage afterwards.
+TAKE_TOKENS_SCRIPT = """
+local rpm = tonumber(ARGV[1])
+local tpm = tonumber(ARGV[2])
+local requests = tonumber(ARGV[3])
+local tokens = tonumber(ARGV[4])
+local force = ARGV[5] == '1'
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'requests', 'tokens', 'updated_at')
+local elapsed = 0
+if state[3] then
+    elapsed = math.max(0, now - tonumber(state[3]))
+end
+
+local available_requests = rpm
+if state[1] then
+    available_requests = math.min(rpm, tonumber(state[1]) + elapsed * rpm / 60)
+end
+local available_tokens = tpm
+if state[2] then
+    available_tokens = math.min(tpm, tonumber(state[2]) + elapsed * tpm / 60)
+end
+
+if not force then
+    local wait = 0
+    if rpm > 0 and available_requests < requests then
+        wait = math.max(wait, (requests - available_requests) * 60 / rpm)
+    end
+    if tpm > 0 and available_tokens < tokens then
+        wait = math.max(wait, (tokens - available_tokens) * 60 / tpm)
+    end
+    if wait > 0 then
+        return math.ceil(wait * 1000)
+    end
+end
+
+redis.call(
+    'HSET', KEYS[1],
+    'requests', tostring(available_requests - requests),
+    'tokens', tostring(available_tokens - tokens),
+    'updated_at', tostring(now)
+)
+redis.call('PEXPIRE', KEYS[1], 120000)
+return 0
+"""
+
+
+def get_backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Returns how long to wait before retrying a rate-limited call.
+
+    Waits for `retry_after` when the API sent one, else for a full-jitter exponential
+    backoff, plus up to one base delay of jitter so that workers do not retry in step.
+
+    Args:
+        attempt (int): Number of the failed attempt, starting at 0.
+        retry_after (Optional[float]): Seconds the API asked to wait, if any.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    base = app_settings.RATE_LIMIT_BACKOFF_BASE_SECONDS
+    if retry_after is not None:
+        return retry_after + random.uniform(0, base)
+    ceiling = min(app_settings.RATE_LIMIT_BACKOFF_MAX_SECONDS, base * 2**attempt)
+    return random.uniform(0, ceiling) + random.uniform(0, base)
+
+
+class TokenBucketRateLimiter:
+    """
+    Request and token budgets per minute shared by every API and Celery worker.
+
+    Each provider and model has one Redis hash holding a requests bucket and a tokens
+    bucket that refill continuously up to their per-minute budget. A call takes from
+    both atomically, waiting until they hold enough. Without Redis, or if Redis fails,
+    calls are let through unlimited.
+    """
+
+    def __init__(self, redis_host: str = app_settings.REDIS_HOST):
+        self._redis: Optional[Redis] = (
+            Redis(
+                host=redis_host,
+                decode_responses=True,
+                socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            )
+            if redis_host
+            else None
+        )
+        self._take = (
+            self._redis.register_script(TAKE_TOKENS_SCRIPT)
+            if self._redis is not None
+            else None
+        )
+
+    @staticmethod
+    def _key(provider: RateLimitedProviderEnum, model: Optional[str]) -> str:
+        if model:
+            return f"{RATE_LIMIT_KEY_PREFIX}{provider.value}:{model}"
+        return f"{RATE_LIMIT_KEY_PREFIX}{provider.value}"
+
+    def _try_take(
+        self,
+        provider: RateLimitedProviderEnum,
+        model: Optional[str],
+        requests: int,
+        tokens: int,
+        force: bool = False,
+    ) -> float:
+        """
+        Takes from the buckets of a provider and model if they hold enough.
+
+        Returns:
+            float: 0 once taken, or else the seconds to wait before trying again.
+        """
+        budget = PROVIDER_BUDGETS[provider]
+        if self._take is None or not (
+            budget.requests_per_minute or budget.tokens_per_minute
+        ):
+            return 0
+        if budget.tokens_per_minute:
+            # A call larger than the whole budget would otherwise never be let through
+            tokens = min(tokens, budget.tokens_per_minute)
+        try:
+            wait_ms = self._take(
+                keys=[self._key(provider, model)],
+                args=[
+                    budget.requests_per_minute,
+                    budget.tokens_per_minute,
+                    requests,
+                    tokens,
+                    int(force),
+                ],
+            )
+        except RedisError as e:
+            logger.warning(
+                "Rate limiting %s against Redis failed: %s", provider.value, e
+            )
+            return 0
+        return int(wait_ms) / 1000
+
+    def acquire(
+        self,
+        provider: RateLimitedProviderEnum,
+        model: Optional[str] = None,
+        tokens: int = 0,
+    ) -> None:
+        """
+        Blocks until one request and `tokens` tokens are available, then takes them.
+
+        Args:
+            provider (RateLimitedProviderEnum): The called API.
+            model (Optional[str]): The model called, for per-model budgets.
+            tokens (int): Estimated tokens used by the call.
+        """
+        while wait := self._try_take(provider, model, requests=1, tokens=tokens):
+            logger.debug("Waiting %.2fs for the %s rate limit", wait, provider.value)
+            time.sleep(wait + random.uniform(0, wait / 10))
+
+    async def acquire_async(
+        self,
+        provider: RateLimitedProviderEnum,
+        model: Optional[str] = None,
+        tokens: int = 0,
+    ) -> None:
+        """
+        Async variant of `acquire` that keeps Redis round-trips off the event loop.
+        """
+        if self._take is None:
+            return
+        while wait := await asyncio.to_thread(
+            self._try_take, provider, model, 1, tokens
+        ):
+            logger.debug("Waiting %.2fs for the %s rate limit", wait, provider.value)
+            await asyncio.sleep(wait + random.uniform(0, wait / 10))
+
+    def record_tokens(
+        self,
+        provider: RateLimitedProviderEnum,
+        model: Optional[str],
+        tokens: int,
+    ) -> None:
+        """
+        Settles the difference between the tokens used and the estimate taken by
+        `acquire`, without waiting; a negative difference gives tokens back.
+        """
+        if tokens:
+            self._try_take(provider, model, requests=0, tokens=tokens, force=True)
+
+    async def record_tokens_async(
+        self,
+        provider: RateLimitedProviderEnum,
+        model: Optional[str],
+        tokens: int,
+    ) -> None:
+        """
+        Async variant of `record_tokens` that keeps Redis round-trips off the event loop.
+        """
+        if tokens and self._take is not None:
+            await asyncio.to_thread(self.record_tokens, provider, model, tokens)
+
+
+rate_limiter = TokenBucketRateLimiter()
+
+
+async def send_with_rate_limit(
+    provider: RateLimitedProviderEnum,
+    send: Callable[[], Awaitable[httpx.Response]],
+) -> httpx.Response:
+    """
+    Sends an HTTP request within the provider's budget, retrying 429 responses.
+
+    Every attempt first takes a request from the rate limiter. Rate-limited responses
+    are closed and retried after a jittered backoff, at most `RATE_LIMIT_MAX_RETRIES`
+    times; the last response is returned whatever its status.
+
+    Args:
+        provider (RateLimitedProviderEnum): The called API.
+        send (Callable[[], Awaitable[httpx.Response]]): Sends the request once.
+
+    Returns:
+        httpx.Response: The response.
+    """
+    attempt = 0
+    while True:
+        await rate_limiter.acquire_async(provider)
+        response = await send()
+        if (
+            response.status_code != httpx.codes.TOO_MANY_REQUESTS
+            or attempt >= app_settings.RATE_LIMIT_MAX_RETRIES
+        ):
+            return response
+
+        rate_limit = parse_rate_limit_headers(response.headers, response.status_code)
+        delay = get_backoff_delay(attempt, rate_limit.reset_seconds)
+        await response.aclose()
+        logger.warning(
+            "%s rate limited the request, retrying in %.2fs", provider.value, delay
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
@@ -1,53 +1,236 @@
 import asyncio
 import logging
+from typing import Optional
 
-from celery import group
-
+from config.settings import app_settings
 from src.celery_worker import celery_app
 from src.domain.enums import MarketEventSource
 from src.infrastructure.news_fetcher.core.alpha_vantage_news_fetcher import (
     AlphaVantageNewsFetcher,
 )
+from src.infrastructure.news_fetcher.core.base_class import NewsFetcherBase
 from src.infrastructure.news_fetcher.core.event_registry_news_fetcher import (
     EventRegistryNewsFetcher,
 )
-from src.infrastructure.news_fetcher.orchestrator import process_article_task
+from src.infrastructure.news_fetcher.deduplicator import ArticleDeduplicator
+from src.infrastructure.news_fetcher.orchestrator import (
+    ingest_articles,
+    pipeline,
+    process_article_task,
+)
+from src.infrastructure.news_fetcher.scheduler import fetch_scheduler
+from src.infrastructure.news_fetcher.watermark import (
+    FetchWatermarkStore,
+    WatermarkTracker,
+)
+from src.schema.utils import FetchedArticlesDTO
 
 logger = logging.getLogger(__name__)
 
+article_deduplicator = ArticleDeduplicator()
+fetch_watermark_store = FetchWatermarkStore()
+
+
+def get_watermark_tracker(
+    events_fetcher: NewsFetcherBase, source: MarketEventSource
+) -> WatermarkTracker:
+    """
+    Starts tracking a fetch from the stored watermark of the source.
+
+    Static data is not published in order, so it is never filtered by a watermark.
+    """
+    since = (
+        None if app_settings.FETCH_STATIC_DATA else fetch_watermark_store.get(source)
+    )
+    return WatermarkTracker(since, events_fetcher.get_article_watermark)
+
+
+def advance_watermark(tracker: WatermarkTracker, source: MarketEventSource) -> None:
+    """
+    Moves the watermark of the source to the newest article fetched.
+
+    Only called once the fetched articles have been ingested, so a failed run is
+    fetched again by the next one.
+    """
+    if app_settings.FETCH_STATIC_DATA or tracker.newest in (None, tracker.since):
+        return
+    fetch_watermark_store.advance(source, tracker.newest)
+    logger.info(
+        "Advanced the %s fetch watermark to %s",
+        source.value,
+        tracker.newest.published_at.isoformat(),
+    )
+
+
+def schedule_next_fetch(
+    events_fetcher: NewsFetcherBase,
+    source: MarketEventSource,
+    articles: Optional[int],
+) -> None:
+    """
+    Lets the adaptive scheduler choose when the source is fetched next, from the new
+    articles of this run and the rate-limit state the API reported.
+
+    `articles` counts what was left after deduplication, or is None if the run failed.
+    A failed run says nothing about how busy the source is, so it keeps the interval,
+    unless the API refused it for its rate limit. Static data yields the same sample on
+    every run, so it keeps the base interval.
+    """
+    if app_settings.FETCH_STATIC_DATA:
+        return
+    fetch_scheduler.record_fetch(
+        source, articles=articles, rate_limit=events_fetcher.rate_limit
+    )
+
+
+async def fetch_news(
+    events_fetcher: NewsFetcherBase, tracker: WatermarkTracker
+) -> list:
+    """
+    Fetches news published since the lookback before the watermark on the task's own
+    event loop and closes its pooled HTTP client with it.
+    """
+    try:
+        articles = await events_fetcher.fetch_news(since=tracker.fetch_from)
+    finally:
+        await NewsFetcherBase.close_http_client()
+    return [article for article in articles if tracker.is_new(article)]
+
+
+async def stream_financial_articles(
+    events_fetcher: AlphaVantageNewsFetcher,
+    source: MarketEventSource,
+    tracker: WatermarkTracker,
+) -> FetchedArticlesDTO:
+    """
+    Deduplicates and classifies streamed articles batch by batch while the rest of the
+    response is still downloading.
+
+    Batches are processed in order, one at a time, in a worker thread so that the
+    download keeps going meanwhile. Articles published before the range of the fetch
+    are skipped.
+
+    Returns:
+        FetchedArticlesDTO: The new articles and the financial ones, in feed order.
+    """
+    new_articles = []
+    financial_articles = []
+    seen_in_fetch: set[str] = set()
+    processing: Optional[asyncio.Task] = None
+
+    async def process(batch: list, previous: Optional[asyncio.Task]) -> None:
+        if previous:
+            await previous
+        articles = await asyncio.to_thread(
+            deduplicate_articles, batch, source, seen_in_fetch
+        )
+        new_articles.extend(articles)
+        financial_articles.extend(
+            await asyncio.to_thread(filter_financial_articles, articles, source)
+        )
+
+    try:
+        batch = []
+        async for article in events_fetcher.stream_news(since=tracker.fetch_from):
+            if not tracker.is_new(article):
+                continue
+            batch.append(article)
+            if len(batch) == app_settings.FINANCIAL_CLASSIFICATION_BATCH_SIZE:
+                processing = asyncio.create_task(process(batch, processing))
+                batch = []
+        if batch:
+            processing = asyncio.create_task(process(batch, processing))
+        if processing:
+            await processing
+    finally:
+        # Cancelling the last batch also cancels the ones it is waiting for
+        if processing and not processing.done():
+            processing.cancel()
+        await NewsFetcherBase.close_http_client()
+
+    return FetchedArticlesDTO(
+        articles=new_articles, financial_articles=financial_articles
+    )
+
+
+def deduplicate_articles(
+    articles: list,
+    source: MarketEventSource,
+    seen_in_fetch: Optional[set[str]] = None,
+) -> list:
+    """
+    Drops articles that were already ingested within the dedup retention window.
+    """
+    result = article_deduplicator.deduplicate(articles, seen_in_fetch=seen_in_fetch)
+    logger.info(
+        "Deduplicated %s articles from %s: %s new, %s dropped",
+        len(articles),
+        source.value,
+        len(result.articles),
+        result.dropped,
+    )
+    return result.articles
+
+
+def filter_financial_articles(articles: list, source: MarketEventSource) -> list:
+    """
+    Classifies the fetched articles in batches and keeps only the financial ones.
+    """
+    financial_articles = pipeline.filter_financial_articles(
+        articles=articles,
+        batch_size=app_settings.FINANCIAL_CLASSIFICATION_BATCH_SIZE,
+    )
+    logger.info(
+        "Classified %s articles from %s: %s financial",
+        len(articles),
+        source.value,
+        len(financial_articles),
+    )
+    return financial_articles
+
 
 @celery_app.task
 def process_alpha_vantage_events_data() -> None:
     logger.info("Processing alpha vantage news events")
+    source = MarketEventSource.ALPHA_VANTAGE_API
+    events_fetcher = AlphaVantageNewsFetcher()
+    tracker = get_watermark_tracker(events_fetcher, source)
     try:
-        source = MarketEventSource.ALPHA_VANTAGE_API
-        events_fetcher = AlphaVantageNewsFetcher()
         # Create an event loop and run the async function
-        events = asyncio.run(events_fetcher.fetch_news())
-
-        # Process articles in parallel using Celery
-        job = group(process_article_task.s(article, source) for article in events)
-        job.apply_async()
+        fetched = asyncio.run(
+            stream_financial_articles(events_fetcher, source, tracker)
+        )
+        ingest_articles(articles=fetched.financial_articles, source=source)
+        # Only ingested articles are marked seen, so a failed run is fetched again
+        article_deduplicator.mark_seen(fetched.articles)
+        advance_watermark(tracker, source)
+        schedule_next_fetch(events_fetcher, source, articles=len(fetched.articles))
 
     except Exception as e:
         logger.error(f"Error processing Alpha Vantage events: {e}", exc_info=True)
+        schedule_next_fetch(events_fetcher, source, articles=None)
 
 
 @celery_app.task
 def process_news_events_data() -> None:
     logger.info("Processing news events")
+    source = MarketEventSource.EVENT_REGISTRY_API
+    events_fetcher = EventRegistryNewsFetcher()
+    tracker = get_watermark_tracker(events_fetcher, source)
     try:
-        source = MarketEventSource.EVENT_REGISTRY_API
-        events_fetcher = EventRegistryNewsFetcher()
         # Create an event loop and run the async function
-        events = asyncio.run(events_fetcher.fetch_news())
-
-        # Process articles in parallel using Celery
-        job = group(process_article_task.s(article, source) for article in events)
-        job.apply_async()
+        events = asyncio.run(fetch_news(events_fetcher, tracker))
+        new_events = deduplicate_articles(articles=events, source=source)
+        events = filter_financial_articles(articles=new_events, source=source)
+        ingest_articles(articles=events, source=source)
+        # Only ingested articles are marked seen, so a failed run is fetched again
+        article_deduplicator.mark_seen(new_events)
+        advance_watermark(tracker, source)
+        schedule_next_fetch(events_fetcher, source, articles=len(new_events))
 
     except Exception as e:
         logger.error(f"Error processing news events: {e}", exc_info=True)
+        schedule_next_fetch(events_fetcher, source, articles=None)
 
 
 @celery_app.task
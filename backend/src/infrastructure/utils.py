@@ -1,28 +1,87 @@
+import asyncio
+import json
 from datetime import UTC, datetime, timedelta
+from typing import Any, AsyncIterator, Mapping, Optional
 
 import pytz
 
 from config.settings import app_settings
-from src.schema.utils import GetTimeRangeResponseDTO
+from src.schema.utils import GetTimeRangeResponseDTO, RateLimitDTO
 
 
-def get_time_range() -> GetTimeRangeResponseDTO:
+def get_time_range(since: Optional[datetime] = None) -> GetTimeRangeResponseDTO:
     """
     Get the time range for the API call.
 
-    Calculate the time range based on the current time and the API call interval duration in minutes
+    The range starts at `since`, floored to the minute, or else one Alpha Vantage fetch interval
+    before the current minute.
+
+    Args:
+        since (Optional[datetime]): Publish time from which to fetch.
     """
     now = datetime.now(UTC)
     time_to = now.replace(second=0, microsecond=0)
-    time_from = time_to - timedelta(
-        minutes=app_settings.API_CALL_INTERVAL_DURATION_IN_SECONDS
-    )
+    if since is not None:
+        time_from = since.astimezone(UTC).replace(second=0, microsecond=0)
+    else:
+        time_from = time_to - timedelta(
+            seconds=app_settings.ALPHAVANTAGE_FETCH_INTERVAL_SECONDS
+        )
     return GetTimeRangeResponseDTO(
         time_from=time_from.strftime("%Y%m%dT%H%M"),
         time_to=time_to.strftime("%Y%m%dT%H%M"),
     )
 
 
+def _get_number_header(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str], status_code: int = 200
+) -> Optional[RateLimitDTO]:
+    """
+    Reads the rate-limit state of a third-party API from its response headers.
+
+    Both the `X-RateLimit-*` and the `RateLimit-*` spellings are understood, with
+    `Retry-After` as the reset time. A reset later than a year in seconds is taken as an
+    epoch timestamp. A 429 response means no request is left.
+
+    Args:
+        headers (Mapping[str, str]): Case-insensitive response headers.
+        status_code (int): The response status code.
+
+    Returns:
+        Optional[RateLimitDTO]: The rate-limit state, or None if nothing was reported.
+    """
+    remaining = _get_number_header(
+        headers, "X-RateLimit-Remaining", "RateLimit-Remaining"
+    )
+    limit = _get_number_header(headers, "X-RateLimit-Limit", "RateLimit-Limit")
+    reset = _get_number_header(
+        headers, "Retry-After", "X-RateLimit-Reset", "RateLimit-Reset"
+    )
+    if status_code == 429:
+        remaining = 0
+    if remaining is None and limit is None and reset is None:
+        return None
+    if reset is not None and reset > 60 * 60 * 24 * 365:
+        reset = max(0.0, reset - datetime.now(UTC).timestamp())
+    return RateLimitDTO(
+        remaining=int(remaining) if remaining is not None else None,
+        limit=int(limit) if limit is not None else None,
+        reset_seconds=reset,
+    )
+
+
 def get_current_timestamp_with_timezone() -> str:
     # Define the desired timezone (India Standard Time)
     ist = pytz.timezone("Asia/Kolkata")
@@ -34,3 +93,149 @@ def get_current_timestamp_with_timezone() -> str:
     formatted_time = current_time_ist.isoformat()
 
     return formatted_time
+
+
+async def batch_text_stream(
+    stream: AsyncIterator[str],
+    interval: float,
+) -> AsyncIterator[str]:
+    """
+    Merges the pieces of a text stream into batches emitted at most every `interval` seconds.
+
+    A batch window opens with the first piece received after the previous flush, so no piece
+    waits longer than `interval` even if the source stream stalls. Whatever is left when the
+    source stream ends is flushed immediately.
+
+    Args:
+        stream (AsyncIterator[str]): The source text stream.
+        interval (float): The batching window in seconds.
+
+    Yields:
+        str: The concatenation of the pieces received within one window.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = stream.__aiter__()
+    buffer: list[str] = []
+    deadline = 0.0
+    next_piece = asyncio.ensure_future(iterator.__anext__())
+
+    try:
+        while True:
+            timeout = max(0.0, deadline - loop.time()) if buffer else None
+            done, _ = await asyncio.wait({next_piece}, timeout=timeout)
+
+            if next_piece in done:
+                try:
+                    piece = next_piece.result()
+                except StopAsyncIteration:
+                    break
+                if not buffer:
+                    deadline = loop.time() + interval
+                buffer.append(piece)
+                next_piece = asyncio.ensure_future(iterator.__anext__())
+
+            if buffer and loop.time() >= deadline:
+                yield "".join(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        next_piece.cancel()
+
+
+async def iter_json_array_items(
+    chunks: AsyncIterator[str],
+    key: str,
+) -> AsyncIterator[Any]:
+    """
+    Yields the items of the array under `key` of a streamed JSON object one by one.
+
+    Each item is yielded as soon as it has been received, and only the item being decoded
+    is kept in memory. Other top-level values are decoded and discarded, and whatever
+    follows the array is never read.
+
+    Args:
+        chunks (AsyncIterator[str]): The JSON document, in pieces of any size.
+        key (str): The top-level key of the array.
+
+    Yields:
+        Any: The decoded items of the array.
+
+    Raises:
+        ValueError: If the document is not a JSON object or is truncated.
+    """
+    decoder = json.JSONDecoder()
+    iterator = chunks.__aiter__()
+    buffer = ""
+    position = 0
+    exhausted = False
+
+    async def read_more() -> bool:
+        nonlocal buffer, position, exhausted
+        if exhausted:
+            return False
+        try:
+            chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            exhausted = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    async def peek() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not await read_more():
+                raise ValueError("Unexpected end of JSON document")
+
+    async def expect(characters: str) -> str:
+        nonlocal position
+        character = await peek()
+        if character not in characters:
+            raise ValueError(f"Expected one of {characters!r}, got {character!r}")
+        position += 1
+        return character
+
+    async def decode_value() -> Any:
+        nonlocal position
+        await peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                # A number is only complete once the character that follows it arrived
+                if exhausted or (
+                    end < len(buffer)
+                    and (buffer[end] in ",:]}" or buffer[end].isspace())
+                ):
+                    position = end
+                    return value
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+            await read_more()
+
+    await expect("{")
+    if await peek() == "}":
+        return
+
+    while True:
+        name = await decode_value()
+        await expect(":")
+        if name == key:
+            await expect("[")
+            if await peek() == "]":
+                return
+            while True:
+                yield await decode_value()
+                if await expect(",]") == "]":
+                    return
+
+        await decode_value()
+        if await expect(",}") == "}":
+            return
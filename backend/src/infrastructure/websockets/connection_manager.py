@@ -1,12 +1,390 @@
+import asyncio
+import json
 import logging
 from asyncio import Lock
-from collections import defaultdict
-from typing import Dict, List
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
 
 from fastapi import WebSocket
 
+from config.settings import app_settings
+from src.schema.market_events import MarketEventContentResyncSchema
+from src.schema.utils import QueueOverflowPolicyEnum, WebsocketMessageTypesEnum
+
 logger = logging.getLogger(__name__)
 
+# Snapshots and field deltas of the same market event can be merged while pending;
+# streamed content deltas must all arrive.
+MARKET_EVENT_SNAPSHOT_TYPES = {
+    WebsocketMessageTypesEnum.LIVE_EVENTS.value,
+    WebsocketMessageTypesEnum.USER_CUSTOM_EVENT.value,
+}
+COALESCIBLE_MESSAGE_TYPES = MARKET_EVENT_SNAPSHOT_TYPES | {
+    WebsocketMessageTypesEnum.MARKET_EVENT_DELTA.value,
+}
+STREAMED_CONTENT_FIELD = "deep_research_content"
+
+
+def get_coalesce_key(data: dict) -> Optional[str]:
+    """
+    Returns the key under which pending messages may be merged, if any.
+
+    Args:
+        data (dict): The websocket message, shaped as `{message_type: payload}`.
+
+    Returns:
+        Optional[str]: `"market_event:<id>"` for market event snapshots and deltas.
+    """
+    if len(data) != 1:
+        return None
+    message_type, payload = next(iter(data.items()))
+    if message_type in COALESCIBLE_MESSAGE_TYPES and isinstance(payload, dict):
+        event_id = payload.get("id")
+        if event_id:
+            return f"market_event:{event_id}"
+    return None
+
+
+def get_content_delta_event_id(data: dict) -> Optional[str]:
+    """
+    Returns the market event id of a streamed content delta, or None for other messages.
+    """
+    payload = data.get(WebsocketMessageTypesEnum.MARKET_EVENT_CONTENT_DELTA.value)
+    if len(data) == 1 and isinstance(payload, dict):
+        return payload.get("id")
+    return None
+
+
+def get_full_content_event_id(data: dict) -> Optional[str]:
+    """
+    Returns the market event id of a message carrying the full streamed content.
+
+    Such a message supersedes every content delta of the event still pending, whether it
+    is a snapshot holding the content or a delta whose changes include it.
+    """
+    if len(data) != 1:
+        return None
+    message_type, payload = next(iter(data.items()))
+    if not isinstance(payload, dict):
+        return None
+    if message_type in MARKET_EVENT_SNAPSHOT_TYPES and payload.get(
+        STREAMED_CONTENT_FIELD
+    ):
+        return payload.get("id")
+    if message_type == WebsocketMessageTypesEnum.MARKET_EVENT_DELTA.value and (
+        STREAMED_CONTENT_FIELD in payload.get("changes", {})
+    ):
+        return payload.get("id")
+    return None
+
+
+def get_content_complete_event_id(data: dict) -> Optional[str]:
+    """
+    Returns the market event id of a content stream completion, or None for other messages.
+    """
+    payload = data.get(WebsocketMessageTypesEnum.MARKET_EVENT_CONTENT_COMPLETE.value)
+    if len(data) == 1 and isinstance(payload, dict):
+        return payload.get("id")
+    return None
+
+
+def build_content_complete_marker(data: dict) -> dict:
+    """
+    Strips the full content from a content stream completion, for clients that
+    assembled it from the deltas.
+    """
+    [(message_type, payload)] = data.items()
+    return {message_type: {**payload, "content": None}}
+
+
+def build_content_resync_message(event_id: str) -> dict:
+    """
+    Builds the message telling a client to discard the partial content of an event.
+    """
+    return {
+        WebsocketMessageTypesEnum.MARKET_EVENT_CONTENT_RESYNC.value: (
+            MarketEventContentResyncSchema(id=event_id).model_dump()
+        )
+    }
+
+
+def merge_market_event_messages(pending: dict, latest: dict) -> dict:
+    """
+    Merges a newer message for a market event into one that has not been sent yet.
+
+    A newer snapshot replaces whatever is pending. A delta is folded into a pending
+    snapshot, or combined with a pending delta so that the result still applies on top
+    of the pending delta's `base_version`.
+
+    Args:
+        pending (dict): The queued message.
+        latest (dict): The message being queued for the same market event.
+
+    Returns:
+        dict: The single message to send instead of both.
+    """
+    [(latest_type, latest_payload)] = latest.items()
+    if latest_type in MARKET_EVENT_SNAPSHOT_TYPES:
+        return latest
+
+    [(pending_type, pending_payload)] = pending.items()
+    if pending_type in MARKET_EVENT_SNAPSHOT_TYPES:
+        merged = {
+            **pending_payload,
+            **latest_payload["changes"],
+            "version": latest_payload["version"],
+            "updated_at": latest_payload["updated_at"],
+        }
+    else:
+        merged = {
+            **latest_payload,
+            "base_version": pending_payload["base_version"],
+            "changes": {**pending_payload["changes"], **latest_payload["changes"]},
+        }
+    return {pending_type: merged}
+
+
+class ClientConnection:
+    """
+    Bounded outbound queue and writer task of a single websocket.
+
+    Producers only enqueue, so a slow client never blocks the Redis listener. With the
+    coalesce policy, a message for a market event that still has one queued is merged into
+    it, so a client that falls behind receives one combined update per event. A message
+    carrying the full streamed content of an event drops the content deltas of the event
+    still pending, which it supersedes. A full queue drops its oldest message; when that
+    is a content delta, the rest of the event's stream is dropped too and the client is
+    sent a resync message instead, so it never applies a stream with gaps; the completion
+    of that stream is then sent with the full content, which every other client only gets
+    as a marker. A client whose
+    sends exceed the send timeout `max_slow_sends` times in a row, whether over several
+    messages or while a single send stalls, is closed.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: str,
+        on_evict: Callable[["ClientConnection"], Awaitable[None]],
+        max_queue_size: int,
+        overflow_policy: QueueOverflowPolicyEnum,
+        send_timeout: float,
+        max_slow_sends: int,
+    ):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.send_timeout = send_timeout
+        self.max_slow_sends = max_slow_sends
+        self._on_evict = on_evict
+        # Entries are [coalesce key, message, serialized message]
+        self._queue: Deque[list] = deque()
+        self._pending_by_key: Dict[str, list] = {}
+        # Events whose content stream was cut, until their full content is queued
+        self._resyncing: Set[str] = set()
+        # Serialized messages sent ahead of the queue
+        self._pending_ahead: Deque[str] = deque()
+        self._has_messages = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.slow_sends = 0
+        self.writer = asyncio.create_task(self._write_loop())
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "user_id": self.user_id,
+            "client": str(self.websocket.client),
+            "queue_depth": len(self._queue),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "slow_sends": self.slow_sends,
+        }
+
+    def enqueue(
+        self, data: dict, text: str, coalesce_key: Optional[str] = None
+    ) -> None:
+        """
+        Queues a message, merging it into a pending one or applying the overflow policy.
+
+        Args:
+            data (dict): The message.
+            text (str): The message serialized once for every connection.
+            coalesce_key (Optional[str]): Key of the market event the message belongs to.
+        """
+        content_event_id = get_content_delta_event_id(data)
+        if content_event_id in self._resyncing:
+            self.dropped += 1
+            return
+        completed_event_id = get_content_complete_event_id(data)
+        if completed_event_id in self._resyncing:
+            # Missed some of the deltas the marker would be checked against
+            text = json.dumps(data)
+            self._resyncing.discard(completed_event_id)
+        full_content_event_id = get_full_content_event_id(data)
+        if full_content_event_id:
+            # Superseded, and would otherwise be applied again after the full content
+            self.coalesced += self._drop_content_deltas(full_content_event_id)
+            self._resyncing.discard(full_content_event_id)
+
+        if self.overflow_policy == QueueOverflowPolicyEnum.COALESCE and coalesce_key:
+            entry = self._pending_by_key.get(coalesce_key)
+            if entry is not None:
+                entry[1] = merge_market_event_messages(entry[1], data)
+                entry[2] = json.dumps(entry[1])
+                self.coalesced += 1
+                return
+
+        if len(self._queue) >= self.max_queue_size:
+            evicted = self._queue.popleft()
+            self._forget(evicted)
+            if get_content_complete_event_id(evicted[1]):
+                # The deltas of its stream are all gone already, so it can go first
+                self._send_ahead(evicted[2])
+            else:
+                self.dropped += 1
+            evicted_event_id = get_content_delta_event_id(evicted[1])
+            if evicted_event_id:
+                self._cut_content_stream(evicted_event_id)
+                if content_event_id == evicted_event_id:
+                    self.dropped += 1
+                    return
+
+        entry = [coalesce_key, data, text]
+        self._queue.append(entry)
+        if coalesce_key:
+            self._pending_by_key[coalesce_key] = entry
+        self._idle.clear()
+        self._has_messages.set()
+
+    def _forget(self, entry: list) -> None:
+        if entry[0] and self._pending_by_key.get(entry[0]) is entry:
+            del self._pending_by_key[entry[0]]
+
+    def _drop_content_deltas(self, event_id: str) -> int:
+        """
+        Removes the pending content deltas of a market event from the queue.
+
+        Returns:
+            int: The number of removed deltas.
+        """
+        kept = deque(
+            entry
+            for entry in self._queue
+            if get_content_delta_event_id(entry[1]) != event_id
+        )
+        removed = len(self._queue) - len(kept)
+        self._queue = kept
+        return removed
+
+    def _cut_content_stream(self, event_id: str) -> None:
+        """
+        Drops the rest of a market event's content stream after one of its deltas was
+        evicted, and schedules a resync message for the client.
+
+        If the completion of the stream is already queued, it is sent with the full
+        content instead of as a marker.
+        """
+        self.dropped += self._drop_content_deltas(event_id)
+        if event_id in self._resyncing:
+            return
+        self._send_ahead(json.dumps(build_content_resync_message(event_id)))
+        for entry in self._queue:
+            if get_content_complete_event_id(entry[1]) == event_id:
+                entry[2] = json.dumps(entry[1])
+                return
+        self._resyncing.add(event_id)
+
+    def _send_ahead(self, text: str) -> None:
+        self._pending_ahead.append(text)
+        self._idle.clear()
+        self._has_messages.set()
+
+    async def join(self) -> None:
+        """
+        Waits until every queued message has been written.
+        """
+        await self._idle.wait()
+
+    def stop(self) -> None:
+        """
+        Stops the writer task, discarding any queued messages.
+        """
+        self._queue.clear()
+        self._pending_by_key.clear()
+        self._resyncing.clear()
+        self._pending_ahead.clear()
+        self._idle.set()
+        if self.writer is not asyncio.current_task():
+            self.writer.cancel()
+
+    async def _send(self, text: str) -> bool:
+        """
+        Writes one message, tracking consecutive send timeouts.
+
+        A slow send is never cancelled mid-frame; it is awaited in steps of the send
+        timeout, each of which that passes with the send still pending counts as another
+        slow send, until it completes or the client has been slow too many times in a row.
+
+        Returns:
+            bool: False if the client must be evicted.
+        """
+        send = asyncio.ensure_future(self.websocket.send_text(text))
+        while True:
+            done, _ = await asyncio.wait({send}, timeout=self.send_timeout)
+            if send in done:
+                send.result()
+                self.slow_sends = 0
+                return True
+
+            self.slow_sends += 1
+            logger.warning(
+                "WebSocket send timed out for %s (%s consecutive)",
+                self.websocket.client,
+                self.slow_sends,
+            )
+            if self.slow_sends >= self.max_slow_sends:
+                send.cancel()
+                return False
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                if self._pending_ahead:
+                    # Resyncs and completions whose event has no deltas left in the queue
+                    text = self._pending_ahead.popleft()
+                elif self._queue:
+                    entry = self._queue.popleft()
+                    self._forget(entry)
+                    text = entry[2]
+                else:
+                    self._idle.set()
+                    self._has_messages.clear()
+                    await self._has_messages.wait()
+                    continue
+
+                if not await self._send(text):
+                    logger.warning("Evicting slow WebSocket client: %s", self.websocket.client)
+                    try:
+                        await self.websocket.close()
+                    except Exception as e:
+                        logger.debug("Error closing slow WebSocket: %s", e)
+                    break
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "WebSocket send failed for user_id=%s: %s", self.user_id, str(e)
+            )
+
+        await self._on_evict(self)
+
 
 class ConnectionManager:
     _instance = None
@@ -20,58 +398,115 @@ class ConnectionManager:
     def __init__(self):
         if self._initialized:
             return
-        self.active_connections: Dict[str, List[WebSocket]] = defaultdict(list)
+        self.active_connections: Dict[str, List[ClientConnection]] = defaultdict(list)
         self.lock = Lock()
+        self.max_queue_size = app_settings.WEBSOCKET_SEND_QUEUE_SIZE
+        self.overflow_policy = QueueOverflowPolicyEnum(
+            app_settings.WEBSOCKET_QUEUE_OVERFLOW_POLICY
+        )
+        self.send_timeout = app_settings.WEBSOCKET_SEND_TIMEOUT_SECONDS
+        self.max_slow_sends = app_settings.WEBSOCKET_MAX_CONSECUTIVE_SLOW_SENDS
         self._initialized = True
 
     async def connect(self, websocket: WebSocket, user_id: str):
         await websocket.accept()
+        connection = ClientConnection(
+            websocket=websocket,
+            user_id=user_id,
+            on_evict=self._evict,
+            max_queue_size=self.max_queue_size,
+            overflow_policy=self.overflow_policy,
+            send_timeout=self.send_timeout,
+            max_slow_sends=self.max_slow_sends,
+        )
         async with self.lock:
-            self.active_connections[user_id].append(websocket)
+            self.active_connections[user_id].append(connection)
         logger.info("WebSocket connected: %s", websocket.client)
 
     async def disconnect(self, websocket: WebSocket, user_id: str):
         async with self.lock:
-            if websocket in self.active_connections[user_id]:
-                self.active_connections[user_id].remove(websocket)
-                if not self.active_connections[user_id]:
-                    del self.active_connections[user_id]
+            connections = self.active_connections.get(user_id, [])
+            for connection in connections:
+                if connection.websocket is websocket:
+                    connections.remove(connection)
+                    connection.stop()
+                    break
+            if user_id in self.active_connections and not connections:
+                del self.active_connections[user_id]
         logger.info("WebSocket disconnected: %s", websocket.client)
 
+    async def _evict(self, connection: ClientConnection) -> None:
+        await self.disconnect(connection.websocket, connection.user_id)
+
+    @property
+    def metrics(self) -> List[Dict[str, Any]]:
+        """
+        Returns the queue depth, sent, dropped and coalesced counters of every connection.
+        """
+        return [
+            connection.metrics
+            for connections in self.active_connections.values()
+            for connection in connections
+        ]
+
+    async def drain(self) -> None:
+        """
+        Waits until every connection has written its queued messages.
+        """
+        async with self.lock:
+            connections = [
+                connection
+                for connections in self.active_connections.values()
+                for connection in connections
+            ]
+        await asyncio.gather(*(connection.join() for connection in connections))
+
+    async def close_all(self) -> None:
+        """
+        Stops the writer task of every connection on shutdown.
+        """
+        async with self.lock:
+            connections = [
+                connection
+                for connections in self.active_connections.values()
+                for connection in connections
+            ]
+            self.active_connections.clear()
+        for connection in connections:
+            connection.stop()
+        await asyncio.gather(
+            *(connection.writer for connection in connections), return_exceptions=True
+        )
+
+    def _fan_out(self, connections: List[ClientConnection], data: dict) -> None:
+        """
+        Serializes the payload once and queues it on every connection.
+
+        A content stream completion is serialized as a marker, without the full content.
+        """
+        if not connections:
+            return
+        if get_content_complete_event_id(data):
+            text = json.dumps(build_content_complete_marker(data))
+        else:
+            text = json.dumps(data)
+        coalesce_key = get_coalesce_key(data)
+        for connection in connections:
+            connection.enqueue(data, text, coalesce_key=coalesce_key)
+
     async def broadcast(self, data: dict) -> None:
         # Shallow copy of current active connections to minimize lock holding
         async with self.lock:
-            connections_snapshot = {
-                user_id: conns[:] for user_id, conns in self.active_connections.items()
-            }
-
-        failed_connections: List[tuple[str, WebSocket]] = []
-
-        # Send the data to all connections
-        for user_id, conns in connections_snapshot.items():
-            for conn in conns:
-                try:
-                    await conn.send_json(data)
-                except Exception as e:
-                    logger.warning(
-                        "WebSocket send failed for user_id=%s: %s", user_id, str(e)
-                    )
-                    failed_connections.append((user_id, conn))
-
-        # Clean up failed connections outside of lock
-        for user_id, conn in failed_connections:
-            await self.disconnect(conn, user_id)
+            connections = [
+                connection
+                for conns in self.active_connections.values()
+                for connection in conns
+            ]
+
+        self._fan_out(connections, data)
 
     async def send_personal_message(self, user_id: str, data: dict):
         async with self.lock:
-            connections = self.active_connections.get(user_id, [])
-        failed_connections = []
-        for conn in connections:
-            try:
-                await conn.send_json(data)
-            except Exception as e:
-                logger.warning("Error sending to WebSocket: %s", e)
-                failed_connections.append(conn)
-
-        for conn in failed_connections:
-            await self.disconnect(conn, user_id)
+            connections = self.active_connections.get(user_id, [])[:]
+
+        self._fan_out(connections, data)
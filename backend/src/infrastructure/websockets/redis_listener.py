@@ -1,79 +1,231 @@
 import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional
-
+import random
+import time
+from collections import deque
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional
+
+from redis import ConnectionPool, Redis
 from redis.asyncio import Redis as AsyncRedis
 
 from config.settings import app_settings
 from src.infrastructure.websockets.connection_manager import ConnectionManager
-from src.schema.utils import WebsocketMessageTypesEnum
+from src.schema.utils import RedisPublishMessageDTO, WebsocketMessageTypesEnum
 
 logger = logging.getLogger(__name__)
 
 
 async def get_redis_connection():
     """Get a Redis connection for the current event loop."""
-    return AsyncRedis(host=app_settings.REDIS_HOST, decode_responses=True)
+    return AsyncRedis(
+        host=app_settings.REDIS_HOST,
+        decode_responses=True,
+        socket_keepalive=True,
+    )
+
+
+class RedisListenerMetrics:
+    """
+    Lag and throughput of the Redis listener in this process.
+
+    Lag is measured from the `updated_at` timestamp that publishers stamp on every update,
+    and throughput is the number of messages received over the last `window_seconds`.
+    """
+
+    def __init__(self, window_seconds: float = 60.0):
+        self.window_seconds = window_seconds
+        self.connected = False
+        self.reconnects = 0
+        self.messages_received = 0
+        self.last_lag_seconds: Optional[float] = None
+        self.max_lag_seconds = 0.0
+        self._received_at: Deque[float] = deque()
+
+    def record_message(self, lag_seconds: Optional[float]) -> None:
+        now = time.monotonic()
+        self.messages_received += 1
+        self._received_at.append(now)
+        while self._received_at and self._received_at[0] < now - self.window_seconds:
+            self._received_at.popleft()
+        if lag_seconds is not None:
+            self.last_lag_seconds = lag_seconds
+            self.max_lag_seconds = max(self.max_lag_seconds, lag_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        recent = [t for t in self._received_at if t >= now - self.window_seconds]
+        return {
+            "connected": self.connected,
+            "reconnects": self.reconnects,
+            "messages_received": self.messages_received,
+            "messages_per_second": len(recent) / self.window_seconds,
+            "last_lag_seconds": self.last_lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+        }
+
+
+listener_metrics = RedisListenerMetrics()
+
+
+def get_message_lag_seconds(data: Dict[str, Any]) -> Optional[float]:
+    """
+    Returns the delay between publishing and receiving an update, if it carries a timestamp.
+    """
+    for payload in data.values():
+        updated_at = payload.get("updated_at") if isinstance(payload, dict) else None
+        if not updated_at:
+            continue
+        try:
+            published_at = datetime.fromisoformat(updated_at)
+        except (TypeError, ValueError):
+            return None
+        if published_at.tzinfo is None:
+            return None
+        return max(0.0, (datetime.now(UTC) - published_at).total_seconds())
+    return None
+
+
+async def dispatch_message(
+    message: Dict[str, Any],
+    connection_manager: ConnectionManager,
+) -> None:
+    """
+    Routes a Redis pub/sub message to the matching websocket connections.
+    """
+    channel = message["channel"]
+    try:
+        data = json.loads(message["data"])
+    except json.JSONDecodeError as e:
+        logger.error("Invalid JSON on channel %s: %s", channel, str(e))
+        return
 
+    listener_metrics.record_message(lag_seconds=get_message_lag_seconds(data))
 
-async def redis_listener():
-    redis_conn = await get_redis_connection()
-    pubsub = redis_conn.pubsub()
-    await pubsub.psubscribe("user_channel_*", "public_channel")
+    # Handle user-specific channels
+    if channel.startswith("user_channel_"):
+        user_id = channel.rsplit("_", 1)[-1]
+        logger.debug("Sending to user_channel: user_id=%s", user_id)
+        await connection_manager.send_personal_message(user_id=user_id, data=data)
 
-    connection_manager = ConnectionManager()
+    # Handle public broadcast
+    elif channel == "public_channel":
+        logger.debug("Broadcasting on public_channel")
+        await connection_manager.broadcast(data)
 
-    try:
-        while True:
-            try:
-                # Use a timeout to prevent blocking indefinitely
-                message = await asyncio.wait_for(
-                    pubsub.get_message(ignore_subscribe_messages=True), timeout=1.0
-                )
+    else:
+        logger.warning("Unhandled Redis channel: %s", channel)
 
-                if not message:
-                    await asyncio.sleep(0.1)  # Prevent CPU spinning
-                    continue
 
+async def redis_listener():
+    """
+    Consumes websocket updates from Redis until cancelled.
+
+    Messages are awaited directly instead of polled, so they are dispatched as soon as they
+    arrive and an idle listener does not wake up. Lost connections are re-established with
+    exponential backoff and jitter.
+    """
+    connection_manager = ConnectionManager()
+    backoff = app_settings.REDIS_LISTENER_RECONNECT_MIN_SECONDS
+
+    while True:
+        redis_conn = await get_redis_connection()
+        pubsub = redis_conn.pubsub()
+        try:
+            await pubsub.psubscribe("user_channel_*", "public_channel")
+            listener_metrics.connected = True
+            backoff = app_settings.REDIS_LISTENER_RECONNECT_MIN_SECONDS
+            logger.info("Redis listener subscribed")
+
+            async for message in pubsub.listen():
                 if message["type"] != "pmessage":
                     continue
-
-                channel = message["channel"]
                 try:
-                    data = json.loads(message["data"])
-                except json.JSONDecodeError as e:
-                    logger.error("Invalid JSON on channel %s: %s", channel, str(e))
-                    continue
-
-                # Handle user-specific channels
-                if channel.startswith("user_channel_"):
-                    user_id = channel.rsplit("_", 1)[-1]
-                    logger.debug("Sending to user_channel: user_id=%s", user_id)
-                    await connection_manager.send_personal_message(
-                        user_id=user_id, data=data
-                    )
-
-                # Handle public broadcast
-                elif channel == "public_channel":
-                    logger.debug("Broadcasting on public_channel")
-                    await connection_manager.broadcast(data)
-
-                else:
-                    logger.warning("Unhandled Redis channel: %s", channel)
-
-            except asyncio.TimeoutError:
-                continue
+                    await dispatch_message(message, connection_manager)
+                except Exception as e:
+                    logger.exception("Error processing Redis message: %s", str(e))
+
+        except asyncio.CancelledError:
+            logger.info("Redis listener cancelled")
+            raise
+        except Exception as e:
+            logger.exception("Redis listener error: %s", str(e))
+        finally:
+            listener_metrics.connected = False
+            try:
+                await pubsub.aclose()
+                await redis_conn.aclose()
             except Exception as e:
-                logger.exception("Error processing Redis message: %s", str(e))
-                await asyncio.sleep(1)  # Wait before retrying on error
-
-    except Exception as e:
-        logger.exception("Redis listener error: %s", str(e))
-    finally:
-        await pubsub.punsubscribe()
-        await pubsub.close()
-        await redis_conn.close()
+                logger.warning("Error closing Redis listener connection: %s", str(e))
+
+        listener_metrics.reconnects += 1
+        delay = backoff + random.uniform(0, backoff / 2)
+        logger.warning("Redis listener reconnecting in %.1fs", delay)
+        await asyncio.sleep(delay)
+        backoff = min(backoff * 2, app_settings.REDIS_LISTENER_RECONNECT_MAX_SECONDS)
+
+
+class RedisPublisher:
+    """
+    Process-wide publisher for websocket updates.
+
+    It is backed by a single synchronous Redis connection pool, which is thread-safe and not
+    bound to an event loop. Connections are therefore reused across every Celery task
+    invocation in the worker process, even though each task runs its own event loop.
+    Several messages can be sent in one pipelined round-trip.
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(RedisPublisher, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self.redis = Redis(
+            connection_pool=ConnectionPool(
+                host=app_settings.REDIS_HOST,
+                decode_responses=True,
+                max_connections=app_settings.REDIS_PUBLISHER_MAX_CONNECTIONS,
+            )
+        )
+        self._initialized = True
+
+    @staticmethod
+    def build_message(message: RedisPublishMessageDTO) -> tuple[str, str]:
+        """
+        Returns the channel and the serialized payload of a websocket update.
+        """
+        channel = (
+            f"user_channel_{message.user_id}" if message.user_id else "public_channel"
+        )
+        return channel, json.dumps({message.data_type: message.data})
+
+    def publish_many(self, messages: List[RedisPublishMessageDTO]) -> None:
+        """
+        Publishes the given messages, in order, in a single pipelined round-trip.
+        """
+        if not messages:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for message in messages:
+            pipe.publish(*self.build_message(message))
+        pipe.execute()
+
+    async def publish_many_async(self, messages: List[RedisPublishMessageDTO]) -> None:
+        """
+        Async variant of `publish_many` that keeps the round-trip off the event loop.
+        """
+        await asyncio.to_thread(self.publish_many, messages)
 
 
 async def publish_updates(
@@ -81,17 +233,15 @@ async def publish_updates(
     data: Dict[str, Any],
     user_id: Optional[str] = None,
 ):
-    redis_conn = None
+    await publish_many_updates(
+        messages=[
+            RedisPublishMessageDTO(data_type=data_type, data=data, user_id=user_id)
+        ]
+    )
+
+
+async def publish_many_updates(messages: List[RedisPublishMessageDTO]):
     try:
-        redis_conn = await get_redis_connection()
-        if user_id:
-            await redis_conn.publish(
-                f"user_channel_{user_id}", json.dumps({data_type: data})
-            )
-        else:
-            await redis_conn.publish("public_channel", json.dumps({data_type: data}))
+        await RedisPublisher().publish_many_async(messages)
     except Exception as e:
         logger.exception("Error publishing Redis message: %s", str(e))
-    finally:
-        if redis_conn:
-            await redis_conn.close()
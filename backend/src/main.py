@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from logging.config import dictConfig
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
@@ -14,7 +14,10 @@ from config.middleware import (
     http_exception_handling_middleware,
     validation_exception_handling_middleware,
 )
+from config.db_connection import db_service
 from config.settings import app_settings
+from src.infrastructure.llm.openai_service import OpenAIServices
+from src.infrastructure.websockets.connection_manager import ConnectionManager
 from src.infrastructure.websockets.redis_listener import redis_listener
 from src.routers.auth import router as auth_router
 from src.routers.health import router as health_router
@@ -47,13 +50,20 @@ logger = logging.getLogger("uvicorn.error")
 async def lifespan(app: FastAPI):
     logger.info("Starting application")
     # Start redis_listener in the background only if configured
-    try:
-        if app_settings.REDIS_HOST:
-            asyncio.create_task(redis_listener())
-    except Exception:
+    listener_task = None
+    if app_settings.REDIS_HOST:
+        listener_task = asyncio.create_task(redis_listener(), name="redis_listener")
+    else:
         logger.warning("Redis listener not started. Check REDIS_HOST configuration.")
     yield
     logger.info("Shutting down application")
+    if listener_task:
+        listener_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener_task
+    await ConnectionManager().close_all()
+    await OpenAIServices.close_async_client()
+    await db_service.close_async_connection()
 
 
 app = FastAPI(
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.db_connection import get_async_db_session
 from config.response_handler import ResponseHandler
 from src.application.users import UserAppServices
 from src.infrastructure.security import get_current_user
@@ -26,7 +28,10 @@ router = APIRouter(
 
 
 @router.post("/signup", response_model=SignUpResponseSchema)
-async def sign_up(user_data: SignupUserRequestSchema):
+async def sign_up(
+    user_data: SignupUserRequestSchema,
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
     """
     Endpoint to register a new user.
 
@@ -41,7 +46,7 @@ async def sign_up(user_data: SignupUserRequestSchema):
     """
 
     try:
-        user_app_services = UserAppServices()
+        user_app_services = UserAppServices(db_session=db_session)
         user = await user_app_services.create_new_user(data=user_data)
         return ResponseHandler.success(
             message=AuthEnums.SIGN_UP_SUCCESS.value,
@@ -52,7 +57,10 @@ async def sign_up(user_data: SignupUserRequestSchema):
 
 
 @router.post("/verify-email", response_model=VerifyEmailResponseSchema)
-async def verify_email(payload: TokenPayload):
+async def verify_email(
+    payload: TokenPayload,
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
     """
     Endpoint to verify a user's email using a verification token.
 
@@ -66,7 +74,7 @@ async def verify_email(payload: TokenPayload):
     - HTTPException: If the verification process fails.
     """
     try:
-        user_app_services = UserAppServices()
+        user_app_services = UserAppServices(db_session=db_session)
         user = await user_app_services.verify_email(token=payload.token)
         return ResponseHandler.success(
             message=AuthEnums.EMAIL_VERIFICATION_SUCCESS.value,
@@ -77,7 +85,10 @@ async def verify_email(payload: TokenPayload):
 
 
 @router.post("/login", response_model=LoginResponseSchema)
-async def login(user_data: LoginUserRequestSchema):
+async def login(
+    user_data: LoginUserRequestSchema,
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
     """
     Endpoint to authenticate a user and generate an access token.
 
@@ -91,7 +102,7 @@ async def login(user_data: LoginUserRequestSchema):
     - HTTPException: If authentication fails.
     """
     try:
-        user_app_services = UserAppServices()
+        user_app_services = UserAppServices(db_session=db_session)
         token_data = await user_app_services.login(data=user_data)
         return ResponseHandler.success(
             message=AuthEnums.LOGIN_SUCCESS.value,
@@ -102,7 +113,10 @@ async def login(user_data: LoginUserRequestSchema):
 
 
 @router.post("/forgot-password", response_model=ForgotPasswordResponseSchema)
-async def forgot_password(data: ForgotPasswordRequestSchema):
+async def forgot_password(
+    data: ForgotPasswordRequestSchema,
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
     """
     Endpoint to initiate the password reset process for a user.
 
@@ -116,7 +130,7 @@ async def forgot_password(data: ForgotPasswordRequestSchema):
     - HTTPException: If the password reset process fails.
     """
     try:
-        user_app_services = UserAppServices()
+        user_app_services = UserAppServices(db_session=db_session)
         await user_app_services.forgot_password(email=data.email)
         return ResponseHandler.success(
             message=AuthEnums.FORGOT_PASSWORD_EMAIL_SENT_SUCCESS.value
@@ -126,7 +140,10 @@ async def forgot_password(data: ForgotPasswordRequestSchema):
 
 
 @router.post("/reset-password", response_model=ResetPasswordResponseSchema)
-async def reset_password(data: ResetPasswordRequestSchema):
+async def reset_password(
+    data: ResetPasswordRequestSchema,
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
     """
     Endpoint to reset a user's password using a reset token.
 
@@ -141,7 +158,7 @@ async def reset_password(data: ResetPasswordRequestSchema):
     """
 
     try:
-        user_app_services = UserAppServices()
+        user_app_services = UserAppServices(db_session=db_session)
         await user_app_services.reset_password(data=data)
         return ResponseHandler.success(message=AuthEnums.RESET_PASSWORD_SUCCESS.value)
     except Exception as e:
@@ -152,6 +169,7 @@ async def reset_password(data: ResetPasswordRequestSchema):
 async def change_password(
     payload: ChangePasswordSchema,
     current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to change the password of the currently logged in user.
@@ -167,7 +185,7 @@ async def change_password(
     """
 
     try:
-        user_app_services = UserAppServices()
+        user_app_services = UserAppServices(db_session=db_session)
         await user_app_services.change_password(
             user_id=current_user["user_id"],
             old_password=payload.old_password,
@@ -1,6 +1,11 @@
+import asyncio
+
 from fastapi import APIRouter
 
 from config.settings import app_settings
+from src.infrastructure.news_fetcher.scheduler import fetch_scheduler
+from src.infrastructure.websockets.connection_manager import ConnectionManager
+from src.infrastructure.websockets.redis_listener import listener_metrics
 
 
 router = APIRouter(prefix="/health", tags=["Health"], include_in_schema=False)
@@ -14,3 +19,18 @@ async def healthcheck():
         "version": app_settings.APP_VERSION,
         "environment": app_settings.ENVIRONMENT,
     }
+
+
+@router.get("/redis-listener")
+async def redis_listener_healthcheck():
+    return listener_metrics.snapshot()
+
+
+@router.get("/websockets")
+async def websockets_healthcheck():
+    return {"connections": ConnectionManager().metrics}
+
+
+@router.get("/fetch-scheduler")
+async def fetch_scheduler_healthcheck():
+    return {"sources": await asyncio.to_thread(fetch_scheduler.snapshot)}
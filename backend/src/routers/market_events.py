@@ -1,5 +1,9 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Query, WebSocket
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.db_connection import get_async_db_session
 from config.response_handler import ResponseHandler
 from src.application.market_events import MarketEventAppServices
 from src.infrastructure.security import get_current_user
@@ -40,7 +44,10 @@ async def get_market_events(
     limit: int = Query(
         10, le=100
     ),  # Default to 10 entries per page, with max limit of 100
+    cursor: Optional[str] = Query(None),  # `next_cursor` of the previous page
+    include_total: bool = Query(True),
     current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to retrieve a list of market events with optional search and pagination.
@@ -53,17 +60,23 @@ async def get_market_events(
     - search_term (str): An optional term to search for in the market events.
     - page (int): The page number for pagination. Defaults to 1.
     - limit (int): The number of events to return per page. Defaults to 10.
+    - cursor (Optional[str]): The `next_cursor` of the previous page. Takes precedence
+      over page and cannot be combined with a search term.
+    - include_total (bool): Whether to count total_records and total_pages. Defaults to
+      True.
     - current_user (dict): The currently authenticated user.
 
     `Returns:`
     - GetMarketEventsResponseSchema: A response schema containing the list of market events.
     """
 
-    market_event_app_services = MarketEventAppServices()
+    market_event_app_services = MarketEventAppServices(db_session=db_session)
     data = await market_event_app_services.get_market_events_listings(
         search_term=search_term,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
         current_user=current_user,
     )
     return ResponseHandler.success_listings(
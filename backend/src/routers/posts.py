@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.db_connection import get_async_db_session
 from config.response_handler import ResponseHandler
 from src.application.posts import PostAppServices
 from src.infrastructure.security import get_current_user
@@ -26,6 +28,7 @@ router = APIRouter(
 async def get_posts_listings(
     query_params: GetPostsListingsQueryParams = Depends(),
     current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to get Post list with search and pagination.
@@ -37,7 +40,7 @@ async def get_posts_listings(
     `Returns:`
     - GetPostDataResponseSchema: List of Posts.
     """
-    post_app_services = PostAppServices()
+    post_app_services = PostAppServices(db_session=db_session)
     data = await post_app_services.get_posts_listings(
         query_params=query_params,
         current_user=current_user,
@@ -50,7 +53,9 @@ async def get_posts_listings(
 
 @router.get("/details/{post_id}", response_model=GetPostDetailsResponseSchema)
 async def get_post_details_by_id(
-    post_id: str, current_user: dict = Depends(get_current_user)
+    post_id: str,
+    current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to get a single Post by ID.
@@ -61,7 +66,7 @@ async def get_post_details_by_id(
     `Returns:`
     - GetPostDetailsResponseSchema: Post details.
     """
-    post_app_services = PostAppServices()
+    post_app_services = PostAppServices(db_session=db_session)
     post = await post_app_services.get_post_details_by_id(
         current_user=current_user,
         post_id=post_id,
@@ -76,6 +81,7 @@ async def get_post_details_by_id(
 async def create_post_from_market_event_id(
     payload: CreatePostRequestSchema,
     current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to create a post from a market event ID.
@@ -88,7 +94,7 @@ async def create_post_from_market_event_id(
     - CreatePostResponseSchema: The response schema containing the created post data.
     """
 
-    post_app_services = PostAppServices()
+    post_app_services = PostAppServices(db_session=db_session)
     post = await post_app_services.create_post_from_market_event_id(
         market_event_id=payload.market_event_id,
         current_user=current_user,
@@ -105,6 +111,7 @@ async def update_post_description_or_status_by_id(
     payload: UpdatePostRequestSchema,
     post_id: str,
     current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to update a post description or status.
@@ -118,7 +125,7 @@ async def update_post_description_or_status_by_id(
     `Returns:`
     - UpdatePostResponseSchema: The response schema containing the updated post data.
     """
-    post_app_services = PostAppServices()
+    post_app_services = PostAppServices(db_session=db_session)
     post = await post_app_services.update_post(
         post_id=post_id,
         post_data=payload,
@@ -134,6 +141,7 @@ async def update_post_description_or_status_by_id(
 async def publish_posts_by_ids(
     payload: PublishPostsRequestSchema,
     current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to publish multiple posts by their IDs.
@@ -146,7 +154,7 @@ async def publish_posts_by_ids(
     - PublishPostsResponseSchema: The response schema containing the result of the publish operation.
     """
 
-    post_app_services = PostAppServices()
+    post_app_services = PostAppServices(db_session=db_session)
     post = await post_app_services.publish_posts_by_ids(
         payload=payload,
         current_user=current_user,
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.db_connection import get_async_db_session
 from config.response_handler import ResponseHandler
 from src.application.users import UserAppServices
 from src.infrastructure.security import get_current_user
@@ -18,7 +20,10 @@ router = APIRouter(
 
 
 @router.get("/me", response_model=UserProfileResponseSchema)
-async def get_user_profile(current_user: dict = Depends(get_current_user)):
+async def get_user_profile(
+    current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+):
     """
     Endpoint to retrieve the profile of the logged-in user.
 
@@ -31,7 +36,7 @@ async def get_user_profile(current_user: dict = Depends(get_current_user)):
     `Raises:`
     - HTTPException: If an error occurs while retrieving the user profile.
     """
-    user_app_services = UserAppServices()
+    user_app_services = UserAppServices(db_session=db_session)
     user = await user_app_services.get_user_profile(user_id=current_user["user_id"])
     return ResponseHandler.success(
         message=UserEnums.USER_FETCH_SUCCESS,
@@ -43,6 +48,7 @@ async def get_user_profile(current_user: dict = Depends(get_current_user)):
 async def update_user_profile(
     user_data: UpdateUserRequestSchema,
     current_user: dict = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Endpoint to update the profile of the logged-in user.
@@ -57,7 +63,7 @@ async def update_user_profile(
     `Raises:`
     - HTTPException: If an error occurs while updating the user profile.
     """
-    user_app_services = UserAppServices()
+    user_app_services = UserAppServices(db_session=db_session)
     user = await user_app_services.update_user_profile(
         user_id=current_user["user_id"],
         updated_user_data=user_data,
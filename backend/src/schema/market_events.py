@@ -1,9 +1,10 @@
+import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import status
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from src.domain.enums import (
     MarketEvenProcessingtStatus,
@@ -53,6 +54,26 @@ class UpdateMarketEventSchema(BaseModel):
     source: Optional[MarketEventSource] = None
 
 
+class MarketEventAnalyticsSchema(BaseModel):
+    """
+    Schema for the combined sentiment, priority and compliance analytics of a market event.
+    """
+
+    sentimental_analysis: SentimentalAnalysis
+    priority_flag: PriorityFlag
+    compliance_check: str
+
+    @field_validator("sentimental_analysis", "priority_flag", mode="before")
+    @classmethod
+    def normalize_enum_value(cls, v):
+        return v.strip().upper() if isinstance(v, str) else v
+
+    @field_validator("compliance_check", mode="before")
+    @classmethod
+    def stringify_compliance_check(cls, v):
+        return json.dumps(v) if isinstance(v, (dict, list)) else v
+
+
 class RunTimeMarketEventSchema(UpdateMarketEventSchema):
     """
     Schema for runtime market event.
@@ -71,6 +92,62 @@ class RunTimeMarketEventSchema(UpdateMarketEventSchema):
     source: Optional[MarketEventSource] = None
     editable: bool = False
     updated_at: str
+    version: int = 0
+
+
+class MarketEventDeltaSchema(BaseModel):
+    """
+    Schema for the fields of a runtime market event that changed since an earlier version.
+
+    A client holding `base_version` of the event reaches `version` by applying `changes`.
+    """
+
+    id: str
+    base_version: int
+    version: int
+    changes: Dict[str, Any]
+    updated_at: str
+
+
+class MarketEventContentDeltaSchema(BaseModel):
+    """
+    Schema for an incremental piece of streamed market event content.
+    """
+
+    id: str
+    field: str = "deep_research_content"
+    delta: str
+    sequence: int
+    updated_at: str
+
+
+class MarketEventContentResyncSchema(BaseModel):
+    """
+    Schema telling a client that streamed content deltas of a market event were dropped.
+
+    The client discards the partial content; the full value arrives with the completion
+    of the stream, or with the next update of the event.
+    """
+
+    id: str
+    field: str = "deep_research_content"
+
+
+class MarketEventContentCompleteSchema(BaseModel):
+    """
+    Schema marking the end of the streamed content of a market event.
+
+    Clients that received every delta get `sequence` and `length` to check the content
+    they assembled against. `content` is published for clients whose stream was cut, and
+    only sent to them.
+    """
+
+    id: str
+    field: str = "deep_research_content"
+    sequence: int
+    length: int
+    content: Optional[str] = None
+    updated_at: str
 
 
 class GetMarketEventsResponseSchema(BaseModel):
@@ -83,10 +160,11 @@ class GetMarketEventsResponseSchema(BaseModel):
     message: str = "Market events fetched successfully"
     page: int = 1
     limit: int = 10
-    total_pages: int = 1
-    total_records: int = 1
+    total_pages: Optional[int] = 1
+    total_records: Optional[int] = 1
     has_next: bool = False
     has_previous: bool = False
+    next_cursor: Optional[str] = None
     data: list[MarketEventDataModelSchema]
 
     model_config = ConfigDict(
@@ -101,6 +179,7 @@ class GetMarketEventsResponseSchema(BaseModel):
                 "total_records": 46,
                 "has_next": False,
                 "has_previous": False,
+                "next_cursor": None,
                 "data": [
                     {
                         "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -149,10 +228,11 @@ class MarketEventResponseSchema(BaseModel):
 
     page: int
     limit: int
-    total_pages: int
-    total_records: int
+    total_pages: Optional[int]
+    total_records: Optional[int]
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
     data: List[MarketEventDataModelSchema]
 
 
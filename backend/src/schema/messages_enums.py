@@ -20,6 +20,8 @@ class AuthEnums(str, Enum):
 class GeneralEnums(str, Enum):
     INTERNAL_SERVER_ERROR = "Internal server error"
     NOT_AUTHORIZED = "You are not authorized to perform this action"
+    INVALID_CURSOR = "Invalid pagination cursor"
+    CURSOR_WITH_SEARCH = "Cursor pagination is not available when searching"
 
 
 class UserEnums(str, Enum):
@@ -5,7 +5,12 @@ from uuid import UUID
 from fastapi import status
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from src.domain.enums import ContentTone, PostStatus, MarketEventSource
+from src.domain.enums import (
+    ContentTone,
+    MarketEventSource,
+    PostStatus,
+    PublishPostOutcome,
+)
 
 
 class PostDataModelSchema(BaseModel):
@@ -51,6 +56,13 @@ class GetPostsListingsQueryParams(BaseModel):
     limit: int = Field(
         10, le=100, description="Number of entries per page (default: 10, max: 100)"
     )
+    cursor: Optional[str] = Field(
+        None,
+        description="`next_cursor` of the previous page; takes precedence over page",
+    )
+    include_total: bool = Field(
+        True, description="Whether to count total_records and total_pages"
+    )
     status: Optional[PostStatus] = Field(None, description="Filter posts by status")
     source: Optional[MarketEventSource] = Field(
         None, description="Filter by market event source"
@@ -159,10 +171,11 @@ class GetPostDataResponseSchema(BaseModel):
     message: str = "Post fetched successfully"
     page: int = 1
     limit: int = 10
-    total_pages: int = 1
-    total_records: int = 1
+    total_pages: Optional[int] = 1
+    total_records: Optional[int] = 1
     has_next: bool = False
     has_previous: bool = False
+    next_cursor: Optional[str] = None
     data: list[GetPostDataModelSchema]
 
     model_config = ConfigDict(
@@ -177,6 +190,7 @@ class GetPostDataResponseSchema(BaseModel):
                 "total_records": 1,
                 "has_next": False,
                 "has_previous": False,
+                "next_cursor": None,
                 "data": [
                     {
                         "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -298,6 +312,16 @@ class ApprovePostResponseSchema(BaseModel):
     )
 
 
+class PublishPostResultSchema(BaseModel):
+    """
+    Schema for the outcome of publishing one post.
+    """
+
+    id: UUID
+    outcome: PublishPostOutcome
+    post: Optional[PostDataModelSchema] = None
+
+
 class PublishPostsResponseSchema(BaseModel):
     """
     Schema for a post.
@@ -306,7 +330,7 @@ class PublishPostsResponseSchema(BaseModel):
     success: bool = True
     status_code: int = status.HTTP_200_OK
     message: str = "Posts published successfully"
-    data: list[PostDataModelSchema]
+    data: list[PublishPostResultSchema]
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -317,23 +341,22 @@ class PublishPostsResponseSchema(BaseModel):
                 "data": [
                     {
                         "id": "123e4567-e89b-12d3-a456-426614174000",
-                        "title": "Post 1",
-                        "description": "Post 1 description",
-                        "market_event_id": "123e4567-e89b-12d3-a456-426614174000",
-                        "is_customized": False,
-                        "status": "PUBLISHED",
-                        "created_at": "2021-01-01 00:00:00",
-                        "updated_at": "2021-01-01 00:00:00",
+                        "outcome": "Published",
+                        "post": {
+                            "id": "123e4567-e89b-12d3-a456-426614174000",
+                            "title": "Post 1",
+                            "description": "Post 1 description",
+                            "market_event_id": "123e4567-e89b-12d3-a456-426614174000",
+                            "is_customized": False,
+                            "status": "Published",
+                            "created_at": "2021-01-01 00:00:00",
+                            "updated_at": "2021-01-01 00:00:00",
+                        },
                     },
                     {
                         "id": "123e4567-e89b-12d3-a456-426614174001",
-                        "title": "Post 2",
-                        "description": "Post 2 description",
-                        "market_event_id": "123e4567-e89b-12d3-a456-426614174001",
-                        "is_customized": False,
-                        "status": "PUBLISHED",
-                        "created_at": "2021-01-01 00:00:00",
-                        "updated_at": "2021-01-01 00:00:00",
+                        "outcome": "Not approved",
+                        "post": None,
                     },
                 ],
             }
@@ -370,10 +393,11 @@ class PostDataResponseSchema(BaseModel):
 
     page: int = 1
     limit: int = 10
-    total_pages: int = 1
-    total_records: int = 1
+    total_pages: Optional[int] = 1
+    total_records: Optional[int] = 1
     has_next: bool = False
     has_previous: bool = False
+    next_cursor: Optional[str] = None
     data: List[GetPostDataModelSchema]
 
     model_config = ConfigDict(
@@ -385,6 +409,7 @@ class PostDataResponseSchema(BaseModel):
                 "total_records": 1,
                 "has_next": False,
                 "has_previous": False,
+                "next_cursor": None,
                 "data": [
                     {
                         "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -435,6 +460,13 @@ class GetPublishedPostsListingsQueryParams(BaseModel):
     limit: int = Field(
         10, le=100, description="Number of entries per page (default: 10, max: 100)"
     )
+    cursor: Optional[str] = Field(
+        None,
+        description="`next_cursor` of the previous page; takes precedence over page",
+    )
+    include_total: bool = Field(
+        True, description="Whether to count total_records and total_pages"
+    )
     source: Optional[MarketEventSource] = Field(
         None, description="Filter by market event source"
     )
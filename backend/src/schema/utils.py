@@ -1,5 +1,9 @@
+import base64
+import json
+from datetime import datetime
 from enum import Enum
-from typing import NamedTuple
+from typing import Any, Dict, List, NamedTuple, Optional
+from uuid import UUID
 
 from config.prompts import (
     FINANCIAL_DATA_SYSTEM_PROMPT,
@@ -7,6 +11,7 @@ from config.prompts import (
     GENERATE_EVENT_TITLE_SYSTEM_PROMPT,
     GENERATE_SUMMARIZED_CONTENT_FROM_DEEP_RESEARCH_SYSTEM_PROMPT,
     GET_COMPLIANCE_CHECK_SYSTEM_PROMPT,
+    GET_MARKET_EVENT_ANALYTICS_SYSTEM_PROMPT,
     GET_PRIORITY_FLAG_SYSTEM_PROMPT,
     GET_SENTIMENTAL_ANALYSIS_SYSTEM_PROMPT,
     REVISING_FINANCIAL_CONTENT_WITH_TONE_CONTROL_USER_PROMPT,
@@ -22,6 +27,97 @@ class GetTimeRangeResponseDTO(NamedTuple):
     time_to: str
 
 
+class DeduplicatedArticlesDTO(NamedTuple):
+    """
+    Data Transfer Object for the result of article deduplication.
+    """
+
+    articles: List[dict]
+    dropped: int
+
+
+class FetchedArticlesDTO(NamedTuple):
+    """
+    Data Transfer Object for the new articles of a fetch and its financial ones.
+    """
+
+    articles: List[dict]
+    financial_articles: List[dict]
+
+
+class FetchWatermarkDTO(NamedTuple):
+    """
+    Publish time and ID of the newest article fetched from a news source.
+
+    Only `published_at` orders watermarks; the ID tells which article set it.
+    """
+
+    published_at: datetime
+    article_id: str
+
+
+class RateLimitDTO(NamedTuple):
+    """
+    Rate-limit state reported by a third-party API in its response headers.
+    """
+
+    remaining: Optional[int] = None
+    limit: Optional[int] = None
+    reset_seconds: Optional[float] = None
+
+
+class RateLimitBudgetDTO(NamedTuple):
+    """
+    Requests and tokens per minute allowed to a rate-limited provider; 0 is unlimited.
+    """
+
+    requests_per_minute: int
+    tokens_per_minute: int
+
+
+class FetchSchedulePolicyDTO(NamedTuple):
+    """
+    Base, shortest and longest interval in seconds between two fetches of a source.
+    """
+
+    base_interval: int
+    min_interval: int
+    max_interval: int
+
+
+class ListingCursorDTO(NamedTuple):
+    """
+    Position of the last row of a listing page ordered by (updated_at, id) descending.
+    """
+
+    updated_at: datetime
+    id: str
+
+    def encode(self) -> str:
+        """
+        Returns the opaque, URL-safe cursor handed to clients.
+        """
+        payload = json.dumps([self.updated_at.isoformat(), str(self.id)])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "ListingCursorDTO":
+        """
+        Parses a cursor built by `encode`.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            updated_at, id = json.loads(payload)
+            return cls(
+                updated_at=datetime.fromisoformat(updated_at), id=str(UUID(id))
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid listing cursor") from e
+
+
 class PromptEnum(str, Enum):
     """
     Enum for available prompts.
@@ -38,6 +134,7 @@ class PromptEnum(str, Enum):
     GET_SENTIMENTAL_ANALYSIS_SYSTEM_PROMPT = GET_SENTIMENTAL_ANALYSIS_SYSTEM_PROMPT
     GET_PRIORITY_FLAG_SYSTEM_PROMPT = GET_PRIORITY_FLAG_SYSTEM_PROMPT
     GET_COMPLIANCE_CHECK_SYSTEM_PROMPT = GET_COMPLIANCE_CHECK_SYSTEM_PROMPT
+    GET_MARKET_EVENT_ANALYTICS_SYSTEM_PROMPT = GET_MARKET_EVENT_ANALYTICS_SYSTEM_PROMPT
     REVISING_FINANCIAL_CONTENT_WITH_TONE_CONTROL_USER_PROMPT = (
         REVISING_FINANCIAL_CONTENT_WITH_TONE_CONTROL_USER_PROMPT
     )
@@ -50,3 +147,58 @@ class WebsocketMessageTypesEnum(str, Enum):
 
     LIVE_EVENTS = "live_events"
     USER_CUSTOM_EVENT = "user_custom_event"
+    MARKET_EVENT_CONTENT_DELTA = "market_event_content_delta"
+    MARKET_EVENT_DELTA = "market_event_delta"
+    MARKET_EVENT_CONTENT_RESYNC = "market_event_content_resync"
+    MARKET_EVENT_CONTENT_COMPLETE = "market_event_content_complete"
+
+
+class QueueOverflowPolicyEnum(str, Enum):
+    """
+    Enum for what a websocket send queue does when it is full.
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+class RateLimitedProviderEnum(str, Enum):
+    """
+    Enum for the third-party APIs called within a shared rate limit.
+    """
+
+    OPENAI = "openai"
+    ALPHA_VANTAGE = "alpha_vantage"
+    EVENT_REGISTRY = "event_registry"
+
+
+class FetchIntervalReasonEnum(str, Enum):
+    """
+    Enum for why the adaptive scheduler chose the interval until the next fetch.
+    """
+
+    BASELINE = "baseline"
+    HOT_NEWS = "hot_news"
+    QUIET = "quiet"
+    QUEUE_SATURATED = "queue_saturated"
+    RATE_LIMITED = "rate_limited"
+    FAILED = "failed"
+
+
+class FetchIntervalDTO(NamedTuple):
+    """
+    Data Transfer Object for the interval chosen until the next fetch of a source.
+    """
+
+    interval_seconds: int
+    reason: FetchIntervalReasonEnum
+
+
+class RedisPublishMessageDTO(NamedTuple):
+    """
+    Data Transfer Object for a websocket update published through Redis.
+    """
+
+    data_type: WebsocketMessageTypesEnum
+    data: Dict[str, Any]
+    user_id: Optional[str] = None
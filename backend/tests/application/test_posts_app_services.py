@@ -1,16 +1,21 @@
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
+from uuid import uuid4
+
 import pytest
 
 from src.application.posts import PostAppServices
-from src.domain.enums import PostStatus
+from src.domain.enums import MarketEventSource, PostStatus
+from src.exceptions.pagination import InvalidCursorException
 from src.schema.posts import GetPostsListingsQueryParams
+from src.schema.utils import ListingCursorDTO
 
 
 class FakePostDomainServices:
     def __init__(self):
         self.calls = []
 
-    def get_posts_by_user_id(self, *, offset, limit, search_term, status, source, start_date, end_date, user_id):
+    async def get_posts_by_user_id_async(self, *, offset, limit, search_term, status, source, start_date, end_date, user_id, after=None, include_total=True):
         self.calls.append(
             {
                 "offset": offset,
@@ -21,6 +26,8 @@ class FakePostDomainServices:
                 "start_date": start_date,
                 "end_date": end_date,
                 "user_id": user_id,
+                "after": after,
+                "include_total": include_total,
             }
         )
         # Return minimal data structures matching app expectations
@@ -52,6 +59,68 @@ async def test_get_posts_listings_paginates_and_maps(monkeypatch):
     assert fake_domain.calls[0]["user_id"] == "u1"
 
 
+@pytest.mark.asyncio
+async def test_get_posts_listings_follows_cursor_without_counting(monkeypatch):
+    app = PostAppServices()
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    posts = [
+        SimpleNamespace(
+            id=uuid4(), title="t", description="d", market_event_id=uuid4(),
+            is_customized=False, status=PostStatus.DRAFT, created_at=now,
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(3)
+    ]
+    calls = []
+
+    class FakeDomain:
+        async def get_posts_by_user_id_async(self, *, limit, after, include_total, **kwargs):
+            calls.append({"limit": limit, "after": after, "offset": kwargs["offset"]})
+            remaining = [p for p in posts if after is None or p.updated_at < after.updated_at]
+            return [(post, MarketEventSource.CUSTOM_EVENT) for post in remaining[:limit]], None
+
+    monkeypatch.setattr(app, "post_domain_services", FakeDomain())
+    current_user = {"user_id": "u1"}
+
+    first = await app.get_posts_listings(
+        current_user=current_user,
+        query_params=GetPostsListingsQueryParams(limit=2, include_total=False),
+    )
+    second = await app.get_posts_listings(
+        current_user=current_user,
+        query_params=GetPostsListingsQueryParams(
+            limit=2, include_total=False, cursor=first.next_cursor
+        ),
+    )
+
+    assert [post.id for post in first.data] == [posts[0].id, posts[1].id]
+    assert first.has_next and first.total_records is None
+    assert calls[0]["limit"] == 3
+    assert calls[1]["after"] == ListingCursorDTO(posts[1].updated_at, str(posts[1].id))
+    assert calls[1]["offset"] == 0
+    assert [post.id for post in second.data] == [posts[2].id]
+    assert not second.has_next and second.next_cursor is None
+    assert second.has_previous
+
+
+@pytest.mark.asyncio
+async def test_get_posts_listings_rejects_bad_cursors():
+    app = PostAppServices()
+
+    with pytest.raises(InvalidCursorException):
+        await app.get_posts_listings(
+            current_user={"user_id": "u1"},
+            query_params=GetPostsListingsQueryParams(cursor="not-a-cursor"),
+        )
+
+    cursor = ListingCursorDTO(datetime.now(timezone.utc), str(uuid4())).encode()
+    with pytest.raises(InvalidCursorException):
+        await app.get_posts_listings(
+            current_user={"user_id": "u1"},
+            query_params=GetPostsListingsQueryParams(cursor=cursor, search="fed"),
+        )
+
+
 @pytest.mark.asyncio
 async def test_create_customized_post_triggers_background_task(monkeypatch):
     app = PostAppServices()
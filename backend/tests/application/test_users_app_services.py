@@ -8,7 +8,7 @@ class FakeUserDomain:
         self.created = None
         self.updated = []
 
-    def get_user_by_email(self, email):
+    async def get_user_by_email_async(self, email):
         return None
 
     def get_user_factory(self):
@@ -27,11 +27,11 @@ class FakeUserDomain:
 
         return F
 
-    def create_user(self, user):
+    async def create_user_async(self, user):
         self.created = user
         return user
 
-    def get_user_by_id(self, user_id):
+    async def get_user_by_id_async(self, user_id):
         class U:
             def __init__(self):
                 self.id = user_id
@@ -42,9 +42,9 @@ class FakeUserDomain:
 
         return U()
 
-    def update_user_by_id(self, user_id, data):
+    async def update_user_by_id_async(self, user_id, data):
         self.updated.append((user_id, data))
-        return self.get_user_by_id(user_id)
+        return await self.get_user_by_id_async(user_id)
 
 
 class FakeEmail:
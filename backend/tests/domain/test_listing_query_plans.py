@@ -0,0 +1,185 @@
+import hashlib
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+
+from src.domain.enums import PostStatus
+from src.domain.market_events.services import MarketEventDomainServices
+from src.domain.posts.models import Post
+from src.domain.posts.services import PostDomainServices
+from src.domain.utils import build_keyset_criterion
+from src.schema.utils import ListingCursorDTO
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+ROWS = 1_000_000
+USERS = 1_000
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="TEST_DATABASE_URL must point at a disposable PostgreSQL database",
+)
+
+
+def seeded_uuid(prefix: str, number: int) -> uuid.UUID:
+    """
+    Mirrors the `md5(prefix || number)::uuid` ids generated by the seed SQL.
+    """
+    return uuid.UUID(hashlib.md5(f"{prefix}{number}".encode()).hexdigest())
+
+
+def reset_schema(engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """
+    Migrates an empty database to head, so plans are checked against the indexes the
+    migrations actually create, and seeds it.
+    """
+    engine = create_engine(TEST_DATABASE_URL)
+    reset_schema(engine)
+    # Built without alembic.ini, whose logging config would replace the test logging
+    alembic_config = Config()
+    alembic_config.set_main_option("script_location", str(ALEMBIC_DIR))
+    alembic_config.attributes["sqlalchemy.url"] = TEST_DATABASE_URL
+    command.upgrade(alembic_config, "head")
+
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                """
+                INSERT INTO users (id, username, email, password, is_verified, updated_at)
+                SELECT md5('user' || i)::uuid, 'user' || i, 'user' || i || '@example.com',
+                       'x', true, now()
+                FROM generate_series(1, :users) AS i
+                """
+            ),
+            {"users": USERS},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO market_events (
+                    id, title, description, processing_status, source, is_customized,
+                    updated_at
+                )
+                SELECT md5('event' || i)::uuid, 'event ' || i, 'description ' || i,
+                       (ARRAY['RESEARCHING', 'WRITING', 'FETCHING_ANALYTICS', 'DRAFTED',
+                              'FAILED'])[1 + i % 5]::marketevenprocessingtstatus,
+                       'EVENT_REGISTRY_API'::marketeventsource, false,
+                       now() - i * interval '1 second'
+                FROM generate_series(1, :rows) AS i
+                """
+            ),
+            {"rows": ROWS},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO posts (
+                    id, title, description, user_id, market_event_id, status,
+                    is_customized, updated_at
+                )
+                SELECT md5('post' || i)::uuid, 'post ' || i, 'description ' || i,
+                       md5('user' || (1 + i % :users))::uuid, md5('event' || i)::uuid,
+                       (ARRAY['DRAFT', 'APPROVED', 'PUBLISHED'])[1 + i % 3]::poststatus,
+                       false, now() - i * interval '1 second'
+                FROM generate_series(1, :rows) AS i
+                """
+            ),
+            {"rows": ROWS, "users": USERS},
+        )
+        connection.execute(text("ANALYZE"))
+
+    yield engine
+
+    reset_schema(engine)
+    engine.dispose()
+
+
+def get_scans(engine, statement) -> set[tuple[str, str]]:
+    """
+    Returns the (node type, relation) of every scan in the plan of the given statement.
+    """
+    sql = statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    with engine.connect() as connection:
+        [explained] = connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+
+    scans = set()
+    nodes = [explained["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Relation Name" in node:
+            scans.add((node["Node Type"], node["Relation Name"]))
+        nodes.extend(node.get("Plans", []))
+    return scans
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        pytest.param(
+            PostDomainServices._build_posts_listing_statement(
+                user_id=seeded_uuid("user", 1)
+            ).limit(10),
+            id="user-posts",
+        ),
+        pytest.param(
+            PostDomainServices._build_posts_listing_statement(
+                status=PostStatus.PUBLISHED
+            ).limit(10),
+            id="published-posts",
+        ),
+        pytest.param(
+            PostDomainServices._build_posts_listing_statement(
+                user_id=seeded_uuid("user", 1)
+            )
+            .where(
+                build_keyset_criterion(
+                    Post.updated_at,
+                    Post.id,
+                    ListingCursorDTO(
+                        updated_at=datetime.now(timezone.utc) - timedelta(days=5),
+                        id=str(seeded_uuid("post", 432_000)),
+                    ),
+                )
+            )
+            .limit(10),
+            id="user-posts-after-cursor",
+        ),
+        pytest.param(
+            MarketEventDomainServices._build_market_events_listing_statement().limit(10),
+            id="drafted-market-events-with-post-generated",
+        ),
+        pytest.param(
+            PostDomainServices._build_posts_listing_statement(
+                search_term="post 123456"
+            ).limit(10),
+            id="posts-search",
+        ),
+        pytest.param(
+            MarketEventDomainServices._build_market_events_listing_statement(
+                search_term="event 123456"
+            ).limit(10),
+            id="market-events-search",
+        ),
+    ],
+)
+def test_listing_queries_do_not_scan_whole_tables(engine, statement):
+    scans = get_scans(engine, statement)
+
+    assert ("Seq Scan", "posts") not in scans
+    assert ("Seq Scan", "market_events") not in scans
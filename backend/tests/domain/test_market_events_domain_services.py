@@ -0,0 +1,93 @@
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.domain.enums import MarketEventSource
+from src.domain.market_events.services import (
+    MarketEventDataClass,
+    MarketEventDomainServices,
+)
+from src.schema.market_events import UpdateMarketEventSchema
+
+
+def test_create_market_events_inserts_all_rows_in_one_statement():
+    class FakeResult:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def scalars(self):
+            return iter(self.rows)
+
+    class FakeSession:
+        def __init__(self):
+            self.executions = []
+            self.committed = False
+
+        def execute(self, statement, parameters):
+            self.executions.append((statement, parameters))
+            return FakeResult([row["id"] for row in parameters])
+
+        def commit(self):
+            self.committed = True
+
+    session = FakeSession()
+    market_events_data = [
+        MarketEventDataClass(
+            title=f"event {i}",
+            description="d",
+            source=MarketEventSource.ALPHA_VANTAGE_API,
+        )
+        for i in range(3)
+    ]
+
+    ids = MarketEventDomainServices(db_session=session).create_market_events(
+        market_events_data=market_events_data
+    )
+
+    [(statement, parameters)] = session.executions
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO market_events")
+    assert sql.endswith("RETURNING market_events.id")
+    assert [row["title"] for row in parameters] == ["event 0", "event 1", "event 2"]
+    assert ids == [row["id"] for row in parameters]
+    assert session.committed
+
+
+def test_create_market_events_skips_empty_batches():
+    class FailingSession:
+        def execute(self, *args):
+            raise AssertionError("no statement expected")
+
+    assert (
+        MarketEventDomainServices(db_session=FailingSession()).create_market_events(
+            market_events_data=[]
+        )
+        == []
+    )
+
+
+def test_update_market_event_by_id_is_a_single_update_returning():
+    class FakeScalars:
+        def one_or_none(self):
+            return "event"
+
+    class FakeSession:
+        def __init__(self):
+            self.statements = []
+
+        def scalars(self, statement):
+            self.statements.append(statement)
+            return FakeScalars()
+
+        def commit(self):
+            pass
+
+    session = FakeSession()
+    MarketEventDomainServices(db_session=session).update_market_event_by_id(
+        id=str(uuid4()), market_event_data=UpdateMarketEventSchema(banner="b")
+    )
+
+    [statement] = session.statements
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE market_events SET banner=")
+    assert "RETURNING" in sql
@@ -1,8 +1,21 @@
+from datetime import datetime
 from types import SimpleNamespace
-from src.domain.enums import PostStatus
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from config.settings import app_settings
+from src.domain.enums import PostStatus, PublishPostOutcome
 from src.domain.posts.models import Post
 from src.domain.posts.services import PostDataClass, PostDomainServices, PostFactory
-from src.schema.posts import UpdatePostSchema
+from src.domain.utils import build_count_statement, build_keyset_criterion
+from src.schema.posts import (
+    PostCountsResponseSchema,
+    PostDataModelSchema,
+    UpdatePostSchema,
+)
+from src.schema.utils import ListingCursorDTO
 
 
 def test_post_factory_builds_entity_with_id():
@@ -61,3 +74,134 @@ def test_approve_then_publish_posts(monkeypatch):
     monkeypatch.setattr(svc, "get_post_by_id", lambda _id: approved)
     posts = svc.publish_posts_by_ids(post_ids=["p2"])
     assert posts[0].status == PostStatus.PUBLISHED
+
+
+def test_listing_statement_applies_filters_and_counts_without_ordering():
+    statement = PostDomainServices._build_posts_listing_statement(
+        user_id="u1", search_term="fed", status=PostStatus.DRAFT
+    )
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    count_sql = str(build_count_statement(statement).compile(dialect=postgresql.dialect()))
+
+    assert "posts.user_id = " in sql
+    assert "posts.search_vector @@ websearch_to_tsquery(" in sql
+    assert "ILIKE" not in sql
+    assert "ORDER BY ts_rank_cd(" in sql
+    assert sql.endswith("DESC, posts.updated_at DESC, posts.id DESC")
+    assert count_sql.startswith("SELECT count(*)")
+    assert "ORDER BY" not in count_sql
+
+
+def test_keyset_criterion_compares_updated_at_and_id_as_a_row():
+    after = ListingCursorDTO(updated_at=datetime(2026, 1, 1), id=str(uuid4()))
+    statement = PostDomainServices._build_posts_listing_statement(user_id="u1").where(
+        build_keyset_criterion(Post.updated_at, Post.id, after)
+    )
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "(posts.updated_at, posts.id) < (" in sql
+    assert "ORDER BY posts.updated_at DESC, posts.id DESC" in sql
+
+
+def test_listing_search_matches_partial_titles_when_enabled(monkeypatch):
+    monkeypatch.setattr(app_settings, "SEARCH_PARTIAL_MATCH_ENABLED", True)
+
+    statement = PostDomainServices._build_posts_listing_statement(search_term="tes")
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "posts.search_vector @@ websearch_to_tsquery(" in sql
+    assert "posts.title ILIKE" in sql
+    assert "posts.description ILIKE" not in sql
+
+
+def test_listing_search_matches_partial_titles_literally(monkeypatch):
+    monkeypatch.setattr(app_settings, "SEARCH_PARTIAL_MATCH_ENABLED", True)
+
+    statement = PostDomainServices._build_posts_listing_statement(
+        search_term="50%_off\\"
+    )
+    compiled = statement.compile(dialect=postgresql.dialect())
+
+    assert "posts.title ILIKE %(title_1)s ESCAPE " in str(compiled)
+    assert compiled.params["title_1"] == "%50\\%\\_off\\\\%"
+
+
+def test_publish_statement_updates_owned_approved_posts_in_one_round_trip():
+    statement = PostDomainServices._build_publish_posts_statement([uuid4()], "u1")
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("WITH published AS \n(UPDATE posts SET status=")
+    assert "posts.id = ANY (%(post_ids)s::UUID[])" in sql
+    assert "posts.user_id = %(user_id_1)s::UUID AND posts.status = " in sql
+    assert "LEFT OUTER JOIN published ON published.id = posts.id" in sql
+
+
+@pytest.mark.asyncio
+async def test_async_publish_reports_an_outcome_per_id_in_request_order():
+    now = datetime(2026, 1, 1)
+    owner, other = str(uuid4()), str(uuid4())
+    ids = {name: uuid4() for name in ["approved", "draft", "published", "foreign", "missing"]}
+
+    def row(name, user_id, status, published=False):
+        values = {"id": ids[name], "user_id": user_id, "status": status}
+        for field in PostDataModelSchema.model_fields:
+            values[f"published_{field}"] = None
+        if published:
+            values.update(
+                published_id=ids[name],
+                published_title="t",
+                published_description="d",
+                published_market_event_id=uuid4(),
+                published_is_customized=False,
+                published_status=PostStatus.PUBLISHED,
+                published_created_at=now,
+                published_updated_at=now,
+            )
+        return SimpleNamespace(id=ids[name], _mapping=values)
+
+    class FakeAsyncSession:
+        def __init__(self):
+            self.statements = []
+            self.committed = False
+
+        async def execute(self, statement):
+            self.statements.append(statement)
+            return [
+                row("approved", owner, PostStatus.APPROVED, published=True),
+                row("draft", owner, PostStatus.DRAFT),
+                row("published", owner, PostStatus.PUBLISHED),
+                row("foreign", other, PostStatus.APPROVED),
+            ]
+
+        async def commit(self):
+            self.committed = True
+
+    session = FakeAsyncSession()
+    requested = [str(ids[name]) for name in ids] + [str(ids["approved"])]
+
+    results = await PostDomainServices(
+        async_db_session=session
+    ).publish_posts_by_ids_async(post_ids=requested, user_id=owner)
+
+    assert [result.id for result in results] == list(ids.values())
+    assert [result.outcome for result in results] == [
+        PublishPostOutcome.PUBLISHED,
+        PublishPostOutcome.NOT_APPROVED,
+        PublishPostOutcome.ALREADY_PUBLISHED,
+        PublishPostOutcome.NOT_AUTHORIZED,
+        PublishPostOutcome.NOT_FOUND,
+    ]
+    assert results[0].post.status == PostStatus.PUBLISHED
+    assert all(result.post is None for result in results[1:])
+    assert len(session.statements) == 1 and session.committed
+
+
+def test_post_counts_are_aggregated_in_one_statement():
+    statement = PostDomainServices._build_post_counts_statement("u1")
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("FROM posts") == 1
+    assert sql.count("count(*) FILTER (WHERE") == 3
+    assert [column.name for column in statement.selected_columns] == list(
+        PostCountsResponseSchema.model_fields
+    )
@@ -0,0 +1,16 @@
+from config.db_connection import db_service
+from src.domain.users.services import UserDomainServices
+
+
+def test_sync_session_is_opened_only_when_a_sync_method_needs_it(monkeypatch):
+    opened = []
+    monkeypatch.setattr(
+        db_service, "get_session", lambda: opened.append(object()) or opened[-1]
+    )
+
+    svc = UserDomainServices(async_db_session=object())
+    assert opened == []
+
+    assert svc.db_session is opened[0]
+    assert svc.db_session is opened[0]
+    assert len(opened) == 1
@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from config.settings import app_settings
+from src.domain.enums import MarketEventSource
+from src.infrastructure import tasks
+from src.infrastructure.news_fetcher.core.alpha_vantage_news_fetcher import (
+    AlphaVantageNewsFetcher,
+)
+from src.infrastructure.news_fetcher.core.base_class import NewsFetcherBase
+from src.infrastructure.news_fetcher.watermark import WatermarkTracker
+from src.infrastructure.utils import iter_json_array_items
+
+FEED = [{"title": f"article {i}", "url": f"https://news.test/{i}"} for i in range(5)]
+DOCUMENT = json.dumps(
+    {
+        "items": "5",
+        "sentiment_score_definition": 'x <= -0.35: "feed": [Bearish]',
+        "relevance_score_definition": 0.25,
+        "feed": FEED,
+    },
+    indent=1,
+)
+
+
+async def chunked(text: str, size: int):
+    for start in range(0, len(text), size):
+        end = start + size
+        yield text[start:end]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 3, 17, len(DOCUMENT)])
+async def test_array_items_are_parsed_across_any_chunking(size):
+    items = [
+        item async for item in iter_json_array_items(chunked(DOCUMENT, size), "feed")
+    ]
+
+    assert items == FEED
+
+
+@pytest.mark.asyncio
+async def test_missing_array_yields_nothing_and_truncated_documents_fail():
+    information = chunked('{"Information": "rate limit"}', 4)
+    assert [item async for item in iter_json_array_items(information, "feed")] == []
+
+    with pytest.raises(ValueError):
+        truncated = chunked(DOCUMENT[: len(DOCUMENT) // 2], 8)
+        [item async for item in iter_json_array_items(truncated, "feed")]
+
+
+class SlowByteStream(httpx.AsyncByteStream):
+    def __init__(self, text: str, size: int):
+        self.text = text
+        self.size = size
+        self.sent = 0
+
+    async def __aiter__(self):
+        for start in range(0, len(self.text), self.size):
+            await asyncio.sleep(0)
+            self.sent += 1
+            end = start + self.size
+            yield self.text[start:end].encode()
+
+
+@pytest.fixture
+def alpha_vantage(monkeypatch):
+    monkeypatch.setattr(app_settings, "FETCH_STATIC_DATA", False)
+    monkeypatch.setattr(app_settings, "ALPHAVANTAGE_API_BASE_URL", "https://av.test")
+    stream = SlowByteStream(DOCUMENT, size=32)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["function"] == "NEWS_SENTIMENT"
+        return httpx.Response(200, stream=stream)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(
+        NewsFetcherBase, "get_http_client", classmethod(lambda cls: client)
+    )
+    return stream
+
+
+@pytest.mark.asyncio
+async def test_articles_are_yielded_before_the_download_finishes(alpha_vantage):
+    total_chunks = -(-len(DOCUMENT) // alpha_vantage.size)
+    received = []
+
+    async for article in AlphaVantageNewsFetcher().stream_news():
+        received.append((article, alpha_vantage.sent))
+
+    assert [article for article, _ in received] == FEED
+    assert received[0][1] < total_chunks
+
+
+@pytest.mark.asyncio
+async def test_batches_are_classified_while_streaming(alpha_vantage, monkeypatch):
+    monkeypatch.setattr(app_settings, "FINANCIAL_CLASSIFICATION_BATCH_SIZE", 2)
+    batches = []
+
+    def deduplicate_articles(articles, source, seen_in_fetch):
+        batches.append([article["title"] for article in articles])
+        return articles[1:]
+
+    monkeypatch.setattr(tasks, "deduplicate_articles", deduplicate_articles)
+    monkeypatch.setattr(
+        tasks, "filter_financial_articles", lambda articles, source: articles
+    )
+
+    fetcher = AlphaVantageNewsFetcher()
+    fetched = await tasks.stream_financial_articles(
+        fetcher,
+        MarketEventSource.ALPHA_VANTAGE_API,
+        WatermarkTracker(None, fetcher.get_article_watermark),
+    )
+
+    assert batches == [
+        ["article 0", "article 1"],
+        ["article 2", "article 3"],
+        ["article 4"],
+    ]
+    assert fetched.articles == [FEED[1], FEED[3]]
+    assert fetched.financial_articles == [FEED[1], FEED[3]]
@@ -0,0 +1,162 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from config.settings import app_settings
+from src.domain.enums import MarketEventSource
+from src.infrastructure import tasks
+from src.infrastructure.news_fetcher.deduplicator import (
+    ArticleDeduplicator,
+    normalize_title,
+)
+from src.schema.utils import FetchWatermarkDTO
+
+
+class FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    def exists(self, key):
+        self.commands.append(lambda: int(key in self.store))
+
+    def set(self, key, value, ex=None):
+        self.commands.append(lambda: self.store.add(key) or True)
+
+    def execute(self):
+        return [command() for command in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = set()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.store)
+
+
+def test_normalize_title_ignores_cosmetic_differences():
+    assert normalize_title("  Apple  Beats Earnings! ") == normalize_title(
+        "apple beats earnings"
+    )
+    assert normalize_title("Café") == "cafe"
+
+
+def test_deduplicate_drops_batch_and_previously_seen_articles():
+    dedup = ArticleDeduplicator(retention_seconds=60, redis_host="")
+    dedup._redis = FakeRedis()
+
+    first = dedup.deduplicate(
+        [
+            {"url": "https://a", "title": "Fed holds rates"},
+            {"url": "https://b", "title": "Fed holds rates!"},
+            {"url": "https://c", "title": "Oil rallies"},
+        ]
+    )
+    assert [a["url"] for a in first.articles] == ["https://a", "https://c"]
+    assert first.dropped == 1
+    # Checking alone does not mark anything as seen
+    assert dedup._redis.store == set()
+    dedup.mark_seen(first.articles)
+
+    second = dedup.deduplicate(
+        [
+            {"url": "https://c", "title": "Oil rallies again"},
+            {"url": "https://d", "title": "Gold slips"},
+        ]
+    )
+    assert [a["url"] for a in second.articles] == ["https://d"]
+    assert second.dropped == 1
+
+
+def test_seen_in_fetch_spans_the_batches_of_one_fetch():
+    dedup = ArticleDeduplicator(retention_seconds=60, redis_host="")
+    seen_in_fetch = set()
+
+    dedup.deduplicate([{"url": "https://a", "title": "Fed"}], seen_in_fetch)
+    second = dedup.deduplicate([{"url": "https://a", "title": "Fed"}], seen_in_fetch)
+
+    assert second.articles == []
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_articles_are_marked_seen_only_once_ingested(monkeypatch, fails):
+    dedup = ArticleDeduplicator(retention_seconds=60, redis_host="")
+    dedup._redis = FakeRedis()
+    articles = [{"url": "https://a", "title": "Fed holds rates"}]
+
+    def ingest_articles(articles, source):
+        if fails:
+            raise RuntimeError("database is down")
+
+    async def fetch_news(events_fetcher, tracker):
+        return articles
+
+    monkeypatch.setattr(app_settings, "FETCH_STATIC_DATA", True)
+    monkeypatch.setattr(tasks, "article_deduplicator", dedup)
+    monkeypatch.setattr(tasks, "fetch_news", fetch_news)
+    monkeypatch.setattr(
+        tasks, "filter_financial_articles", lambda articles, source: articles
+    )
+    monkeypatch.setattr(tasks, "ingest_articles", ingest_articles)
+
+    tasks.process_news_events_data()
+
+    assert bool(dedup._redis.store) is not fails
+    assert dedup.deduplicate(articles).articles == ([] if not fails else articles)
+
+
+def test_failed_run_is_fetched_again_without_being_deduplicated(monkeypatch):
+    class FakeWatermarkStore:
+        def __init__(self):
+            self.watermarks = {}
+
+        def get(self, source):
+            return self.watermarks.get(source)
+
+        def advance(self, source, watermark):
+            self.watermarks[source] = watermark
+            return True
+
+    dedup = ArticleDeduplicator(retention_seconds=60, redis_host="")
+    dedup._redis = FakeRedis()
+    store = FakeWatermarkStore()
+    articles = [
+        {
+            "uri": "1",
+            "url": "https://a",
+            "title": "Fed holds rates",
+            "dateTimePub": "2026-10-16T09:30:15Z",
+        },
+    ]
+    failures = [RuntimeError("database is down")]
+    ingested = []
+
+    async def fetch_news(events_fetcher, tracker):
+        return [article for article in articles if tracker.is_new(article)]
+
+    def ingest_articles(articles, source):
+        if failures:
+            raise failures.pop()
+        ingested.extend(articles)
+
+    monkeypatch.setattr(app_settings, "FETCH_STATIC_DATA", False)
+    monkeypatch.setattr(tasks, "article_deduplicator", dedup)
+    monkeypatch.setattr(tasks, "fetch_watermark_store", store)
+    monkeypatch.setattr(tasks, "fetch_news", fetch_news)
+    monkeypatch.setattr(
+        tasks, "filter_financial_articles", lambda articles, source: articles
+    )
+    monkeypatch.setattr(tasks, "ingest_articles", ingest_articles)
+    monkeypatch.setattr(tasks, "schedule_next_fetch", lambda *args, **kwargs: None)
+
+    tasks.process_news_events_data()
+    assert store.watermarks == {}
+    assert dedup._redis.store == set()
+
+    tasks.process_news_events_data()
+    assert ingested == articles
+    assert dedup._redis.store
+    assert store.get(MarketEventSource.EVENT_REGISTRY_API) == FetchWatermarkDTO(
+        datetime(2026, 10, 16, 9, 30, 15, tzinfo=UTC), "1"
+    )
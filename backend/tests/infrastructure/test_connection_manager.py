@@ -1,13 +1,25 @@
+import asyncio
+import json
+import os
+import time
+
 import pytest
+import pytest_asyncio
 
-from src.infrastructure.websockets.connection_manager import ConnectionManager
+from src.infrastructure.websockets.connection_manager import (
+    ConnectionManager,
+    merge_market_event_messages,
+)
+from src.schema.utils import QueueOverflowPolicyEnum
 
 
 class FakeWebSocket:
-    def __init__(self):
+    def __init__(self, delay: float = 0.0):
         self.accepted = False
+        self.closed = False
         self.sent = []
         self.client = ("127.0.0.1", 0)
+        self.delay = delay
 
     async def accept(self):
         self.accepted = True
@@ -15,18 +27,390 @@ class FakeWebSocket:
     async def send_json(self, data):
         self.sent.append(data)
 
+    async def send_text(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(data))
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest_asyncio.fixture
+async def fresh_manager(monkeypatch):
+    monkeypatch.setattr(ConnectionManager, "_instance", None)
+    manager = ConnectionManager()
+    yield manager
+    await manager.close_all()
+
 
 @pytest.mark.asyncio
-async def test_broadcast_and_personal_message():
-    mgr = ConnectionManager()
+async def test_broadcast_and_personal_message(fresh_manager):
+    mgr = fresh_manager
     ws1, ws2 = FakeWebSocket(), FakeWebSocket()
 
     await mgr.connect(ws1, user_id="u1")
     await mgr.connect(ws2, user_id="u2")
 
     await mgr.broadcast({"x": 1})
+    await mgr.drain()
     assert ws1.sent and ws2.sent
 
     await mgr.send_personal_message("u1", {"y": 2})
+    await mgr.drain()
     assert ws1.sent[-1] == {"y": 2}
 
+
+def test_redis_publisher_pipelines_messages_in_order(monkeypatch):
+    from src.infrastructure.websockets.redis_listener import RedisPublisher
+    from src.schema.utils import RedisPublishMessageDTO, WebsocketMessageTypesEnum
+
+    published = []
+
+    class FakePipeline:
+        def publish(self, channel, payload):
+            published.append((channel, payload))
+
+        def execute(self):
+            published.append("execute")
+
+    publisher = RedisPublisher()
+    assert publisher is RedisPublisher()
+    monkeypatch.setattr(
+        publisher, "redis", type("R", (), {"pipeline": lambda self, **_: FakePipeline()})()
+    )
+
+    publisher.publish_many(
+        [
+            RedisPublishMessageDTO(WebsocketMessageTypesEnum.LIVE_EVENTS, {"id": "1"}),
+            RedisPublishMessageDTO(
+                WebsocketMessageTypesEnum.USER_CUSTOM_EVENT, {"id": "2"}, user_id="u1"
+            ),
+        ]
+    )
+
+    assert [p[0] for p in published[:2]] == ["public_channel", "user_channel_u1"]
+    assert published[-1] == "execute"
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_delay_others_and_gets_evicted(fresh_manager):
+    mgr = fresh_manager
+    mgr.send_timeout = 0.02
+    mgr.max_slow_sends = 2
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=0.1)
+
+    await mgr.connect(fast, user_id="fast")
+    await mgr.connect(slow, user_id="slow")
+
+    started = time.perf_counter()
+    await mgr.broadcast({"n": 1})
+    await mgr.broadcast({"n": 2})
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0.01)
+
+    assert fast.sent == [{"n": 1}, {"n": 2}]
+    assert elapsed < 0.01
+
+    await asyncio.sleep(0.3)
+    assert slow.closed
+    assert "slow" not in mgr.active_connections
+
+
+@pytest.mark.asyncio
+async def test_client_with_one_stalled_send_gets_evicted(fresh_manager):
+    mgr = fresh_manager
+    mgr.send_timeout = 0.02
+    mgr.max_slow_sends = 3
+    stalled = FakeWebSocket(delay=60)
+
+    await mgr.connect(stalled, user_id="stalled")
+    await mgr.broadcast({"n": 1})
+
+    await asyncio.sleep(0.2)
+    assert stalled.closed
+    assert not stalled.sent
+    assert "stalled" not in mgr.active_connections
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "size",
+    [
+        100,
+        pytest.param(
+            10_000,
+            marks=pytest.mark.skipif(
+                not os.getenv("RUN_BENCHMARKS"),
+                reason="RUN_BENCHMARKS enables the 10k-client benchmark",
+            ),
+        ),
+    ],
+)
+async def test_broadcast_latency_benchmark(fresh_manager, size):
+    mgr = fresh_manager
+    # 1ms per send stands in for the network write of a real socket
+    sockets = [FakeWebSocket(delay=0.001) for _ in range(size)]
+    for index, ws in enumerate(sockets):
+        await mgr.connect(ws, user_id=f"u{index}")
+
+    rounds = 3
+    started = time.perf_counter()
+    for round_ in range(rounds):
+        await mgr.broadcast({"live_events": {"id": str(round_), "title": "t" * 200}})
+    await mgr.drain()
+    per_broadcast_ms = (time.perf_counter() - started) / rounds * 1000
+
+    assert all(len(ws.sent) == rounds for ws in sockets)
+    # Sequential sends would take at least size * 1ms per broadcast
+    assert per_broadcast_ms < size * 1.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (
+            QueueOverflowPolicyEnum.DROP_OLDEST,
+            [{"live_events": {"id": "b", "v": 1}}, {"live_events": {"id": "a", "v": 2}}],
+        ),
+        (
+            QueueOverflowPolicyEnum.COALESCE,
+            [{"live_events": {"id": "a", "v": 2}}, {"live_events": {"id": "b", "v": 1}}],
+        ),
+    ],
+)
+async def test_full_queue_applies_overflow_policy(fresh_manager, policy, expected):
+    mgr = fresh_manager
+    mgr.max_queue_size = 2
+    mgr.overflow_policy = policy
+    ws = FakeWebSocket()
+    await mgr.connect(ws, user_id="u1")
+
+    # Nothing is written until the writer task gets to run
+    await mgr.broadcast({"live_events": {"id": "a", "v": 1}})
+    await mgr.broadcast({"live_events": {"id": "b", "v": 1}})
+    await mgr.broadcast({"live_events": {"id": "a", "v": 2}})
+    [metrics] = mgr.metrics
+    await mgr.drain()
+
+    assert ws.sent == expected
+    assert metrics["queue_depth"] == 2
+    if policy == QueueOverflowPolicyEnum.COALESCE:
+        assert (metrics["dropped"], metrics["coalesced"]) == (0, 1)
+    else:
+        assert (metrics["dropped"], metrics["coalesced"]) == (1, 0)
+
+
+def test_merge_market_event_messages_keeps_deltas_applicable():
+    snapshot = {"live_events": {"id": "a", "version": 1, "banner": None, "updated_at": "t1"}}
+    first = {
+        "market_event_delta": {
+            "id": "a",
+            "base_version": 1,
+            "version": 2,
+            "changes": {"banner": "b"},
+            "updated_at": "t2",
+        }
+    }
+    second = {
+        "market_event_delta": {
+            "id": "a",
+            "base_version": 2,
+            "version": 3,
+            "changes": {"priority_flag": "HIGH"},
+            "updated_at": "t3",
+        }
+    }
+
+    assert merge_market_event_messages(snapshot, first) == {
+        "live_events": {"id": "a", "version": 2, "banner": "b", "updated_at": "t2"}
+    }
+    assert merge_market_event_messages(first, second) == {
+        "market_event_delta": {
+            "id": "a",
+            "base_version": 1,
+            "version": 3,
+            "changes": {"banner": "b", "priority_flag": "HIGH"},
+            "updated_at": "t3",
+        }
+    }
+    assert merge_market_event_messages(first, snapshot) is snapshot
+
+
+@pytest.mark.asyncio
+async def test_pending_deltas_are_merged_per_event(fresh_manager):
+    mgr = fresh_manager
+    mgr.overflow_policy = QueueOverflowPolicyEnum.COALESCE
+    ws = FakeWebSocket()
+    await mgr.connect(ws, user_id="u1")
+
+    for version in (2, 3, 4):
+        await mgr.broadcast(
+            {
+                "market_event_delta": {
+                    "id": "a",
+                    "base_version": version - 1,
+                    "version": version,
+                    "changes": {f"field_{version}": version},
+                    "updated_at": "t",
+                }
+            }
+        )
+    await mgr.broadcast({"market_event_content_delta": {"id": "a", "delta": "x"}})
+    await mgr.broadcast({"market_event_content_delta": {"id": "a", "delta": "y"}})
+    await mgr.drain()
+
+    [merged, *content] = ws.sent
+    assert merged["market_event_delta"]["base_version"] == 1
+    assert merged["market_event_delta"]["version"] == 4
+    assert merged["market_event_delta"]["changes"] == {
+        "field_2": 2,
+        "field_3": 3,
+        "field_4": 4,
+    }
+    assert len(content) == 2
+
+
+def content_delta(event_id, sequence):
+    return {
+        "market_event_content_delta": {
+            "id": event_id,
+            "field": "deep_research_content",
+            "delta": str(sequence),
+            "sequence": sequence,
+            "updated_at": "t",
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_full_content_drops_the_pending_content_deltas_it_supersedes(
+    fresh_manager,
+):
+    mgr = fresh_manager
+    mgr.overflow_policy = QueueOverflowPolicyEnum.COALESCE
+    ws = FakeWebSocket()
+    await mgr.connect(ws, user_id="u1")
+
+    stage = {
+        "market_event_delta": {
+            "id": "a",
+            "base_version": 1,
+            "version": 2,
+            "changes": {"processing_status": "RESEARCHING"},
+            "updated_at": "t",
+        }
+    }
+    await mgr.broadcast(stage)
+    await mgr.broadcast(content_delta("a", 0))
+    await mgr.broadcast(content_delta("b", 0))
+    await mgr.broadcast(content_delta("a", 1))
+    # Coalesced into the stage delta queued ahead of the content deltas of "a"
+    done = {
+        "market_event_delta": {
+            "id": "a",
+            "base_version": 2,
+            "version": 3,
+            "changes": {"deep_research_content": "01"},
+            "updated_at": "t",
+        }
+    }
+    await mgr.broadcast(done)
+    await mgr.drain()
+
+    [merged, other] = ws.sent
+    assert merged["market_event_delta"]["changes"] == {
+        "processing_status": "RESEARCHING",
+        "deep_research_content": "01",
+    }
+    assert other == content_delta("b", 0)
+
+
+@pytest.mark.asyncio
+async def test_evicted_content_delta_cuts_the_stream_and_resyncs(fresh_manager):
+    mgr = fresh_manager
+    mgr.max_queue_size = 2
+    mgr.overflow_policy = QueueOverflowPolicyEnum.DROP_OLDEST
+    ws = FakeWebSocket()
+    await mgr.connect(ws, user_id="u1")
+
+    for sequence in range(4):
+        await mgr.broadcast(content_delta("a", sequence))
+    await mgr.broadcast({"live_events": {"id": "b", "v": 1}})
+    [metrics] = mgr.metrics
+    full = {"live_events": {"id": "a", "deep_research_content": "0123"}}
+    await mgr.broadcast(full)
+    await mgr.drain()
+
+    # No delta of "a" is sent once one of them was dropped
+    assert ws.sent == [
+        {"market_event_content_resync": {"id": "a", "field": "deep_research_content"}},
+        {"live_events": {"id": "b", "v": 1}},
+        full,
+    ]
+    assert metrics["dropped"] == 4
+
+
+def content_complete(event_id, content):
+    return {
+        "market_event_content_complete": {
+            "id": event_id,
+            "field": "deep_research_content",
+            "sequence": len(content),
+            "length": len(content),
+            "content": content,
+            "updated_at": "t",
+        }
+    }
+
+
+def without_content(message):
+    [(message_type, payload)] = message.items()
+    return {message_type: {**payload, "content": None}}
+
+
+@pytest.mark.asyncio
+async def test_content_completion_is_a_marker_unless_the_stream_was_cut(
+    fresh_manager,
+):
+    mgr = fresh_manager
+    mgr.overflow_policy = QueueOverflowPolicyEnum.DROP_OLDEST
+    intact, cut = FakeWebSocket(), FakeWebSocket()
+    await mgr.connect(intact, user_id="intact")
+    mgr.max_queue_size = 2
+    await mgr.connect(cut, user_id="cut")
+
+    for sequence in range(4):
+        await mgr.broadcast(content_delta("a", sequence))
+    await mgr.broadcast(content_complete("a", "0123"))
+    await mgr.drain()
+
+    assert intact.sent == [content_delta("a", sequence) for sequence in range(4)] + [
+        without_content(content_complete("a", "0123"))
+    ]
+    assert cut.sent == [
+        {"market_event_content_resync": {"id": "a", "field": "deep_research_content"}},
+        content_complete("a", "0123"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cut_stream_sends_its_queued_completion_with_the_content(fresh_manager):
+    mgr = fresh_manager
+    mgr.max_queue_size = 3
+    mgr.overflow_policy = QueueOverflowPolicyEnum.DROP_OLDEST
+    ws = FakeWebSocket()
+    await mgr.connect(ws, user_id="u1")
+
+    await mgr.broadcast(content_delta("a", 0))
+    await mgr.broadcast(content_delta("a", 1))
+    await mgr.broadcast(content_complete("a", "01"))
+    await mgr.broadcast({"live_events": {"id": "b", "v": 1}})
+    await mgr.drain()
+
+    assert ws.sent == [
+        {"market_event_content_resync": {"id": "a", "field": "deep_research_content"}},
+        content_complete("a", "01"),
+        {"live_events": {"id": "b", "v": 1}},
+    ]
@@ -0,0 +1,87 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from config.settings import app_settings
+from src.infrastructure.news_fetcher.core.base_class import NewsFetcherBase
+from src.infrastructure.news_fetcher.core.event_registry_news_fetcher import (
+    EventRegistryNewsFetcher,
+)
+from src.infrastructure.news_fetcher.news_pipeline import NewsPipeline
+
+
+@pytest.fixture
+def event_registry(monkeypatch):
+    """
+    Serves 5 pages of 2 articles each, tracking the requests in flight.
+    """
+    monkeypatch.setattr(app_settings, "FETCH_STATIC_DATA", False)
+    monkeypatch.setattr(app_settings, "NEWS_API_BASE_URL", "https://er.test/articles")
+    monkeypatch.setattr(app_settings, "EVENT_REGISTRY_MAX_CONCURRENT_REQUESTS", 2)
+    state = {"in_flight": 0, "max_in_flight": 0, "requests": []}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        page = payload["articlesPage"]
+        keyword = (payload.get("keyword") or [""])[0]
+        state["requests"].append((keyword, page))
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        results = [
+            {"url": f"https://news.test/{page}-{i}", "title": f"{keyword} {page}-{i}"}
+            for i in range(2)
+        ]
+        return httpx.Response(200, json={"articles": {"results": results, "pages": 5}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(NewsFetcherBase, "get_http_client", classmethod(lambda cls: client))
+    return state
+
+
+@pytest.mark.asyncio
+async def test_remaining_pages_are_fetched_concurrently_under_the_limit(event_registry):
+    articles = await EventRegistryNewsFetcher().fetch_news(keyword="fed")
+
+    assert [article["url"] for article in articles] == [
+        f"https://news.test/{page}-{i}" for page in range(1, 6) for i in range(2)
+    ]
+    assert event_registry["requests"][0] == ("fed", 1)
+    assert event_registry["max_in_flight"] == 2
+
+
+@pytest.mark.asyncio
+async def test_keyword_searches_run_concurrently_and_dedupe_by_url(event_registry):
+    pipeline = NewsPipeline()
+
+    async def generate_keyword_combinations(title):
+        return ["fed", "rates", "inflation"]
+
+    pipeline.generate_keyword_combinations = generate_keyword_combinations
+
+    articles = await pipeline.fetch_news_by_title(title="Fed raises rates")
+
+    assert len(articles) == 10
+    assert len({article["url"] for article in articles}) == 10
+    assert len(event_registry["requests"]) == 15
+    # The first pages of all three searches are requested before any second page
+    assert {keyword for keyword, page in event_registry["requests"][:3]} == {
+        "fed",
+        "rates",
+        "inflation",
+    }
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_pooled_per_event_loop():
+    client = NewsFetcherBase.get_http_client()
+
+    assert EventRegistryNewsFetcher.get_http_client() is client
+
+    await NewsFetcherBase.close_http_client()
+    assert client.is_closed
+    assert NewsFetcherBase.get_http_client() is not client
+    await NewsFetcherBase.close_http_client()
@@ -0,0 +1,221 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from config.settings import app_settings
+from src.domain.enums import MarketEventSource
+from src.infrastructure import tasks
+from src.infrastructure.news_fetcher import scheduler
+from src.infrastructure.news_fetcher.scheduler import (
+    AdaptiveFetchSchedule,
+    FetchScheduler,
+    build_fetch_schedule_policy,
+    choose_fetch_interval,
+)
+from src.infrastructure.utils import parse_rate_limit_headers
+from src.schema.utils import (
+    FetchIntervalReasonEnum,
+    FetchSchedulePolicyDTO,
+    RateLimitDTO,
+)
+
+POLICY = FetchSchedulePolicyDTO(base_interval=900, min_interval=225, max_interval=3600)
+
+
+@pytest.fixture(autouse=True)
+def thresholds(monkeypatch):
+    monkeypatch.setattr(app_settings, "FETCH_SCHEDULER_HOT_ARTICLES", 20)
+    monkeypatch.setattr(app_settings, "FETCH_SCHEDULER_QUEUE_SATURATION", 200)
+    monkeypatch.setattr(app_settings, "FETCH_SCHEDULER_RATE_LIMIT_MIN_REMAINING", 5)
+
+
+@pytest.mark.parametrize(
+    "previous, articles, queue_depth, rate_limit, expected",
+    [
+        (900, 50, 0, None, (450, FetchIntervalReasonEnum.HOT_NEWS)),
+        (300, 50, 0, None, (225, FetchIntervalReasonEnum.HOT_NEWS)),
+        (900, 0, 0, None, (1800, FetchIntervalReasonEnum.QUIET)),
+        (3600, 0, None, None, (3600, FetchIntervalReasonEnum.QUIET)),
+        (450, 5, 0, None, (900, FetchIntervalReasonEnum.BASELINE)),
+        (1800, 5, 0, None, (900, FetchIntervalReasonEnum.BASELINE)),
+        (450, 50, 500, None, (900, FetchIntervalReasonEnum.QUEUE_SATURATED)),
+        (450, None, 500, None, (450, FetchIntervalReasonEnum.FAILED)),
+        (
+            450,
+            None,
+            0,
+            RateLimitDTO(remaining=0),
+            (900, FetchIntervalReasonEnum.RATE_LIMITED),
+        ),
+        (
+            450,
+            50,
+            500,
+            RateLimitDTO(remaining=0, reset_seconds=1200),
+            (1200, FetchIntervalReasonEnum.RATE_LIMITED),
+        ),
+        (
+            450,
+            50,
+            0,
+            RateLimitDTO(remaining=100, limit=500),
+            (225, FetchIntervalReasonEnum.HOT_NEWS),
+        ),
+    ],
+)
+def test_interval_follows_yield_queue_depth_and_rate_limit(
+    previous, articles, queue_depth, rate_limit, expected
+):
+    decision = choose_fetch_interval(
+        POLICY,
+        previous_interval=previous,
+        articles=articles,
+        queue_depth=queue_depth,
+        rate_limit=rate_limit,
+    )
+
+    assert (decision.interval_seconds, decision.reason) == expected
+
+
+def test_policy_rejects_intervals_out_of_order():
+    assert build_fetch_schedule_policy(900, 225, 3600) == POLICY
+    # An interval still set in minutes, as the setting once was
+    with pytest.raises(ValueError, match="in seconds"):
+        build_fetch_schedule_policy(5, 60, 20)
+
+
+def test_rate_limit_headers_are_parsed():
+    reset_at = datetime.now(UTC) + timedelta(seconds=120)
+
+    assert parse_rate_limit_headers({}) is None
+    assert parse_rate_limit_headers(
+        {"X-RateLimit-Remaining": "3", "X-RateLimit-Limit": "25"}
+    ) == RateLimitDTO(remaining=3, limit=25)
+    assert parse_rate_limit_headers({"Retry-After": "30"}, status_code=429) == (
+        RateLimitDTO(remaining=0, reset_seconds=30.0)
+    )
+    epoch_reset = parse_rate_limit_headers(
+        {"RateLimit-Reset": str(int(reset_at.timestamp()))}
+    ).reset_seconds
+    assert 100 < epoch_reset <= 120
+
+
+class FakeRedis:
+    def __init__(self, queue_depth=0):
+        self.hashes = {}
+        self.queue_depth = queue_depth
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(
+            {field: str(value) for field, value in mapping.items()}
+        )
+
+    def llen(self, key):
+        return self.queue_depth
+
+
+@pytest.fixture
+def fetch_scheduler(monkeypatch):
+    fetch_scheduler = FetchScheduler(redis_host="", broker_url="")
+    monkeypatch.setattr(fetch_scheduler, "_redis", FakeRedis())
+    monkeypatch.setattr(fetch_scheduler, "_broker", FakeRedis(queue_depth=7))
+    monkeypatch.setattr(scheduler, "fetch_scheduler", fetch_scheduler)
+    return fetch_scheduler
+
+
+def test_recorded_interval_drives_the_beat_schedule(fetch_scheduler):
+    source = MarketEventSource.ALPHA_VANTAGE_API
+    base_interval = scheduler.FETCH_SCHEDULE_POLICIES[source].base_interval
+    beat_schedule = AdaptiveFetchSchedule(source)
+    last_run_at = datetime.now(UTC) - timedelta(seconds=base_interval * 0.75)
+
+    assert not beat_schedule.is_due(last_run_at).is_due
+
+    decision = fetch_scheduler.record_fetch(source, articles=100)
+
+    assert decision.reason == FetchIntervalReasonEnum.HOT_NEWS
+    assert beat_schedule.is_due(last_run_at).is_due
+    assert fetch_scheduler.snapshot()[source.value] == {
+        "interval_seconds": decision.interval_seconds,
+        "reason": "hot_news",
+        "articles": 100,
+        "queue_depth": 7,
+        "rate_limit_remaining": None,
+        "decided_at": fetch_scheduler._redis.hashes[f"fetch_schedule:{source.name}"][
+            "decided_at"
+        ],
+    }
+
+
+def test_scheduler_without_redis_keeps_the_base_interval():
+    fetch_scheduler = FetchScheduler(redis_host="", broker_url="")
+    source = MarketEventSource.EVENT_REGISTRY_API
+    base_interval = scheduler.FETCH_SCHEDULE_POLICIES[source].base_interval
+
+    fetch_scheduler.record_fetch(source, articles=100)
+
+    assert fetch_scheduler.get_queue_depth() is None
+    assert fetch_scheduler.get_interval(source) == base_interval
+
+
+@pytest.mark.parametrize(
+    "error, rate_limit, expected",
+    [
+        (None, None, (7200, FetchIntervalReasonEnum.BASELINE, "1")),
+        # A failed run keeps the current interval instead of counting as a quiet one
+        (RuntimeError("API is down"), None, (3600, FetchIntervalReasonEnum.FAILED, "")),
+        (
+            RuntimeError("429 Too Many Requests"),
+            RateLimitDTO(remaining=0),
+            (7200, FetchIntervalReasonEnum.RATE_LIMITED, ""),
+        ),
+    ],
+)
+def test_runs_record_their_deduplicated_yield_or_failure(
+    monkeypatch, fetch_scheduler, error, rate_limit, expected
+):
+    source = MarketEventSource.EVENT_REGISTRY_API
+    key = f"fetch_schedule:{source.name}"
+    # Hot news had shortened the interval to its minimum
+    fetch_scheduler._redis.hashes[key] = {"interval_seconds": "3600"}
+    articles = [{"uri": "1"}, {"uri": "2"}, {"uri": "3"}]
+
+    async def fetch_news(events_fetcher, tracker):
+        if error:
+            events_fetcher.rate_limit = rate_limit
+            raise error
+        return articles
+
+    monkeypatch.setattr(app_settings, "FETCH_STATIC_DATA", False)
+    monkeypatch.setattr(tasks, "fetch_scheduler", fetch_scheduler)
+    monkeypatch.setattr(
+        tasks, "get_watermark_tracker", lambda events_fetcher, source: None
+    )
+    monkeypatch.setattr(tasks, "advance_watermark", lambda tracker, source: None)
+    monkeypatch.setattr(tasks, "fetch_news", fetch_news)
+    # Only the first article is new, the others were ingested by an earlier run
+    monkeypatch.setattr(
+        tasks, "deduplicate_articles", lambda articles, source: articles[:1]
+    )
+    monkeypatch.setattr(
+        tasks, "filter_financial_articles", lambda articles, source: articles
+    )
+    monkeypatch.setattr(tasks, "ingest_articles", lambda articles, source: None)
+    monkeypatch.setattr(
+        tasks, "article_deduplicator", SimpleNamespace(mark_seen=lambda articles: None)
+    )
+
+    tasks.process_news_events_data()
+
+    stored = fetch_scheduler._redis.hashes[key]
+    interval, reason, articles = expected
+    assert int(stored["interval_seconds"]) == interval
+    assert stored["reason"] == reason.value
+    assert stored["articles"] == articles
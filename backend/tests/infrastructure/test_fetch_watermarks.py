@@ -0,0 +1,142 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from config.settings import app_settings
+from src.domain.enums import MarketEventSource
+from src.infrastructure.news_fetcher.core.alpha_vantage_news_fetcher import (
+    AlphaVantageNewsFetcher,
+)
+from src.infrastructure.news_fetcher.core.event_registry_news_fetcher import (
+    EventRegistryNewsFetcher,
+)
+from src.infrastructure.news_fetcher.watermark import (
+    FetchWatermarkStore,
+    WatermarkTracker,
+)
+from src.infrastructure.utils import get_time_range
+from src.schema.utils import FetchWatermarkDTO
+
+PUBLISHED_AT = datetime(2026, 10, 16, 9, 30, 15, tzinfo=UTC)
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the hash commands and the compare-and-set script.
+    """
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def register_script(self, script):
+        def advance(keys, args):
+            current = self.hashes.get(keys[0])
+            if current and float(current["published_at"]) >= float(args[0]):
+                return 0
+            self.hashes[keys[0]] = {"published_at": str(args[0]), "article_id": args[1]}
+            return 1
+
+        return advance
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = FetchWatermarkStore(redis_host="")
+    redis = FakeRedis()
+    monkeypatch.setattr(store, "_redis", redis)
+    monkeypatch.setattr(store, "_advance", redis.register_script(""))
+    return store
+
+
+def alpha_vantage_article(published_at: datetime, url: str) -> dict:
+    return {"time_published": published_at.strftime("%Y%m%dT%H%M%S"), "url": url}
+
+
+def test_time_range_defaults_to_one_interval_in_seconds(monkeypatch):
+    monkeypatch.setattr(app_settings, "ALPHAVANTAGE_FETCH_INTERVAL_SECONDS", 900)
+
+    time_range = get_time_range()
+    time_from = datetime.strptime(time_range.time_from, "%Y%m%dT%H%M")
+    time_to = datetime.strptime(time_range.time_to, "%Y%m%dT%H%M")
+
+    assert time_to - time_from == timedelta(minutes=15)
+    assert get_time_range(since=PUBLISHED_AT).time_from == "20261016T0930"
+
+
+def test_watermark_only_moves_forward(store):
+    source = MarketEventSource.ALPHA_VANTAGE_API
+    newer = FetchWatermarkDTO(PUBLISHED_AT, "https://news.test/b")
+
+    assert store.get(source) is None
+    assert store.advance(source, newer)
+    # Article IDs never order watermarks
+    assert not store.advance(
+        source, FetchWatermarkDTO(PUBLISHED_AT, "https://news.test/z")
+    )
+    assert not store.advance(
+        source,
+        FetchWatermarkDTO(PUBLISHED_AT - timedelta(hours=1), "https://news.test/z"),
+    )
+    assert store.get(source) == newer
+    assert store.get(MarketEventSource.EVENT_REGISTRY_API) is None
+
+
+def test_store_without_redis_knows_no_watermark():
+    store = FetchWatermarkStore(redis_host="")
+    source = MarketEventSource.EVENT_REGISTRY_API
+
+    assert not store.advance(source, FetchWatermarkDTO(PUBLISHED_AT, "uri"))
+    assert store.get(source) is None
+
+
+def test_tracker_keeps_the_lookback_overlap_and_tracks_the_newest():
+    since = FetchWatermarkDTO(PUBLISHED_AT, "https://news.test/b")
+    tracker = WatermarkTracker(
+        since, AlphaVantageNewsFetcher.get_article_watermark, lookback_seconds=60
+    )
+    articles = [
+        alpha_vantage_article(
+            PUBLISHED_AT - timedelta(minutes=2), "https://news.test/old"
+        ),
+        # Cut off from the previous page within the watermark's second
+        alpha_vantage_article(PUBLISHED_AT, "https://news.test/a"),
+        alpha_vantage_article(PUBLISHED_AT, "https://news.test/b"),
+        alpha_vantage_article(
+            PUBLISHED_AT + timedelta(minutes=5), "https://news.test/d"
+        ),
+        # Indexed by the provider after the watermark had passed its publish time
+        alpha_vantage_article(
+            PUBLISHED_AT - timedelta(seconds=30), "https://news.test/late"
+        ),
+        {"url": "https://news.test/undated"},
+    ]
+
+    kept = [article["url"] for article in articles if tracker.is_new(article)]
+
+    assert tracker.fetch_from == PUBLISHED_AT - timedelta(minutes=1)
+    assert kept == [
+        "https://news.test/a",
+        "https://news.test/b",
+        "https://news.test/d",
+        "https://news.test/late",
+        "https://news.test/undated",
+    ]
+    assert tracker.newest == FetchWatermarkDTO(
+        PUBLISHED_AT + timedelta(minutes=5), "https://news.test/d"
+    )
+
+
+def test_event_registry_watermark_uses_publish_time_and_uri():
+    watermark = EventRegistryNewsFetcher.get_article_watermark(
+        {
+            "dateTimePub": "2026-10-16T09:30:15Z",
+            "dateTime": "2026-10-16T10:00:00Z",
+            "uri": "123",
+        }
+    )
+
+    assert watermark == FetchWatermarkDTO(PUBLISHED_AT, "123")
+    assert EventRegistryNewsFetcher.get_article_watermark({"uri": "123"}) is None
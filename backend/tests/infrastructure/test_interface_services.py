@@ -14,6 +14,19 @@ def test_openai_service_returns_stub_when_no_key(monkeypatch):
     assert out.get("summary")
 
 
+def test_openai_service_async_returns_stub_when_no_key(monkeypatch):
+    import asyncio
+
+    from config.settings import app_settings
+
+    monkeypatch.setattr(app_settings, "OPENAI_API_KEY", "")
+
+    svc = OpenAIServices()
+    out = asyncio.run(svc.get_chat_completion_async(user_prompt="hello"))
+    assert isinstance(out, dict)
+    assert out.get("input") == "hello"
+
+
 def test_email_service_noop_without_api_key(monkeypatch):
     from config.settings import app_settings
 
@@ -30,3 +43,21 @@ def test_email_service_noop_without_api_key(monkeypatch):
 
     asyncio.run(run())
     assert ok is True
+
+
+def test_openai_async_client_is_closed_with_its_loop(monkeypatch):
+    import asyncio
+
+    from config.settings import app_settings
+
+    monkeypatch.setattr(app_settings, "OPENAI_API_KEY", "sk-test")
+
+    async def run():
+        client, _ = OpenAIServices._get_async_client()
+        assert OpenAIServices._get_async_client()[0] is client
+        await OpenAIServices.close_async_client()
+        return client
+
+    client = asyncio.run(run())
+    assert client.is_closed()
+    assert len(OpenAIServices._async_clients) == 0
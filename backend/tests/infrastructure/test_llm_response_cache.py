@@ -0,0 +1,63 @@
+from src.infrastructure.llm.response_cache import LLMResponseCache
+
+
+def build_cache(**kwargs) -> LLMResponseCache:
+    options = {"max_entries": 2, "default_ttl": 60, "enabled": True, "redis_host": ""}
+    options.update(kwargs)
+    return LLMResponseCache(**options)
+
+
+def test_key_is_content_addressed():
+    key = LLMResponseCache.build_key("gpt-4o-mini", "system", "user")
+    assert key == LLMResponseCache.build_key("gpt-4o-mini", "system", "user")
+    assert key != LLMResponseCache.build_key("gpt-4o", "system", "user")
+    assert key != LLMResponseCache.build_key("gpt-4o-mini", "system", "other")
+
+
+def test_hits_misses_and_lru_eviction():
+    cache = build_cache()
+
+    assert cache.get("a") is None
+    cache.set("a", {"is_financial": True}, ttl=60)
+    cache.set("b", "text", ttl=60)
+    assert cache.get("a") == {"is_financial": True}
+
+    # "b" is now the least recently used entry and gets evicted
+    cache.set("c", "text", ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("c") == "text"
+
+    assert cache.stats["memory_hits"] == 2
+    assert cache.stats["misses"] == 2
+    assert cache.stats["entries"] == 2
+
+
+def test_expired_and_disabled_entries_are_not_served(monkeypatch):
+    cache = build_cache()
+    cache.set("a", "text", ttl=0)
+    assert cache.get("a") is None
+
+    now = 1000.0
+    monkeypatch.setattr(
+        "src.infrastructure.llm.response_cache.time.monotonic", lambda: now
+    )
+    cache.set("b", "text", ttl=10)
+    now = 1011.0
+    assert cache.get("b") is None
+
+    disabled = build_cache(enabled=False)
+    disabled.set("a", "text", ttl=60)
+    assert disabled.get("a") is None
+
+
+def test_redis_client_has_short_timeouts():
+    from config.settings import app_settings
+
+    cache = build_cache(redis_host="localhost")
+    connection_kwargs = cache._redis.connection_pool.connection_kwargs
+
+    assert connection_kwargs["socket_timeout"] == app_settings.REDIS_SOCKET_TIMEOUT_SECONDS
+    assert (
+        connection_kwargs["socket_connect_timeout"]
+        == app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS
+    )
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.news_fetcher import orchestrator
+from src.infrastructure.news_fetcher.orchestrator import MarketEventStagePublisher
+from src.infrastructure.news_fetcher.step_graph import PipelineStep, run_step_graph
+from src.schema.market_events import RunTimeMarketEventSchema
+from src.schema.utils import WebsocketMessageTypesEnum
+
+
+@pytest.mark.asyncio
+async def test_stages_finishing_out_of_order_are_published_in_version_order(
+    monkeypatch,
+):
+    published = []
+    # The first publish reaches Redis slowly, the next ones immediately
+    delays = [0.05]
+
+    async def publish_many_updates(messages):
+        await asyncio.sleep(delays.pop() if delays else 0)
+        published.extend(message.data for message in messages)
+
+    monkeypatch.setattr(orchestrator, "publish_many_updates", publish_many_updates)
+    publisher = MarketEventStagePublisher(
+        RunTimeMarketEventSchema(id="a", updated_at="t"), user_id=None
+    )
+    await publisher.publish({"title": "Fed holds rates"})
+
+    async def finish_after(delay, value):
+        await asyncio.sleep(delay)
+        return value
+
+    delays.append(0.05)
+    await run_step_graph(
+        [
+            # Finishes first, but its publish is still in flight when the next one starts
+            PipelineStep(
+                name="banner",
+                run=lambda _: finish_after(0, "Rates"),
+                on_complete=lambda banner: publisher.publish({"banner": banner}),
+            ),
+            PipelineStep(
+                name="analytics",
+                run=lambda _: finish_after(0.01, "HIGH"),
+                on_complete=lambda flag: publisher.publish(
+                    {"compliance_check": flag}, {"description": "d"}
+                ),
+            ),
+        ]
+    )
+
+    snapshot, *deltas = published
+    assert snapshot["version"] == 1
+    assert [(d["base_version"], d["version"]) for d in deltas] == [
+        (1, 2),
+        (2, 3),
+        (3, 4),
+    ]
+    assert [d["changes"] for d in deltas] == [
+        {"banner": "Rates"},
+        {"compliance_check": "HIGH"},
+        {"description": "d"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streamed_content_is_left_out_of_the_next_stage_update(monkeypatch):
+    published = []
+
+    async def publish_many_updates(messages):
+        published.extend((message.data_type, message.data) for message in messages)
+
+    async def publish_updates(data_type, data, user_id=None):
+        published.append((data_type, data))
+
+    monkeypatch.setattr(orchestrator, "publish_many_updates", publish_many_updates)
+    monkeypatch.setattr(orchestrator, "publish_updates", publish_updates)
+    publisher = MarketEventStagePublisher(
+        RunTimeMarketEventSchema(id="a", updated_at="t"), user_id=None
+    )
+    await publisher.publish({"title": "Fed holds rates"})
+
+    await publisher.publish_streamed_content(
+        field="deep_research_content", content="Rates hold. ", sequence=2
+    )
+    await publisher.publish(
+        {"deep_research_content": "Rates hold. ", "processing_status": "WRITING"}
+    )
+
+    _, (complete_type, complete), (_, stage) = published
+    assert complete_type == WebsocketMessageTypesEnum.MARKET_EVENT_CONTENT_COMPLETE
+    assert (complete["sequence"], complete["length"]) == (2, 12)
+    assert complete["content"] == "Rates hold. "
+    assert stage["changes"] == {"processing_status": "WRITING"}
+    assert publisher.runtime_market_event_dto.deep_research_content == "Rates hold. "
@@ -0,0 +1,141 @@
+from src.infrastructure.news_fetcher.news_fetcher_llm_services import (
+    NewsFetcherLLMService,
+)
+
+
+class FakeOpenAIServices:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get_chat_completion(self, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_batch_classification_is_aligned_by_index():
+    svc = NewsFetcherLLMService()
+    svc.openai_services = FakeOpenAIServices(
+        [
+            {
+                "results": [
+                    {"index": 1, "is_financial": False},
+                    {"index": 0, "is_financial": True},
+                ]
+            }
+        ]
+    )
+
+    out = svc.classify_financial_data_batch([{"title": "a"}, {"title": "b"}])
+
+    assert [c["is_financial"] for c in out] == [True, False]
+    assert svc.openai_services.calls == 1
+
+
+def test_batch_classification_falls_back_to_single_calls():
+    svc = NewsFetcherLLMService()
+    svc.openai_services = FakeOpenAIServices(
+        [
+            {"results": [{"index": 0, "is_financial": True}]},  # index 1 missing
+            {"is_financial": True},
+            {"is_financial": False},
+        ]
+    )
+
+    out = svc.classify_financial_data_batch([{"title": "a"}, {"title": "b"}])
+
+    assert [c["is_financial"] for c in out] == [True, False]
+    assert svc.openai_services.calls == 3
+
+
+def test_combined_analytics_are_validated_and_fall_back_per_field():
+    import asyncio
+
+    from src.infrastructure.news_fetcher.news_pipeline import NewsPipeline
+
+    class FakeLLMService:
+        def __init__(self, analytics):
+            self.analytics = analytics
+            self.individual_calls = 0
+
+        async def fetch_market_event_analytics(self, article):
+            return self.analytics
+
+        async def fetch_sentimental_analysis(self, article):
+            self.individual_calls += 1
+            return "NEGATIVE"
+
+        async def fetch_priority_flag(self, article):
+            self.individual_calls += 1
+            return "LOW"
+
+        async def fetch_compliance_check(self, article):
+            self.individual_calls += 1
+            return "OK"
+
+    pipeline = NewsPipeline()
+
+    pipeline.news_fetcher_llm_services = FakeLLMService(
+        {"sentimental_analysis": "positive", "priority_flag": "HIGH", "compliance_check": "OK"}
+    )
+    out = asyncio.run(pipeline.fetch_market_event_analytics({"title": "t"}))
+    assert out["sentimental_analysis"] == "POSITIVE"
+    assert pipeline.news_fetcher_llm_services.individual_calls == 0
+
+    pipeline.news_fetcher_llm_services = FakeLLMService("not json")
+    out = asyncio.run(pipeline.fetch_market_event_analytics({"title": "t"}))
+    assert out["sentimental_analysis"] == "NEGATIVE"
+    assert out["priority_flag"] == "LOW"
+    assert pipeline.news_fetcher_llm_services.individual_calls == 3
+
+
+def test_malformed_combined_analytics_fall_back_per_field():
+    import asyncio
+
+    from src.infrastructure.llm.openai_service import OpenAIServices
+    from src.infrastructure.news_fetcher.news_pipeline import NewsPipeline
+
+    class FakeLLMService:
+        async def fetch_market_event_analytics(self, article):
+            # What the completion parser does with a truncated JSON answer
+            return OpenAIServices._parse_content("{bad")
+
+        async def fetch_sentimental_analysis(self, article):
+            return "POSITIVE"
+
+        async def fetch_priority_flag(self, article):
+            return "HIGH"
+
+        async def fetch_compliance_check(self, article):
+            return "OK"
+
+    pipeline = NewsPipeline()
+    pipeline.news_fetcher_llm_services = FakeLLMService()
+
+    out = asyncio.run(pipeline.fetch_market_event_analytics({"title": "t"}))
+
+    assert out["sentimental_analysis"] == "POSITIVE"
+    assert out["priority_flag"] == "HIGH"
+    assert out["compliance_check"] == "OK"
+
+
+def test_failing_single_classification_does_not_abort_the_batch():
+    class FailingOpenAIServices(FakeOpenAIServices):
+        def get_chat_completion(self, **kwargs):
+            response = super().get_chat_completion(**kwargs)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    svc = NewsFetcherLLMService()
+    svc.openai_services = FailingOpenAIServices(
+        [
+            "not json",
+            RuntimeError("rate limited"),
+            {"is_financial": True},
+        ]
+    )
+
+    out = svc.classify_financial_data_batch([{"title": "a"}, {"title": "b"}])
+
+    assert out == [{}, {"is_financial": True}]
@@ -0,0 +1,218 @@
+import asyncio
+import os
+import uuid
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from config.settings import app_settings
+from src.infrastructure import rate_limiter as rate_limiter_module
+from src.infrastructure.llm import openai_service
+from src.infrastructure.llm.openai_service import OpenAIServices
+from src.infrastructure.rate_limiter import (
+    TokenBucketRateLimiter,
+    get_backoff_delay,
+    send_with_rate_limit,
+)
+from src.schema.utils import RateLimitBudgetDTO, RateLimitedProviderEnum
+
+TEST_REDIS_HOST = os.getenv("TEST_REDIS_HOST")
+
+
+@pytest.fixture(autouse=True)
+def backoff(monkeypatch):
+    monkeypatch.setattr(app_settings, "RATE_LIMIT_MAX_RETRIES", 2)
+    monkeypatch.setattr(app_settings, "RATE_LIMIT_BACKOFF_BASE_SECONDS", 1.0)
+    monkeypatch.setattr(app_settings, "RATE_LIMIT_BACKOFF_MAX_SECONDS", 8.0)
+
+
+def test_backoff_is_jittered_and_bounded():
+    delays = [get_backoff_delay(attempt=10) for _ in range(200)]
+
+    assert all(0 <= delay <= 9.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert 30 <= get_backoff_delay(attempt=0, retry_after=30) <= 31
+
+
+def test_acquire_waits_for_the_time_returned_by_the_bucket(monkeypatch):
+    limiter = TokenBucketRateLimiter(redis_host="")
+    calls = []
+    replies = iter([1500, 0])
+
+    def take(keys, args):
+        calls.append((keys, args))
+        return next(replies)
+
+    sleeps = []
+    monkeypatch.setattr(limiter, "_take", take)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", sleeps.append)
+    monkeypatch.setitem(
+        rate_limiter_module.PROVIDER_BUDGETS,
+        RateLimitedProviderEnum.OPENAI,
+        RateLimitBudgetDTO(requests_per_minute=60, tokens_per_minute=1000),
+    )
+
+    limiter.acquire(RateLimitedProviderEnum.OPENAI, "gpt-4o-mini", tokens=5000)
+
+    assert calls[0] == (["rate_limit:openai:gpt-4o-mini"], [60, 1000, 1, 1000, 0])
+    assert len(calls) == 2
+    assert 1.5 <= sleeps[0] <= 1.65
+
+
+def test_limiter_without_redis_lets_calls_through():
+    limiter = TokenBucketRateLimiter(redis_host="")
+
+    limiter.acquire(RateLimitedProviderEnum.EVENT_REGISTRY)
+    limiter.record_tokens(RateLimitedProviderEnum.OPENAI, "gpt-4o-mini", 100)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_http_requests_are_retried(monkeypatch):
+    statuses = iter([429, 429, 200])
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        return httpx.Response(
+            status, headers={"Retry-After": "2"} if status == 429 else {}
+        )
+
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", sleep)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        response = await send_with_rate_limit(
+            RateLimitedProviderEnum.EVENT_REGISTRY,
+            lambda: client.get("https://news.test/articles"),
+        )
+
+    assert response.status_code == 200
+    assert len(sleeps) == 2
+    assert all(2 <= delay <= 3 for delay in sleeps)
+
+
+def test_openai_rate_limit_errors_are_retried(monkeypatch):
+    monkeypatch.setattr(app_settings, "OPENAI_API_KEY", "sk-test")
+    sleeps = []
+    monkeypatch.setattr(openai_service.time, "sleep", sleeps.append)
+
+    request = httpx.Request("POST", "https://api.openai.test/v1/chat/completions")
+    attempts = []
+
+    def create(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise RateLimitError(
+                "rate limited",
+                response=httpx.Response(429, request=request),
+                body=None,
+            )
+        return SimpleNamespace(usage=None)
+
+    services = OpenAIServices()
+    services.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+    services._create_chat_completion(
+        model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+    )
+    assert len(attempts) == 3
+    assert len(sleeps) == 2
+
+    attempts.clear()
+    monkeypatch.setattr(app_settings, "RATE_LIMIT_MAX_RETRIES", 1)
+    with pytest.raises(RateLimitError):
+        services._create_chat_completion(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+
+
+def test_openai_clients_leave_retries_to_the_rate_limiter(monkeypatch):
+    monkeypatch.setattr(app_settings, "OPENAI_API_KEY", "sk-test")
+
+    async def get_async_client():
+        async_client, _ = OpenAIServices._get_async_client()
+        await OpenAIServices.close_async_client()
+        return async_client
+
+    assert OpenAIServices().client.max_retries == 0
+    assert asyncio.run(get_async_client()).max_retries == 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_completion_settles_its_reported_usage(monkeypatch):
+    monkeypatch.setattr(app_settings, "OPENAI_API_KEY", "sk-test")
+    recorded = []
+
+    async def record_tokens_async(provider, model, tokens):
+        recorded.append(tokens)
+
+    monkeypatch.setattr(
+        openai_service.rate_limiter, "record_tokens_async", record_tokens_async
+    )
+
+    def chunk(content=None, usage=None):
+        choices = [SimpleNamespace(delta=SimpleNamespace(content=content))]
+        return SimpleNamespace(choices=choices if content else [], usage=usage)
+
+    async def stream():
+        yield chunk("Rates ")
+        yield chunk("hold")
+        yield chunk(usage=SimpleNamespace(total_tokens=1000))
+
+    requests = []
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        return stream()
+
+    async_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    monkeypatch.setattr(
+        OpenAIServices,
+        "_get_async_client",
+        classmethod(lambda cls: (async_client, asyncio.Semaphore(1))),
+    )
+
+    services = OpenAIServices()
+    deltas = [
+        delta
+        async for delta in services.stream_chat_completion_async(
+            "hi", model="gpt-4o-mini", cache_ttl=0
+        )
+    ]
+
+    assert deltas == ["Rates ", "hold"]
+    assert requests[0]["stream_options"] == {"include_usage": True}
+    estimated_tokens = OpenAIServices._estimate_tokens(
+        [{"role": "user", "content": "hi"}]
+    )
+    assert recorded == [1000 - estimated_tokens]
+
+
+@pytest.mark.skipif(
+    not TEST_REDIS_HOST, reason="TEST_REDIS_HOST must point at a disposable Redis"
+)
+def test_bucket_is_shared_and_refills_against_redis(monkeypatch):
+    model = f"test-{uuid.uuid4()}"
+    monkeypatch.setitem(
+        rate_limiter_module.PROVIDER_BUDGETS,
+        RateLimitedProviderEnum.OPENAI,
+        RateLimitBudgetDTO(requests_per_minute=2, tokens_per_minute=600),
+    )
+    workers = [TokenBucketRateLimiter(redis_host=TEST_REDIS_HOST) for _ in range(2)]
+
+    assert workers[0]._try_take(RateLimitedProviderEnum.OPENAI, model, 1, 100) == 0
+    assert workers[1]._try_take(RateLimitedProviderEnum.OPENAI, model, 1, 100) == 0
+    # Both requests of the minute are taken: one refills every 30 seconds
+    assert 29 < workers[0]._try_take(RateLimitedProviderEnum.OPENAI, model, 1, 0) <= 30
+
+    workers[1].record_tokens(RateLimitedProviderEnum.OPENAI, model, 400)
+    # 600 - 100 - 100 - 400 leaves nothing; 100 tokens refill in 10 seconds
+    wait = workers[0]._try_take(RateLimitedProviderEnum.OPENAI, model, 0, 100)
+    assert 9 < wait <= 10
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+
+from src.infrastructure.websockets import redis_listener as listener_module
+from src.infrastructure.utils import get_current_timestamp_with_timezone
+
+
+class FakeConnectionManager:
+    def __init__(self):
+        self.broadcasts = []
+        self.personal = []
+
+    async def broadcast(self, data):
+        self.broadcasts.append(data)
+
+    async def send_personal_message(self, user_id, data):
+        self.personal.append((user_id, data))
+
+
+class FakePubSub:
+    def __init__(self, messages, fail):
+        self.messages = messages
+        self.fail = fail
+        self.closed = False
+
+    async def psubscribe(self, *patterns):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()  # block like a real idle subscription
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self, pubsub):
+        self._pubsub = pubsub
+
+    def pubsub(self):
+        return self._pubsub
+
+    async def aclose(self):
+        pass
+
+
+def pmessage(channel, data):
+    return {"type": "pmessage", "channel": channel, "data": json.dumps(data)}
+
+
+@pytest.mark.asyncio
+async def test_dispatch_routes_messages_and_records_lag():
+    manager = FakeConnectionManager()
+    payload = {"live_events": {"id": "1", "updated_at": get_current_timestamp_with_timezone()}}
+
+    await listener_module.dispatch_message(pmessage("public_channel", payload), manager)
+    await listener_module.dispatch_message(pmessage("user_channel_u1", payload), manager)
+
+    assert manager.broadcasts == [payload]
+    assert manager.personal == [("u1", payload)]
+    snapshot = listener_module.listener_metrics.snapshot()
+    assert snapshot["messages_received"] >= 2
+    assert 0 <= snapshot["last_lag_seconds"] < 5
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects_and_stops_on_cancel(monkeypatch):
+    manager = FakeConnectionManager()
+    pubsubs = [
+        FakePubSub([], fail=True),
+        FakePubSub([pmessage("public_channel", {"live_events": {"id": "1"}})], fail=False),
+    ]
+
+    async def fake_connection():
+        return FakeRedis(pubsubs.pop(0))
+
+    monkeypatch.setattr(listener_module, "get_redis_connection", fake_connection)
+    monkeypatch.setattr(listener_module, "ConnectionManager", lambda: manager)
+    monkeypatch.setattr(
+        listener_module.app_settings, "REDIS_LISTENER_RECONNECT_MIN_SECONDS", 0.01
+    )
+
+    task = asyncio.create_task(listener_module.redis_listener())
+    for _ in range(100):
+        if manager.broadcasts:
+            break
+        await asyncio.sleep(0.01)
+
+    assert manager.broadcasts == [{"live_events": {"id": "1"}}]
+    assert listener_module.listener_metrics.connected is True
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert listener_module.listener_metrics.connected is False
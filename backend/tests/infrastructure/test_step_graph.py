@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.news_fetcher.step_graph import PipelineStep, run_step_graph
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently_and_dependencies_wait():
+    completed = []
+
+    async def slow(value):
+        await asyncio.sleep(0.05)
+        return value
+
+    async def on_complete(result):
+        completed.append(result)
+
+    steps = [
+        PipelineStep(name="a", run=lambda _: slow("a"), on_complete=on_complete),
+        PipelineStep(name="b", run=lambda _: slow("b"), on_complete=on_complete),
+        PipelineStep(
+            name="c",
+            run=lambda deps: slow(deps["a"] + "c"),
+            depends_on=("a",),
+            on_complete=on_complete,
+        ),
+    ]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await run_step_graph(steps)
+    elapsed = loop.time() - started
+
+    assert results == {"a": "a", "b": "b", "c": "ac"}
+    assert completed[-1] == "ac"
+    # Two levels of 50ms each, not three sequential steps
+    assert elapsed < 0.14
+
+
+@pytest.mark.asyncio
+async def test_failing_step_cancels_the_rest():
+    cancelled = asyncio.Event()
+
+    async def fail(_):
+        raise RuntimeError("boom")
+
+    async def wait_forever(_):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RuntimeError):
+        await run_step_graph(
+            [
+                PipelineStep(name="fail", run=fail),
+                PipelineStep(name="wait", run=wait_forever),
+            ]
+        )
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_cycles_and_unknown_dependencies_are_rejected():
+    async def noop(_):
+        return None
+
+    with pytest.raises(ValueError):
+        await run_step_graph([PipelineStep(name="a", run=noop, depends_on=("x",))])
+
+    with pytest.raises(ValueError):
+        await run_step_graph(
+            [
+                PipelineStep(name="a", run=noop, depends_on=("b",)),
+                PipelineStep(name="b", run=noop, depends_on=("a",)),
+            ]
+        )
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.utils import batch_text_stream
+
+
+async def fake_stream(pieces_with_delays):
+    for piece, delay in pieces_with_delays:
+        await asyncio.sleep(delay)
+        yield piece
+
+
+@pytest.mark.asyncio
+async def test_pieces_within_a_window_are_merged():
+    stream = fake_stream([("a", 0), ("b", 0), ("c", 0), ("d", 0.1), ("e", 0)])
+
+    batches = [batch async for batch in batch_text_stream(stream, interval=0.05)]
+
+    assert "".join(batches) == "abcde"
+    assert batches[0] == "abc"
+
+
+@pytest.mark.asyncio
+async def test_pending_text_is_flushed_while_the_source_stalls():
+    stream = fake_stream([("a", 0), ("b", 0.3)])
+    received = []
+
+    async def consume():
+        async for batch in batch_text_stream(stream, interval=0.05):
+            received.append(batch)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.15)
+    assert received == ["a"]
+    await task
+    assert received == ["a", "b"]
@@ -0,0 +1,60 @@
+import pytest
+
+from config.db_connection import db_service
+
+
+class FakeSession:
+    def __init__(self):
+        self.rolled_back = False
+        self.closed = False
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeAsyncSession:
+    def __init__(self):
+        self.rolled_back = False
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+def test_session_scope_closes_and_rolls_back_on_failure(monkeypatch):
+    sessions = []
+
+    def session_factory():
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    monkeypatch.setattr(db_service, "session_factory", session_factory)
+
+    with db_service.session_scope() as session:
+        pass
+    assert session.closed and not session.rolled_back
+
+    with pytest.raises(RuntimeError):
+        with db_service.session_scope():
+            raise RuntimeError("boom")
+    assert sessions[-1].closed and sessions[-1].rolled_back
+
+
+@pytest.mark.asyncio
+async def test_async_session_scope_reuses_request_session():
+    request_session = FakeAsyncSession()
+
+    async with db_service.async_session_scope(request_session) as session:
+        assert session is request_session
+
+    with pytest.raises(RuntimeError):
+        async with db_service.async_session_scope(request_session):
+            raise RuntimeError("boom")
+    assert request_session.rolled_back
+
+
+def test_engines_use_configured_pools():
+    assert db_service.engine.pool.size() == db_service.async_engine.pool.size()
+    assert db_service.async_engine.dialect.driver == "asyncpg"